@@ -0,0 +1,127 @@
+"""
+Бенчмарк адаптивного ограничителя параллельности против FakeRestfulBooker с всплесками задержки.
+
+API моделируется как сервер с capacity обработчиками и очередью queue_limit запросов:
+лишние запросы ждут в очереди, а при переполнении очереди сразу получают 503. Раз в
+spike_every секунд на spike_for секунд время обработки растёт в spike_factor раз.
+Одинаковое число потоков гоняет GET /booking/{id} с фиксированной параллельностью и
+через AdaptiveConcurrencyLimiter; сравниваются успешные ответы в секунду, доля 503
+и перцентили задержки успешных ответов. Задержка измеряется в потоке и включает ожидание
+слота ограничителя, поэтому хвост AIMD отражает очередь на стороне клиента, а не сервера.
+
+Запуск:
+    python -m benchmarks.bench_adaptive_concurrency --threads 64 --capacity 8 --duration 6
+"""
+import argparse
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import httpx
+
+from src.api.client import BookerClient
+from src.api.resilience import AdaptiveConcurrencyLimiter
+from src.api.routes import Routes
+from src.fake.restful_booker import OFFLINE_BASE_URL, FakeRestfulBooker
+from src.load.histogram import LatencyHistogram
+
+
+class SaturatedBackend(httpx.BaseTransport):
+    """
+    Транспорт, ограничивающий FakeRestfulBooker capacity одновременными обработчиками и очередью.
+    """
+
+    def __init__(self, fake: FakeRestfulBooker, capacity: int, queue_limit: int):
+        self.fake = fake
+        self.queue_limit = queue_limit
+        self._workers = threading.Semaphore(capacity)
+        self._lock = threading.Lock()
+        self._waiting = 0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            if self._waiting >= self.queue_limit:
+                return httpx.Response(503, text="Service Unavailable")
+            self._waiting += 1
+        with self._workers:
+            with self._lock:
+                self._waiting -= 1
+            return self.fake.handle_request(request)
+
+
+def spiky_latency(service: float, spike_every: float, spike_for: float, spike_factor: float):
+    origin = time.monotonic()
+
+    def latency(rng) -> float:
+        in_spike = (time.monotonic() - origin) % spike_every < spike_for
+        return service * (spike_factor if in_spike else 1.0) * rng.uniform(0.8, 1.2)
+
+    return latency
+
+
+def run(args, limiter: Optional[AdaptiveConcurrencyLimiter]) -> dict:
+    fake = FakeRestfulBooker(dataset_size=args.dataset,
+                             latency=spiky_latency(args.service, args.spike_every, args.spike_for, args.spike_factor))
+    client = BookerClient(OFFLINE_BASE_URL, transport=SaturatedBackend(fake, args.capacity, args.queue),
+                          warmup_connections=0, concurrency_limiter=limiter)
+    histogram, errors, lock = LatencyHistogram(), [0], threading.Lock()
+    deadline = time.perf_counter() + args.duration
+
+    def worker(index: int) -> None:
+        booking_id = index % args.dataset + 1
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                client.get_booking(Routes.booking_by_id(booking_id))
+            except RuntimeError:
+                with lock:
+                    errors[0] += 1
+                continue
+            with lock:
+                histogram.record(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as executor:
+        list(executor.map(worker, range(args.threads)))
+    elapsed = time.perf_counter() - started
+    client.close()
+    summary = histogram.summary()
+    return {
+        "ok_per_second": histogram.count / elapsed,
+        "error_share": errors[0] / max(1, errors[0] + histogram.count),
+        "p50_ms": summary["p50_ms"],
+        "p99_ms": summary["p99_ms"],
+        "limiter": limiter.snapshot() if limiter is not None else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=64)
+    parser.add_argument("--capacity", type=int, default=8)
+    parser.add_argument("--queue", type=int, default=16)
+    parser.add_argument("--service", type=float, default=0.005)
+    parser.add_argument("--spike-every", type=float, default=2.0)
+    parser.add_argument("--spike-for", type=float, default=0.5)
+    parser.add_argument("--spike-factor", type=float, default=5.0)
+    parser.add_argument("--duration", type=float, default=6.0)
+    parser.add_argument("--dataset", type=int, default=100)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    results = {
+        "фиксированная": run(args, None),
+        "AIMD": run(args, AdaptiveConcurrencyLimiter(initial_limit=args.capacity, max_limit=args.threads)),
+    }
+    print(f"{'вариант':<16}{'ok/с':>10}{'503, %':>10}{'p50, мс':>10}{'p99, мс':>10}")
+    for name, result in results.items():
+        print(f"{name:<16}{result['ok_per_second']:>10,.0f}{result['error_share'] * 100:>10.1f}"
+              f"{result['p50_ms']:>10.1f}{result['p99_ms']:>10.1f}")
+    snapshot = results["AIMD"]["limiter"]
+    print(f"Итоговый лимит AIMD: {snapshot['limit']}, решения: {snapshot['decisions']}")
+
+
+if __name__ == "__main__":
+    main()
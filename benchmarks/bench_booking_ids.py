@@ -0,0 +1,65 @@
+"""
+Бенчмарк хранения ID бронирований из ответа GET /booking.
+
+Сравнивает list[BookingItem] (однопроходная валидация через TypeAdapter), BookingIdSet.from_json
+и потоковый BookingIdStreamParser, которому тело передаётся фрагментами. Для каждого варианта
+tracemalloc показывает объём, удерживаемый результатом, и пик памяти во время разбора.
+
+Запуск:
+    python -m benchmarks.bench_booking_ids --items 100000
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+from src.api.booking_ids import BookingIdSet, BookingIdStreamParser
+from src.api.decoding import BookingItemList, decode_json
+
+
+def booking_items(content: bytes):
+    return decode_json(content, BookingItemList)
+
+
+def id_set(content: bytes):
+    return BookingIdSet.from_json(content)
+
+
+def streamed(content: bytes, chunk_size: int = 64 * 1024):
+    parser = BookingIdStreamParser()
+    ids = []
+    for offset in range(0, len(content), chunk_size):
+        ids.extend(parser.feed(content[offset:offset + chunk_size]))
+    parser.close()
+    return BookingIdSet(ids)
+
+
+def measure(decoder, content: bytes) -> tuple[float, float, float]:
+    started = time.process_time()
+    decoder(content)
+    cpu_ms = (time.process_time() - started) * 1000
+
+    tracemalloc.start()
+    result = decoder(content)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return cpu_ms, retained / 1024 / 1024, peak / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100_000)
+    args = parser.parse_args()
+
+    content = json.dumps([{"bookingid": i} for i in range(1, args.items + 1)]).encode()
+    print(f"/booking: {args.items} элементов, {len(content) / 1024:.0f} KiB")
+    print(f"{'вариант':<20}{'CPU, мс':>10}{'удержано, MiB':>16}{'пик, MiB':>12}")
+    for name, decoder in (("list[BookingItem]", booking_items), ("BookingIdSet", id_set),
+                          ("поток + IdSet", streamed)):
+        cpu_ms, retained_mib, peak_mib = measure(decoder, content)
+        print(f"{name:<20}{cpu_ms:>10.1f}{retained_mib:>16.1f}{peak_mib:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#benchmarks/bench_decoding.py
+"""
+Микробенчмарк декодирования ответа GET /booking.
+
+Сравнивает прежний путь (response.json() дважды + цикл model_validate по элементам)
+с однопроходной валидацией байтов через закэшированный TypeAdapter.
+
+Запуск:
+    python -m benchmarks.bench_decoding --items 100000 --repeat 5
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+from src.api.decoding import BookingItemList, decode_json
+from src.api.models import BookingItem
+
+
+def legacy_decode(content: bytes):
+    data = json.loads(content)
+    if isinstance(data, dict) and "reason" in data:
+        raise RuntimeError(data["reason"])
+    return [BookingItem.model_validate(item, by_alias=True) for item in json.loads(content)]
+
+
+def fast_decode(content: bytes):
+    return decode_json(content, BookingItemList)
+
+
+def measure(decoder, content: bytes, repeat: int) -> tuple[float, float]:
+    decoder(content)
+    started = time.process_time()
+    for _ in range(repeat):
+        decoder(content)
+    cpu_ms = (time.process_time() - started) / repeat * 1000
+
+    tracemalloc.start()
+    decoder(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return cpu_ms, peak / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    content = json.dumps([{"bookingid": i} for i in range(1, args.items + 1)]).encode()
+    print(f"/booking: {args.items} элементов, {len(content) / 1024:.0f} KiB")
+    print(f"{'вариант':<10}{'CPU, мс/ответ':>16}{'пик памяти, MiB':>18}")
+    for name, decoder in (("legacy", legacy_decode), ("fast", fast_decode)):
+        cpu_ms, peak_mib = measure(decoder, content, args.repeat)
+        print(f"{name:<10}{cpu_ms:>16.1f}{peak_mib:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
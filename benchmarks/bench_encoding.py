@@ -0,0 +1,86 @@
+"""
+Бенчмарк кодирования тел запросов POST /booking и PUT /booking/{id}.
+
+Сравнивает прежний путь (model_dump_json и новый словарь заголовков на каждый запрос),
+передачу модели Booking и передачу тела, сериализованного encode_booking один раз.
+Запросы выполняются BookerClient через FakeRestfulBooker в памяти, поэтому видна
+именно клиентская стоимость; отдельно выводится время одного кодирования. Варианты
+чередуются по раундам, в таблицу попадает лучший раунд каждого варианта.
+
+Запуск:
+    python -m benchmarks.bench_encoding --requests 20000 --rounds 5
+"""
+import argparse
+import time
+
+from src.api.client import BookerClient
+from src.api.encoding import encode_booking
+from src.api.models import Booking, BookingResponse
+from src.api.routes import Routes
+from src.fake.restful_booker import OFFLINE_BASE_URL, FakeRestfulBooker
+
+BOOKING = {
+    "firstname": "Bench",
+    "lastname": "Encoding",
+    "totalprice": 150,
+    "depositpaid": True,
+    "bookingdates": {"checkin": "2025-06-01", "checkout": "2025-06-10"},
+    "additionalneeds": "Breakfast",
+}
+
+
+def legacy_create(client: BookerClient, booking: Booking) -> BookingResponse:
+    headers = {"Content-Type": "application/json"}
+    response = client._request("POST", Routes.BOOKING, content=booking.model_dump_json(by_alias=True),
+                               headers=headers)
+    return client._handle_response(response, BookingResponse)
+
+
+def rate(operation, count: int) -> float:
+    operation(0)
+    started = time.perf_counter()
+    for index in range(count):
+        operation(index)
+    return count / (time.perf_counter() - started)
+
+
+def encode_us(encode, count: int) -> float:
+    started = time.perf_counter()
+    for index in range(count):
+        encode(index)
+    return (time.perf_counter() - started) / count * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20_000, help="запросов на вариант за все раунды")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    per_round = max(1, args.requests // args.rounds)
+
+    booking = Booking.model_validate(BOOKING)
+    body = encode_booking(booking)
+    variants = (
+        ("legacy", lambda client, i: legacy_create(client, booking),
+         lambda i: booking.model_dump_json(by_alias=True)),
+        ("booking", lambda client, i: client.create_booking(booking, Routes.BOOKING),
+         lambda i: encode_booking(booking)),
+        ("bytes", lambda client, i: client.create_booking(body, Routes.BOOKING),
+         lambda i: encode_booking(body)),
+    )
+    best = {name: 0.0 for name, _, _ in variants}
+    for _ in range(args.rounds):
+        for name, create, _ in variants:
+            client = BookerClient(OFFLINE_BASE_URL, transport=FakeRestfulBooker(dataset_size=0))
+            best[name] = max(best[name], rate(lambda i: create(client, i), per_round))
+            client.close()
+
+    print(f"{'вариант':<10}{'запросов/с':>14}{'к legacy':>10}{'кодирование, мкс':>20}")
+    baseline = best["legacy"]
+    for name, _, encode in variants:
+        print(f"{name:<10}{best[name]:>14,.0f}{best[name] / baseline - 1:>+10.1%}"
+              f"{encode_us(encode, args.requests):>20.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Бенчмарк генерации тел POST /booking для нагрузочных прогонов.
+
+Сравнивает BookingFactory (столбцы NumPy и готовые JSON фрагменты) с построением модели
+Booking и model_dump_json на каждую строку. Требуется NumPy.
+
+Запуск:
+    python -m benchmarks.bench_generator --rows 1000000 --batch 100000
+"""
+import argparse
+import random
+import time
+
+from src.api.models import Booking
+from src.load.generator import FIRST_NAMES, LAST_NAMES, BookingFactory
+
+
+def pydantic_rows(count: int, seed: int) -> None:
+    rng = random.Random(seed)
+    for _ in range(count):
+        day = rng.randrange(1, 28)
+        Booking.model_validate({
+            "firstname": rng.choice(FIRST_NAMES),
+            "lastname": rng.choice(LAST_NAMES),
+            "totalprice": rng.randint(0, 1000),
+            "depositpaid": rng.random() < 0.5,
+            "bookingdates": {"checkin": f"2025-06-{day:02d}", "checkout": f"2025-06-{day + 1:02d}"},
+        }).model_dump_json(by_alias=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=100_000)
+    args = parser.parse_args()
+
+    factory = BookingFactory(seed=0)
+    started = time.perf_counter()
+    generated = 0
+    while generated < args.rows:
+        generated += len(factory.batch(min(args.batch, args.rows - generated)))
+    factory_rate = generated / (time.perf_counter() - started)
+
+    sample = max(1, args.rows // 10)
+    started = time.perf_counter()
+    pydantic_rows(sample, 0)
+    pydantic_rate = sample / (time.perf_counter() - started)
+
+    print(f"{'вариант':<16}{'строк/с':>14}")
+    print(f"{'BookingFactory':<16}{factory_rate:>14,.0f}")
+    print(f"{'Booking + dump':<16}{pydantic_rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
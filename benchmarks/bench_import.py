@@ -0,0 +1,143 @@
+"""
+Бенчмарк времени импорта модулей клиента (python -X importtime).
+
+Каждый модуль импортируется в отдельном процессе несколько раз, в отчёт попадают
+минимальное суммарное время и самые дорогие вложенные импорты. Бюджет задан не в
+миллисекундах, а относительно зависимостей: в том же процессе сначала импортируются
+BASELINE_MODULES (httpx и pydantic), затем модуль, и время, добавленное самим модулем,
+делится на время импорта зависимостей. Отношение почти не зависит от скорости машины.
+Скрипт завершается с кодом 1, если отношение превышает IMPORT_BUDGET или импорт загрузил
+модули из LAZY_MODULES; то же проверяет tests/test_import_time.py.
+
+Запуск:
+    python -m benchmarks.bench_import --runs 5
+"""
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Зависимости, с временем импорта которых сравнивается собственное время модуля.
+BASELINE_MODULES = ("httpx", "pydantic", "pydantic.main")
+
+# Наибольшее отношение собственного времени импорта модуля к времени BASELINE_MODULES.
+# Медиана с ленивой загрузкой настроек и allure — около 0.48, без неё — около 0.85.
+IMPORT_BUDGET: Dict[str, float] = {
+    "src.api.client": 0.65,
+}
+
+# Модули, которые не должны загружаться при импорте клиента: настройки читаются при первом
+# создании клиента, allure нужен только для вложений, asyncio — только асинхронному клиенту.
+LAZY_MODULES = ("dotenv", "pydantic_settings", "allure", "asyncio")
+
+
+def _env() -> dict:
+    env = {name: value for name, value in os.environ.items() if name not in ("BASE_URL", "USER_NAME", "PASSWORD")}
+    env["PYTHONPATH"] = str(ROOT)
+    return env
+
+
+def import_profile(module: str, preload: Sequence[str] = ()) -> List[Tuple[int, int, str]]:
+    """
+    Импортирует модуль в новом процессе с -X importtime.
+
+    Args:
+        module (str): Имя модуля.
+        preload (Sequence[str]): Модули, импортируемые в том же процессе перед module.
+
+    Returns:
+        List[Tuple[int, int, str]]: Собственное и суммарное время в микросекундах и имя каждого импорта.
+
+    Raises:
+        RuntimeError: Если импорт завершился ошибкой.
+    """
+    code = "".join(f"import {name}; " for name in preload) + f"import {module}"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, env=_env(), capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Импорт {module} завершился ошибкой:\n{result.stderr}")
+    profile = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        profile.append((int(own), int(cumulative), name.rstrip()))
+    return profile
+
+
+def import_time_ms(module: str, runs: int = 3) -> float:
+    """
+    Возвращает минимальное из runs измерений суммарного времени импорта модуля в миллисекундах.
+    """
+    return min(
+        next(cumulative for _, cumulative, name in import_profile(module) if name.strip() == module)
+        for _ in range(runs)
+    ) / 1000
+
+
+def import_ratio(module: str, runs: int = 5) -> Tuple[float, float, float]:
+    """
+    Измеряет время, добавленное импортом модуля после BASELINE_MODULES в том же процессе.
+
+    Args:
+        module (str): Имя модуля.
+        runs (int): Число измерений; возвращается измерение с медианным отношением.
+
+    Returns:
+        Tuple[float, float, float]: Время модуля и BASELINE_MODULES в миллисекундах и их отношение.
+    """
+    measurements = []
+    for _ in range(runs):
+        # Верхний уровень -X importtime — модули, импортированные самой командой, а не вложенные.
+        top_level = {}
+        for _, cumulative, name in import_profile(module, BASELINE_MODULES):
+            if not name[1:].startswith(" "):
+                top_level.setdefault(name.strip(), cumulative)
+        own = top_level[module] / 1000
+        baseline = sum(top_level.get(name, 0) for name in BASELINE_MODULES) / 1000
+        measurements.append((own, baseline, own / baseline))
+    # Медиана устойчивее минимума: отдельные прогоны с прогретым кэшем ФС занижают отношение.
+    return sorted(measurements, key=lambda measurement: measurement[2])[len(measurements) // 2]
+
+
+def loaded_modules(module: str) -> List[str]:
+    """
+    Возвращает модули из LAZY_MODULES, загруженные импортом module.
+    """
+    code = f"import sys, {module}; print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=_env(), capture_output=True, text=True,
+                            check=True)
+    return [name for name in result.stdout.strip().split(",") if name]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="сколько самых дорогих импортов показать")
+    args = parser.parse_args()
+
+    failed = False
+    for module, budget in IMPORT_BUDGET.items():
+        elapsed = import_time_ms(module, args.runs)
+        own, baseline, ratio = import_ratio(module, args.runs)
+        lazy = loaded_modules(module)
+        status = "OK" if ratio <= budget and not lazy else "ПРЕВЫШЕН"
+        failed = failed or status != "OK"
+        print(f"{module}: {elapsed:.1f} мс; после {', '.join(BASELINE_MODULES)} ({baseline:.1f} мс) "
+              f"{own:.1f} мс, отношение {ratio:.2f} (бюджет {budget:.2f}) {status}")
+        if lazy:
+            print(f"  загружены при импорте: {', '.join(lazy)}")
+        print(f"  {'собств., мс':>12}{'сумм., мс':>12}  модуль")
+        for own, cumulative, name in sorted(import_profile(module), key=lambda row: -row[0])[:args.top]:
+            print(f"  {own / 1000:>12.1f}{cumulative / 1000:>12.1f}  {name.strip()}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
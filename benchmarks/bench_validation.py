@@ -0,0 +1,54 @@
+"""
+Бенчмарк уровней валидации ответов (strict, lenient, trusted).
+
+Для каждого уровня измеряет число объектов в секунду и процессорное время на ответ
+при разборе тел GET /booking/{id} и GET /booking. Тела ответов берутся у FakeRestfulBooker
+через BookerClient, поэтому формат совпадает с живым API.
+
+Запуск:
+    python -m benchmarks.bench_validation --items 10000 --repeat 2000
+"""
+import argparse
+import time
+
+from src.api.client import BookerClient
+from src.api.decoding import BookingItemList, ValidationLevel, decode_json
+from src.api.models import Booking
+from src.api.routes import Routes
+from src.fake.restful_booker import OFFLINE_BASE_URL, FakeRestfulBooker
+
+
+def measure(content: bytes, target, level: ValidationLevel, repeat: int, objects: int) -> tuple[float, float]:
+    decode_json(content, target, level)
+    started = time.process_time()
+    for _ in range(repeat):
+        decode_json(content, target, level)
+    cpu = (time.process_time() - started) / repeat
+    return objects / cpu, cpu * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10_000, help="размер списка GET /booking")
+    parser.add_argument("--repeat", type=int, default=2_000,
+                        help="число разборов ответа GET /booking/{id}; список разбирается в 100 раз реже")
+    args = parser.parse_args()
+
+    client = BookerClient(OFFLINE_BASE_URL, transport=FakeRestfulBooker(dataset_size=args.items))
+    booking = client.client.get(Routes.booking_by_id(1)).content
+    booking_ids = client.client.get(Routes.BOOKING).content
+    client.close()
+
+    cases = (
+        ("get_booking", booking, Booking, args.repeat, 1),
+        ("get_booking_ids", booking_ids, BookingItemList, max(1, args.repeat // 100), args.items),
+    )
+    print(f"{'метод':<18}{'уровень':<10}{'объектов/с':>14}{'CPU, мкс/ответ':>18}")
+    for name, content, target, repeat, objects in cases:
+        for level in ValidationLevel:
+            per_second, cpu_us = measure(content, target, level, repeat, objects)
+            print(f"{name:<18}{level.value:<10}{per_second:>14,.0f}{cpu_us:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
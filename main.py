@@ -1,13 +1,20 @@
 #main.py
 
+import argparse
+import asyncio
+import json
 import random
-from src.api.client import BookerClient
+import sys
+from src.api.auth import TokenProvider
+from src.api.client import AsyncBookerClient, BookerClient
 from src.api.models import Booking
 from src.api.routes import Routes
-from src.config import settings
+from src.fake.restful_booker import OFFLINE_BASE_URL, FakeRestfulBooker
+from src.load.driver import LoadConfig, LoadDriver, parse_mix
+from src.load.multiprocess import ClientFactory, MultiProcessLoadRunner
 
 
-def main():
+def demo():
 
     booking_data = {
             "firstname": "Bob",
@@ -34,11 +41,12 @@ def main():
         }
 
     data = Booking(**booking_data)
-    client = BookerClient()
+    token_provider = TokenProvider.from_settings()
+    client = BookerClient(token_provider=token_provider)
     # client.get_booking(Routes.booking_by_id(9101))
 
     #get token
-    a_r = client.authenticate(user_name=settings.user_name, password=settings.password, route="https://restful-booker.herokuapp.com/auth")
+    a_r = token_provider.get_token(client)
     print(f"a_R: {a_r}, type: {type(a_r)}")
 
     #get ids
@@ -55,12 +63,131 @@ def main():
     print("gb:", g_b.model_dump_json(indent=3))
 
     #update booking
-    u_b = client.update_booking(Booking(**booking_data_v2),Routes.booking_by_id(random_booking), a_r.token)
+    u_b = client.update_booking(Booking(**booking_data_v2),Routes.booking_by_id(random_booking))
     print("u_b: ",u_b.model_dump_json(indent=3))
 
     #delete booking
-    d_b = client.delete_booking(Routes.booking_by_id(random_booking), a_r.token)
+    d_b = client.delete_booking(Routes.booking_by_id(random_booking))
     print("del booking: ", d_b)
 
+def client_factory(args) -> ClientFactory:
+    """
+    Возвращает фабрику клиента для нагрузочного прогона: к живому API или к FakeRestfulBooker при --offline.
+    """
+    return ClientFactory(
+        offline=args.offline,
+        dataset_size=args.fake_dataset_size,
+        latency=args.fake_latency,
+        error_rate=args.fake_error_rate,
+        seed=args.seed,
+    )
+
+
+def load(args) -> None:
+    """
+    Запускает нагрузочный прогон и печатает сводку; при --json сохраняет её в файл.
+    """
+    config = LoadConfig(
+        mix=parse_mix(args.mix),
+        concurrency=args.concurrency,
+        rate=args.rate,
+        duration=args.duration,
+        requests=args.requests,
+        seed=args.seed,
+        cleanup=not args.no_cleanup,
+    )
+    if args.processes > 1:
+        report = MultiProcessLoadRunner(config, args.processes, client_factory(args), synthetic=args.synthetic).run()
+    else:
+        payloads = None
+        if args.synthetic:
+            from src.load.generator import BookingFactory
+
+            payloads = BookingFactory(seed=args.seed).stream()
+        client = client_factory(args)()
+        try:
+            report = LoadDriver(client, config, payloads=payloads).run()
+        finally:
+            client.close()
+    print(report.format_table())
+    if args.json:
+        summary = json.dumps(report.to_dict(), indent=2, ensure_ascii=False)
+        if args.json == "-":
+            print(summary)
+        else:
+            with open(args.json, "w", encoding="utf-8") as file:
+                file.write(summary)
+
+
+async def run_scenario(args):
+    """
+    Запускает экземпляры CRUD сценария одновременно через AsyncBookerClient и печатает сводку.
+    """
+    from src.load.scenario import ScenarioRunner, crud_scenario
+
+    if args.offline:
+        transport = FakeRestfulBooker.from_settings(latency=args.fake_latency, dataset_size=0)
+        token_provider = TokenProvider(transport.user_name, transport.password)
+        client = AsyncBookerClient(OFFLINE_BASE_URL, token_provider=token_provider, transport=transport)
+    else:
+        client = AsyncBookerClient(token_provider=TokenProvider.from_settings())
+    async with client:
+        report = await ScenarioRunner(client, crud_scenario(), concurrency=args.concurrency).run(args.instances)
+    print(report.format_table())
+    if args.json:
+        summary = json.dumps(report.to_dict(), indent=2, ensure_ascii=False)
+        if args.json == "-":
+            print(summary)
+        else:
+            with open(args.json, "w", encoding="utf-8") as file:
+                file.write(summary)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Restful-Booker: демонстрационный сценарий и нагрузочный драйвер")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("demo", help="Последовательный CRUD сценарий против живого API")
+
+    load_parser = commands.add_parser("load", help="Нагрузочный прогон со смесью CRUD операций")
+    load_parser.add_argument("--mix", default="get=70,create=20,update=5,delete=5",
+                             help="Доли операций, например get=70,create=20,update=5,delete=5")
+    load_parser.add_argument("--concurrency", type=int, default=8, help="Число рабочих потоков")
+    load_parser.add_argument("--processes", type=int, default=1,
+                             help="Число процессов; потоки, запросы и частота делятся между ними")
+    load_parser.add_argument("--rate", type=float, help="Целевая частота запросов в секунду")
+    limit = load_parser.add_mutually_exclusive_group(required=True)
+    limit.add_argument("--duration", type=float, help="Длительность прогона в секундах")
+    limit.add_argument("--requests", type=int, help="Общее число запросов")
+    load_parser.add_argument("--seed", type=int, default=0, help="Seed генератора выбора операций")
+    load_parser.add_argument("--json", help="Путь для JSON сводки ('-' для stdout)")
+    load_parser.add_argument("--no-cleanup", action="store_true", help="Не удалять созданные бронирования")
+    load_parser.add_argument("--synthetic", action="store_true",
+                             help="Отправлять в create/update уникальные тела BookingFactory (нужен numpy)")
+    load_parser.add_argument("--offline", action="store_true", help="Использовать FakeRestfulBooker вместо сети")
+    load_parser.add_argument("--fake-latency", type=float, default=0.0, help="Задержка FakeRestfulBooker, с")
+    load_parser.add_argument("--fake-error-rate", type=float, default=0.0, help="Доля ошибок FakeRestfulBooker")
+    load_parser.add_argument("--fake-dataset-size", type=int, default=100,
+                             help="Число бронирований в FakeRestfulBooker")
+
+    scenario_parser = commands.add_parser("scenario", help="Параллельные экземпляры CRUD сценария (DAG шагов)")
+    scenario_parser.add_argument("--instances", type=int, default=100, help="Число экземпляров сценария")
+    scenario_parser.add_argument("--concurrency", type=int, default=32,
+                                 help="Число одновременно выполняемых экземпляров")
+    scenario_parser.add_argument("--json", help="Путь для JSON сводки ('-' для stdout)")
+    scenario_parser.add_argument("--offline", action="store_true", help="Использовать FakeRestfulBooker вместо сети")
+    scenario_parser.add_argument("--fake-latency", type=float, default=0.0, help="Задержка FakeRestfulBooker, с")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == "demo":
+        demo()
+    elif args.command == "scenario":
+        asyncio.run(run_scenario(args))
+    else:
+        load(args)
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(sys.argv[1:])
\ No newline at end of file
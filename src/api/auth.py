@@ -0,0 +1,138 @@
+#src/api/auth.py
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Optional
+
+from src.api.routes import Routes
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class TokenProvider:
+    """
+    Кэширует токен аутентификации и обновляет его по истечении TTL.
+
+    Токен разделяется между потоками и асинхронными задачами. Обновление
+    выполняется одним вызывающим (single-flight): остальные ждут его результат,
+    поэтому одновременные запросы не порождают лавину POST /auth.
+    """
+
+    def __init__(self, user_name: str, password: str, route: str = Routes.AUTH,
+                 ttl: float = 600.0, refresh_margin: float = 30.0):
+        """
+        Инициализирует TokenProvider.
+
+        Args:
+           user_name (str): Имя пользователя.
+           password (str): Пароль пользователя.
+           route (str): Относительный путь API для аутентификации.
+           ttl (float): Время жизни токена в секундах.
+           refresh_margin (float): За сколько секунд до истечения TTL токен обновляется заранее.
+
+        Raises:
+           ValueError: Если ttl не положительный или refresh_margin вне диапазона [0, ttl).
+        """
+        if ttl <= 0:
+            raise ValueError("ttl должен быть положительным")
+        if not 0 <= refresh_margin < ttl:
+            raise ValueError("refresh_margin должен быть в диапазоне [0, ttl)")
+        self.user_name = user_name
+        self.password = password
+        self.route = route
+        self.ttl = ttl
+        self.refresh_margin = refresh_margin
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+        self._async_locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def from_settings(cls, **kwargs) -> "TokenProvider":
+        """
+        Создаёт TokenProvider с учётными данными из настроек.
+
+        Returns:
+           TokenProvider: Провайдер токенов.
+
+        Raises:
+           ValueError: Если USER_NAME или PASSWORD не заданы.
+        """
+        from src.config import get_settings
+
+        config = get_settings()
+        return cls(config.require("user_name"), config.require("password"), **kwargs)
+
+    def _fresh_token(self) -> Optional[str]:
+        if self._token is not None and time.monotonic() < self._expires_at - self.refresh_margin:
+            return self._token
+        return None
+
+    def _store(self, token: str) -> str:
+        self._token = token
+        self._expires_at = time.monotonic() + self.ttl
+        return token
+
+    def get_token(self, client) -> str:
+        """
+        Возвращает закэшированный токен или получает новый через client.authenticate.
+
+        Args:
+           client (BookerClient): Синхронный клиент API.
+
+        Returns:
+           str: Токен аутентификации.
+        """
+        token = self._fresh_token()
+        if token is not None:
+            return token
+        with self._lock:
+            token = self._fresh_token()
+            if token is not None:
+                return token
+            return self._store(client.authenticate(self.user_name, self.password, self.route).token)
+
+    async def get_token_async(self, client) -> str:
+        """
+        Асинхронный вариант get_token для AsyncBookerClient.
+
+        Args:
+           client (AsyncBookerClient): Асинхронный клиент API.
+
+        Returns:
+           str: Токен аутентификации.
+        """
+        token = self._fresh_token()
+        if token is not None:
+            return token
+        async with self._async_lock():
+            token = self._fresh_token()
+            if token is not None:
+                return token
+            auth_response = await client.authenticate(self.user_name, self.password, self.route)
+            with self._lock:
+                return self._store(auth_response.token)
+
+    def invalidate(self, token: Optional[str] = None) -> None:
+        """
+        Сбрасывает закэшированный токен.
+
+        Args:
+           token (Optional[str]): Отклонённый сервером токен. Если кэш уже обновлён
+               другим вызывающим, повторный сброс не выполняется.
+        """
+        with self._lock:
+            if token is None or token == self._token:
+                self._token = None
+                self._expires_at = 0.0
+
+    def _async_lock(self) -> "asyncio.Lock":
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            lock = self._async_locks.get(loop)
+            if lock is None:
+                lock = self._async_locks[loop] = asyncio.Lock()
+            return lock
@@ -0,0 +1,243 @@
+#src/api/booking_index.py
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from typing import Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from src.api.booking_ids import BookingIdSet
+from src.api.bulk import BulkResult
+from src.api.models import Booking, BookingSearch
+
+
+class _DateIndex:
+    """
+    Даты (date.toordinal) в отсортированном array('q') и параллельный массив ID бронирований.
+    """
+    __slots__ = ("days", "ids")
+
+    def __init__(self):
+        self.days = array("q")
+        self.ids = array("q")
+
+    def extend(self, entries: Iterable[Tuple[date, int]]) -> None:
+        # Пакетное добавление: одна сортировка за O(n log n) вместо вставки в массив на каждый элемент.
+        merged = sorted(
+            [*zip(self.days, self.ids), *((day.toordinal(), booking_id) for day, booking_id in entries)],
+            key=lambda entry: entry[0],
+        )
+        self.days = array("q", (ordinal for ordinal, _ in merged))
+        self.ids = array("q", (booking_id for _, booking_id in merged))
+
+    def add(self, day: date, booking_id: int) -> None:
+        position = bisect_right(self.days, day.toordinal())
+        self.days.insert(position, day.toordinal())
+        self.ids.insert(position, booking_id)
+
+    def remove(self, day: date, booking_id: int) -> None:
+        ordinal = day.toordinal()
+        for position in range(bisect_left(self.days, ordinal), bisect_right(self.days, ordinal)):
+            if self.ids[position] == booking_id:
+                del self.days[position]
+                del self.ids[position]
+                return
+
+    def between(self, start: Optional[date], end: Optional[date]) -> array:
+        low = bisect_left(self.days, start.toordinal()) if start is not None else 0
+        high = bisect_left(self.days, end.toordinal()) if end is not None else len(self.days)
+        return self.ids[low:high]
+
+
+class BookingIndex:
+    """
+    Локальный вторичный индекс по загруженным бронированиям.
+
+    Поиск по имени и фамилии выполняется по словарям за O(1), запросы по диапазонам дат
+    заезда и выезда — бинарным поиском по отсортированным массивам за O(log n + k).
+    Индекс не обращается к API: его заполняют моделями Booking, полученными, например,
+    через get_many, и поддерживают актуальным методами add и remove.
+    """
+
+    def __init__(self, bookings: Iterable[Tuple[int, Booking]] = ()):
+        """
+        Инициализирует BookingIndex.
+
+        Args:
+           bookings (Iterable[Tuple[int, Booking]]): Пары (ID бронирования, бронирование).
+        """
+        self._bookings: Dict[int, Booking] = {}
+        self._first_names: Dict[str, Set[int]] = {}
+        self._last_names: Dict[str, Set[int]] = {}
+        self._check_in = _DateIndex()
+        self._check_out = _DateIndex()
+        self._max_stay = 0
+        self.update(bookings)
+
+    @classmethod
+    def from_bulk(cls, result: BulkResult[int, Booking]) -> "BookingIndex":
+        """
+        Строит индекс по успешным результатам get_many.
+
+        Args:
+           result (BulkResult[int, Booking]): Результат BookerClient.get_many.
+
+        Returns:
+           BookingIndex: Индекс по полученным бронированиям.
+        """
+        return cls((item.item, item.value) for item in result.succeeded)
+
+    def add(self, booking_id: int, booking: Booking) -> None:
+        """
+        Добавляет бронирование в индекс или заменяет ранее добавленное с тем же ID.
+
+        Args:
+           booking_id (int): ID бронирования.
+           booking (Booking): Бронирование.
+        """
+        if booking_id in self._bookings:
+            self.remove(booking_id)
+        dates = booking.booking_dates
+        self._bookings[booking_id] = booking
+        self._first_names.setdefault(booking.first_name, set()).add(booking_id)
+        self._last_names.setdefault(booking.last_name, set()).add(booking_id)
+        self._check_in.add(dates.check_in, booking_id)
+        self._check_out.add(dates.check_out, booking_id)
+        self._max_stay = max(self._max_stay, (dates.check_out - dates.check_in).days)
+
+    def update(self, bookings: Iterable[Tuple[int, Booking]]) -> None:
+        """
+        Добавляет бронирования пакетом; повторяющиеся и уже добавленные ID заменяются.
+
+        Индексы дат перестраиваются одной сортировкой, поэтому загрузка n бронирований
+        занимает O(n log n), а не O(n²), как при вызове add для каждого.
+
+        Args:
+           bookings (Iterable[Tuple[int, Booking]]): Пары (ID бронирования, бронирование).
+        """
+        batch: Dict[int, Booking] = {}
+        for booking_id, booking in bookings:
+            if booking_id in self._bookings:
+                self.remove(booking_id)
+            batch.pop(booking_id, None)
+            batch[booking_id] = booking
+        for booking_id, booking in batch.items():
+            dates = booking.booking_dates
+            self._bookings[booking_id] = booking
+            self._first_names.setdefault(booking.first_name, set()).add(booking_id)
+            self._last_names.setdefault(booking.last_name, set()).add(booking_id)
+            self._max_stay = max(self._max_stay, (dates.check_out - dates.check_in).days)
+        self._check_in.extend((booking.booking_dates.check_in, booking_id) for booking_id, booking in batch.items())
+        self._check_out.extend((booking.booking_dates.check_out, booking_id) for booking_id, booking in batch.items())
+
+    def remove(self, booking_id: int) -> None:
+        """
+        Удаляет бронирование из индекса, если оно есть.
+
+        Args:
+           booking_id (int): ID бронирования.
+        """
+        booking = self._bookings.pop(booking_id, None)
+        if booking is None:
+            return
+        self._first_names[booking.first_name].discard(booking_id)
+        self._last_names[booking.last_name].discard(booking_id)
+        self._check_in.remove(booking.booking_dates.check_in, booking_id)
+        self._check_out.remove(booking.booking_dates.check_out, booking_id)
+
+    def get(self, booking_id: int) -> Optional[Booking]:
+        """
+        Возвращает бронирование по ID или None.
+        """
+        return self._bookings.get(booking_id)
+
+    def __len__(self) -> int:
+        return len(self._bookings)
+
+    def __contains__(self, booking_id: object) -> bool:
+        return booking_id in self._bookings
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._bookings)
+
+    def by_name(self, first_name: Optional[str] = None, last_name: Optional[str] = None) -> BookingIdSet:
+        """
+        Находит бронирования по точному совпадению имени и (или) фамилии.
+
+        Args:
+           first_name (Optional[str]): Имя клиента.
+           last_name (Optional[str]): Фамилия клиента.
+
+        Returns:
+           BookingIdSet: ID найденных бронирований.
+        """
+        matches: Optional[Set[int]] = None
+        if first_name is not None:
+            matches = self._first_names.get(first_name, set())
+        if last_name is not None:
+            last = self._last_names.get(last_name, set())
+            matches = last if matches is None else matches & last
+        return BookingIdSet(self._bookings if matches is None else matches)
+
+    def check_in_between(self, start: Optional[date] = None, end: Optional[date] = None) -> BookingIdSet:
+        """
+        Находит бронирования с датой заезда в полуинтервале [start, end).
+
+        Args:
+           start (Optional[date]): Начало диапазона включительно; None — без нижней границы.
+           end (Optional[date]): Конец диапазона не включительно; None — без верхней границы.
+
+        Returns:
+           BookingIdSet: ID найденных бронирований.
+        """
+        return BookingIdSet(self._check_in.between(start, end))
+
+    def check_out_between(self, start: Optional[date] = None, end: Optional[date] = None) -> BookingIdSet:
+        """
+        Находит бронирования с датой выезда в полуинтервале [start, end).
+
+        Args:
+           start (Optional[date]): Начало диапазона включительно; None — без нижней границы.
+           end (Optional[date]): Конец диапазона не включительно; None — без верхней границы.
+
+        Returns:
+           BookingIdSet: ID найденных бронирований.
+        """
+        return BookingIdSet(self._check_out.between(start, end))
+
+    def overlapping(self, start: date, end: date) -> BookingIdSet:
+        """
+        Находит бронирования, проживание по которым пересекается с периодом [start, end).
+
+        Кандидаты выбираются по дате заезда в окне [start - максимальная длительность, end),
+        поэтому просматриваются только бронирования, которые могут пересекаться с периодом.
+
+        Args:
+           start (date): Начало периода включительно.
+           end (date): Конец периода не включительно.
+
+        Returns:
+           BookingIdSet: ID найденных бронирований.
+        """
+        candidates = self._check_in.between(start - timedelta(days=self._max_stay), end)
+        return BookingIdSet(
+            booking_id for booking_id in candidates
+            if self._bookings[booking_id].booking_dates.check_out > start
+        )
+
+    def search(self, search: BookingSearch) -> BookingIdSet:
+        """
+        Выполняет поиск с той же семантикой фильтров, что и GET /booking, без обращения к API.
+
+        Args:
+           search (BookingSearch): Фильтры поиска.
+
+        Returns:
+           BookingIdSet: ID найденных бронирований.
+        """
+        matches: Optional[Set[int]] = None
+        if search.first_name is not None or search.last_name is not None:
+            matches = set(self.by_name(search.first_name, search.last_name))
+        for index, day in ((self._check_in, search.check_in), (self._check_out, search.check_out)):
+            if day is not None:
+                found = index.between(day, None)
+                matches = set(found) if matches is None else matches.intersection(found)
+        return BookingIdSet(self._bookings if matches is None else matches)
@@ -0,0 +1,123 @@
+#src/api/bulk.py
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Generic, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class BulkItemResult(Generic[T, R]):
+    """
+    Результат одной операции внутри пакетного запроса.
+
+    Атрибуты:
+       index (int): Позиция элемента во входной последовательности.
+       item (T): Исходный элемент (бронирование или ID).
+       value (Optional[R]): Результат операции, если она прошла успешно.
+       error (Optional[BaseException]): Исключение, если операция завершилась ошибкой или была отменена.
+    """
+    index: int
+    item: T
+    value: Optional[R] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BulkResult(Generic[T, R]):
+    """
+    Результат пакетной операции: элементы в порядке входных данных и суммарная пропускная способность.
+
+    Атрибуты:
+       items (List[BulkItemResult]): Результаты по каждому элементу.
+       elapsed (float): Общее время выполнения пакета в секундах.
+    """
+    items: List[BulkItemResult[T, R]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def values(self) -> List[Optional[R]]:
+        return [item.value for item in self.items]
+
+    @property
+    def succeeded(self) -> List[BulkItemResult[T, R]]:
+        return [item for item in self.items if item.ok]
+
+    @property
+    def failed(self) -> List[BulkItemResult[T, R]]:
+        return [item for item in self.items if not item.ok]
+
+    @property
+    def ops_per_second(self) -> float:
+        """
+        Пропускная способность пакета (операций в секунду).
+        """
+        if self.elapsed <= 0:
+            return 0.0
+        return len(self.items) / self.elapsed
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+def run_bulk(operation: Callable[[T], R], items: Iterable[T], max_workers: int) -> BulkResult[T, R]:
+    """
+    Выполняет операцию для каждого элемента в пуле потоков.
+
+    Ошибка одного элемента не прерывает пакет: она сохраняется в соответствующем BulkItemResult.
+
+    Args:
+        operation (Callable): Операция над одним элементом.
+        items (Iterable): Входные элементы.
+        max_workers (int): Размер пула потоков.
+
+    Returns:
+        BulkResult: Результаты в порядке входных данных.
+    """
+    items = list(items)
+    results: List[BulkItemResult[T, R]] = [BulkItemResult(index, item) for index, item in enumerate(items)]
+
+    def _run(result: BulkItemResult[T, R]) -> None:
+        try:
+            result.value = operation(result.item)
+        except Exception as e:
+            result.error = e
+
+    started = time.perf_counter()
+    if items:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as executor:
+            list(executor.map(_run, results))
+    return BulkResult(results, time.perf_counter() - started)
+
+
+async def run_bulk_async(operation: Callable[[T], Awaitable[R]], items: Iterable[Any]) -> BulkResult[T, R]:
+    """
+    Асинхронный вариант run_bulk: все операции запускаются через asyncio.gather.
+
+    Ограничение параллельности обеспечивает семафор AsyncBookerClient.
+
+    Args:
+        operation (Callable): Корутинная функция над одним элементом.
+        items (Iterable): Входные элементы.
+
+    Returns:
+        BulkResult: Результаты в порядке входных данных.
+    """
+    import asyncio
+
+    items = list(items)
+    started = time.perf_counter()
+    outcomes = await asyncio.gather(*(operation(item) for item in items), return_exceptions=True)
+    results = [
+        # gather возвращает и отменённые операции (CancelledError не наследует Exception).
+        BulkItemResult(index, item, error=outcome) if isinstance(outcome, BaseException)
+        else BulkItemResult(index, item, value=outcome)
+        for index, (item, outcome) in enumerate(zip(items, outcomes))
+    ]
+    return BulkResult(results, time.perf_counter() - started)
@@ -0,0 +1,165 @@
+#src/api/cache.py
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class CacheEntry:
+    """
+    Закэшированный ответ.
+
+    Атрибуты:
+       value (Any): Валидированный объект ответа.
+       etag (Optional[str]): Валидатор ETag из ответа сервера.
+       expires_at (float): Момент (time.monotonic), после которого запись требует ревалидации.
+    """
+    value: Any
+    etag: Optional[str]
+    expires_at: float
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Снимок счётчиков кэша.
+
+    Атрибуты:
+       hits (int): Ответы из свежих записей без запроса к API.
+       revalidations (int): Ответы 304 Not Modified на условный запрос.
+       misses (int): Запросы, потребовавшие полного ответа.
+       evictions (int): Записи, вытесненные по LRU.
+       size (int): Текущее число записей.
+    """
+    hits: int
+    revalidations: int
+    misses: int
+    evictions: int
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.revalidations + self.misses
+        return (self.hits + self.revalidations) / total if total else 0.0
+
+
+class ResponseCache:
+    """
+    Ограниченный по размеру LRU кэш ответов с TTL, ключом служит маршрут.
+
+    Устаревшие записи с ETag не удаляются сразу: клиент ревалидирует их через
+    If-None-Match, и ответ 304 обходится без передачи тела и валидации Pydantic.
+    Закэшированные объекты разделяются между вызывающими и не должны изменяться.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 60.0):
+        """
+        Инициализирует ResponseCache.
+
+        Args:
+           max_size (int): Максимальное число записей.
+           ttl (float): Время жизни записи в секундах.
+
+        Raises:
+           ValueError: Если max_size меньше 1 или ttl отрицательный.
+        """
+        if max_size < 1:
+            raise ValueError("max_size должен быть не меньше 1")
+        if ttl < 0:
+            raise ValueError("ttl не может быть отрицательным")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._revalidations = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def lookup(self, route: str) -> Optional[CacheEntry]:
+        """
+        Возвращает запись для маршрута (свежую или требующую ревалидации).
+
+        Свежая запись учитывается как попадание. Устаревшая запись без ETag удаляется.
+
+        Args:
+           route (str): Относительный путь API.
+
+        Returns:
+           Optional[CacheEntry]: Запись или None.
+        """
+        with self._lock:
+            entry = self._entries.get(route)
+            if entry is None:
+                return None
+            if entry.fresh:
+                self._entries.move_to_end(route)
+                self._hits += 1
+                return entry
+            if entry.etag is None:
+                del self._entries[route]
+                return None
+            return entry
+
+    def store(self, route: str, value: Any, etag: Optional[str] = None) -> None:
+        """
+        Сохраняет полный ответ, учитывая его как промах.
+
+        Args:
+           route (str): Относительный путь API.
+           value (Any): Валидированный объект ответа.
+           etag (Optional[str]): Валидатор ETag из ответа.
+        """
+        with self._lock:
+            self._misses += 1
+            self._entries[route] = CacheEntry(value, etag, time.monotonic() + self.ttl)
+            self._entries.move_to_end(route)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def revalidated(self, route: str, entry: CacheEntry) -> Any:
+        """
+        Продлевает запись после ответа 304 Not Modified.
+
+        Args:
+           route (str): Относительный путь API.
+           entry (CacheEntry): Ревалидированная запись.
+
+        Returns:
+           Any: Закэшированный объект ответа.
+        """
+        with self._lock:
+            self._revalidations += 1
+            entry.expires_at = time.monotonic() + self.ttl
+            if route in self._entries:
+                self._entries.move_to_end(route)
+            return entry.value
+
+    def invalidate(self, route: str) -> None:
+        """
+        Удаляет запись для маршрута.
+
+        Args:
+           route (str): Относительный путь API.
+        """
+        with self._lock:
+            self._entries.pop(route, None)
+
+    def clear(self) -> None:
+        """
+        Удаляет все записи, сохраняя счётчики.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._revalidations, self._misses, self._evictions, len(self._entries))
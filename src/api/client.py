@@ -1,42 +1,455 @@
 #src/api/client.py
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import httpx
 from pydantic import ValidationError
-from typing import List, Optional
-from src.api.models import Booking, BookingResponse, ErrorResponse, AuthResponse, AuthRequest, BookingItem
-from src.config import settings
+from typing import TYPE_CHECKING, AsyncIterator, Iterable, Iterator, List, Optional, Union
+from src.api.auth import TokenProvider
+from src.api.booking_ids import BookingIdSet, BookingIdStreamParser
+from src.api.bulk import BulkResult, run_bulk, run_bulk_async
+from src.api.cache import CacheEntry, ResponseCache
+from src.api.decoding import BookingItemList, ValidationLevel, decode_json, get_adapter
+from src.api.encoding import JSON_HEADERS, PatchPayload, Payload, encode_booking, encode_patch
+from src.api.metrics import RequestMetrics
+from src.api.models import Booking, BookingPatch, BookingResponse, BookingSearch, ErrorResponse, AuthResponse, AuthRequest, BookingItem
+from src.api.resilience import AdaptiveConcurrencyLimiter, ResiliencePolicy
+from src.api.routes import Routes
 
-class BookerClient:
-    def __init__(self, base_url: str = settings.base_url):
+if TYPE_CHECKING:
+    from src.config import Settings
+
+DEFAULT_BULK_WORKERS = 16
+
+
+def _settings() -> "Settings":
+    """
+    Возвращает настройки, загружая их при первом создании клиента, а не при импорте модуля.
+    """
+    from src.config import get_settings
+
+    return get_settings()
+
+
+def _http_options(config: "Settings", max_connections: Optional[int] = None) -> dict:
+    """
+    Формирует параметры пула соединений, таймаутов и HTTP/2 для httpx клиента из настроек.
+
+    Args:
+        config (Settings): Настройки приложения.
+        max_connections (Optional[int]): Переопределение максимального числа соединений.
+
+    Returns:
+        dict: Аргументы timeout, limits и http2 для httpx.Client/httpx.AsyncClient.
+    """
+    return {
+        "timeout": httpx.Timeout(
+            connect=config.connect_timeout,
+            read=config.read_timeout,
+            write=config.write_timeout,
+            pool=config.pool_timeout,
+        ),
+        "limits": httpx.Limits(
+            max_connections=max_connections or config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+        "http2": config.http2,
+    }
+
+
+def _conditional_headers(entry: Optional[CacheEntry]) -> Optional[dict]:
+    """
+    Возвращает заголовок If-None-Match для ревалидации записи кэша.
+    """
+    if entry is not None and entry.etag is not None:
+        return {"If-None-Match": entry.etag}
+    return None
+
+
+def _with_token(headers: Optional[dict], token: str) -> dict:
+    """
+    Возвращает копию заголовков с cookie токена аутентификации.
+    """
+    return {**(headers or {}), "Cookie": f"token={token}"}
+
+
+class _ResponseHandlerMixin:
+    """
+    Общая обработка ответов API для синхронного и асинхронного клиентов.
+    """
+
+    def _handle_response(self, response: httpx.Response, model, validation: Optional[ValidationLevel] = None):
+        """
+        Обрабатывает ответ API, валидирует и преобразует в модель Pydantic.
+
+        Args:
+            response (httpx.Response): HTTP ответ от API.
+            model (BaseModel): Pydantic модель или аннотация типа (например, BookingItemList).
+            validation (Optional[ValidationLevel]): Уровень валидации. По умолчанию уровень клиента.
+
+        Returns:
+            BaseModel: Валидированный объект pydantic модели.
+
+        Raises:
+            RuntimeError: Если ответ содержит ошибку.
+            ValueError: Если валидация ответа не удалась.
+        """
+        if response.status_code == 200:
+            level = self.validation if validation is None else validation
+            if self.metrics is None:
+                return decode_json(response.content, model, level)
+            started = time.perf_counter()
+            try:
+                return decode_json(response.content, model, level)
+            finally:
+                self.metrics.observe_validation(response, time.perf_counter() - started)
+        else:
+            self._handle_error(response)
+
+    def _handle_error(self, response: httpx.Response) -> None:
+        """
+        Обрабатывает ошибочный ответ API и выбрасывает исключение.
+
+        Args:
+            response (httpx.Response): HTTP ответ с ошибкой.
+
+        Raises:
+            RuntimeError: Исключение с описанием ошибки.
+        """
+        try:
+            error = get_adapter(ErrorResponse).validate_json(response.content)
+            reason = error.message
+        except ValidationError as e:
+            logging.warning(f"Ошибка парсинга ответа API: {e.errors(include_url=False)[0]['msg']}")
+            reason = response.text
+        raise RuntimeError(f"HTTP Ошибка {response.status_code}: {reason}")
+
+    def _cacheable(self, validation: Optional[ValidationLevel]) -> bool:
+        """
+        Кэшируются только ответы уровня strict: кэш хранит модели Booking, а уровни
+        lenient и trusted возвращают словари.
+        """
+        return (self.validation if validation is None else ValidationLevel(validation)) is ValidationLevel.STRICT
+
+    def _invalidate_cached(self, route: str) -> None:
+        """
+        Удаляет запись кэша после изменяющего запроса.
+
+        Вызывается после получения ответа, а не до отправки: иначе параллельный GET,
+        завершившийся во время изменения, вернул бы в кэш прежнее тело.
+        """
+        if self.cache is not None:
+            self.cache.invalidate(route)
+
+    def _handle_cached_response(self, response: httpx.Response, model, route: str,
+                                entry: Optional[CacheEntry], validation: Optional[ValidationLevel] = None):
+        """
+        Обрабатывает ответ на условный запрос с учётом кэша.
+
+        Ответ 304 возвращает закэшированный объект без валидации, полный ответ
+        валидируется и сохраняется в кэш вместе с ETag.
+
+        Args:
+            response (httpx.Response): HTTP ответ от API.
+            model (BaseModel): Pydantic модель для валидации и парсинга.
+            route (str): Относительный путь API (ключ кэша).
+            entry (Optional[CacheEntry]): Ревалидируемая запись кэша.
+            validation (Optional[ValidationLevel]): Уровень валидации. По умолчанию уровень клиента.
+
+        Returns:
+            BaseModel: Валидированный или закэшированный объект.
+
+        Raises:
+            RuntimeError: Если ответ содержит ошибку.
+            ValueError: Если валидация ответа не удалась.
+        """
+        if response.status_code == 304 and entry is not None:
+            return self.cache.revalidated(route, entry)
+        value = self._handle_response(response, model, validation)
+        self.cache.store(route, value, response.headers.get("ETag"))
+        return value
+
+    def _handle_id_set(self, response: httpx.Response) -> BookingIdSet:
+        """
+        Обрабатывает ответ со списком ID бронирований и возвращает компактный набор.
+
+        Args:
+            response (httpx.Response): HTTP ответ от API.
+
+        Returns:
+            BookingIdSet: Набор ID бронирований.
+
+        Raises:
+            RuntimeError: В случае ошибки API.
+        """
+        if response.status_code == 200:
+            return BookingIdSet.from_json(response.content)
+        else:
+            self._handle_error(response)
+
+    def _handle_delete(self, response: httpx.Response) -> Optional[int]:
+        """
+        Обрабатывает ответ на удаление бронирования.
+
+        Args:
+            response (httpx.Response): HTTP ответ от API.
+
+        Returns:
+            Optional[int]: Код статуса 201 при успешном удалении.
+
+        Raises:
+            RuntimeError: В случае ошибки API.
+        """
+        if response.status_code == 201:
+            return response.status_code
+        else:
+            self._handle_error(response)
+
+
+class BookerClient(_ResponseHandlerMixin):
+    def __init__(self, base_url: Optional[str] = None, token_provider: Optional[TokenProvider] = None,
+                 cache: Optional[ResponseCache] = None, transport: Optional[httpx.BaseTransport] = None,
+                 metrics: Optional[RequestMetrics] = None, resilience: Optional[ResiliencePolicy] = None,
+                 warmup_connections: Optional[int] = None,
+                 validation: ValidationLevel = ValidationLevel.STRICT,
+                 concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None):
         """
         Инициализирует BookerClient.
 
+        Пул соединений, таймауты и HTTP/2 настраиваются через Settings (переменные окружения).
+
         Args:
-           base_url (str): Базовый URL API. По умолчанию берётся из настроек.
+           base_url (Optional[str]): Базовый URL API. По умолчанию берётся из настроек.
+           token_provider (Optional[TokenProvider]): Провайдер токенов для изменяющих запросов,
+               вызываемых без явного токена.
+           cache (Optional[ResponseCache]): Кэш ответов get_booking. По умолчанию отключён.
+           transport (Optional[httpx.BaseTransport]): HTTP транспорт, например FakeRestfulBooker.
+           metrics (Optional[RequestMetrics]): Сборщик метрик запросов. По умолчанию отключён.
+           resilience (Optional[ResiliencePolicy]): Политика повторов, ограничения частоты
+               и автоматического выключателя. По умолчанию отключена.
+           warmup_connections (Optional[int]): Число соединений, открываемых при создании клиента.
+               По умолчанию берётся из настроек.
+           validation (ValidationLevel): Уровень валидации ответов get_booking и get_booking_ids.
+               Остальные методы всегда валидируют ответы полностью.
+           concurrency_limiter (Optional[AdaptiveConcurrencyLimiter]): Адаптивный ограничитель
+               числа одновременных запросов. По умолчанию отключён.
+
+        Raises:
+           ValueError: Если base_url не передан и BASE_URL не задан.
         """
-        self.client = httpx.Client(base_url=base_url, timeout=10.0)
+        config = _settings()
+        base_url = config.require("base_url") if base_url is None else base_url
+        self.client = httpx.Client(
+            base_url=base_url,
+            transport=transport,
+            event_hooks=metrics.event_hooks() if metrics is not None else None,
+            **_http_options(config),
+        )
         self.base_url = base_url
+        self.token_provider = token_provider
+        self.cache = cache
+        self.metrics = metrics
+        self.resilience = resilience
+        self.validation = ValidationLevel(validation)
+        self.concurrency_limiter = concurrency_limiter
+        self.warm_up(warmup_connections)
 
-    def get_booking_ids(self, route: str) -> List[BookingItem]:
+    def warm_up(self, connections: Optional[int] = None) -> int:
+        """
+        Заранее открывает соединения параллельными запросами GET /ping.
+
+        Первая волна запросов не тратит время на последовательные TCP и TLS рукопожатия.
+        Ошибки прогрева не прерывают работу, а только записываются в лог.
+
+        Args:
+            connections (Optional[int]): Число соединений. По умолчанию берётся из настроек.
+
+        Returns:
+            int: Число успешных запросов прогрева.
+        """
+        connections = _settings().warmup_connections if connections is None else connections
+        if connections <= 0:
+            return 0
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            return sum(executor.map(lambda _: self._ping(), range(connections)))
+
+    def _ping(self) -> bool:
+        try:
+            self.client.get(Routes.PING)
+            return True
+        except httpx.HTTPError as e:
+            logging.warning(f"Ошибка прогрева соединения: {e}")
+            return False
+
+    def _request(self, method: str, route: str, stream: bool = False, **kwargs) -> httpx.Response:
+        """
+        Выполняет HTTP запрос с учётом политики устойчивости; единая точка отправки
+        для всех методов клиента.
+
+        Args:
+            method (str): HTTP метод.
+            route (str): Относительный путь API.
+            stream (bool): Не читать тело ответа. Вызывающий читает и закрывает ответ сам
+                и фиксирует метрики после чтения тела.
+            **kwargs: Дополнительные аргументы httpx.Client.build_request.
+
+        Returns:
+            httpx.Response: HTTP ответ от API.
+        """
+        if self.resilience is None:
+            return self._send(method, route, stream, **kwargs)
+        return self.resilience.call(method, self.client.base_url.host,
+                                    lambda: self._send(method, route, stream, **kwargs))
+
+    def _send(self, method: str, route: str, stream: bool = False, **kwargs) -> httpx.Response:
+        request = self.client.build_request(method, route, **kwargs)
+        limiter = self.concurrency_limiter
+        if limiter is None:
+            response = self.client.send(request, stream=stream)
+        else:
+            limiter.acquire()
+            started, response = time.perf_counter(), None
+            try:
+                response = self.client.send(request, stream=stream)
+            finally:
+                limiter.release(time.perf_counter() - started, response.status_code if response is not None else None)
+        if self.metrics is not None and not stream:
+            self.metrics.complete(response)
+        return response
+
+    def _send_authorized(self, method: str, route: str, token: Optional[str],
+                         headers: Optional[dict] = None, **kwargs) -> httpx.Response:
+        """
+        Выполняет запрос с cookie токена.
+
+        Если токен не передан явно, он берётся из token_provider; при ответе 403
+        токен сбрасывается и запрос повторяется один раз с новым токеном.
+
+        Args:
+            method (str): HTTP метод.
+            route (str): Относительный путь API.
+            token (Optional[str]): Токен аутентификации или None для использования token_provider.
+            headers (Optional[dict]): Дополнительные заголовки.
+            **kwargs: Дополнительные аргументы httpx.Client.request.
+
+        Returns:
+            httpx.Response: HTTP ответ от API.
+        """
+        token, managed = self._resolve_token(token)
+        response = self._request(method, route, headers=_with_token(headers, token), **kwargs)
+        if managed and response.status_code == 403:
+            self.token_provider.invalidate(token)
+            token = self.token_provider.get_token(self)
+            response = self._request(method, route, headers=_with_token(headers, token), **kwargs)
+        return response
+
+    def _resolve_token(self, token: Optional[str]) -> tuple[str, bool]:
+        if token is not None:
+            return token, False
+        if self.token_provider is None:
+            raise ValueError("Токен не передан и token_provider не настроен")
+        return self.token_provider.get_token(self), True
+
+    def get_booking_ids(self, route: str,
+                        validation: Optional[ValidationLevel] = None) -> Union[List[BookingItem], List[dict]]:
         """
         Получает список ID бронирований.
 
         Args:
             route (str): Относительный путь API для получения списка бронирований.
+            validation (Optional[ValidationLevel]): Уровень валидации. По умолчанию уровень клиента.
 
         Returns:
-            List[BookingItem]: Список объектов BookingItem с ID бронирований.
+            List[BookingItem]: Список объектов BookingItem с ID бронирований; для уровней
+                lenient и trusted — список словарей {"bookingid": ...}.
+        """
+        response = self._request("GET", route)
+        return self._handle_response(response, BookingItemList, validation)
+
+    def get_booking_ids_compact(self, route: str) -> BookingIdSet:
         """
-        response = self.client.get(route)
-        return [BookingItem.model_validate(item, by_alias=True) for item in response.json()]
+        Получает список ID бронирований в компактном виде без объектов BookingItem.
+
+        Args:
+            route (str): Относительный путь API для получения списка бронирований.
+
+        Returns:
+            BookingIdSet: Отсортированный набор ID на базе array('q').
+
+        Raises:
+            RuntimeError: В случае ошибки API.
+        """
+        response = self._request("GET", route)
+        return self._handle_id_set(response)
+
+    def search_booking_ids(self, search: BookingSearch, route: str = Routes.BOOKING) -> BookingIdSet:
+        """
+        Ищет ID бронирований с фильтрами firstname, lastname, checkin и checkout на стороне API.
+
+        Args:
+            search (BookingSearch): Фильтры поиска; незаданные фильтры не передаются.
+            route (str): Относительный путь API для получения списка бронирований.
+
+        Returns:
+            BookingIdSet: Набор ID найденных бронирований.
+
+        Raises:
+            RuntimeError: В случае ошибки API.
+        """
+        response = self._request("GET", route, params=search.to_params())
+        return self._handle_id_set(response)
+
+    def iter_booking_ids(self, route: str, batch_size: Optional[int] = None) -> Iterator[Union[int, List[int]]]:
+        """
+        Потоково получает ID бронирований, разбирая тело ответа по мере загрузки.
+
+        Обработка первых ID начинается до окончания загрузки списка, а пиковая память
+        ограничена размером фрагмента (и пачки), а не всего набора данных.
+        Запрос проходит через политику устойчивости, ограничитель и метрики, как остальные методы.
+
+        Args:
+            route (str): Относительный путь API для получения списка бронирований.
+            batch_size (Optional[int]): Размер пачки. Если не задан, ID выдаются по одному.
+
+        Yields:
+            Union[int, List[int]]: ID бронирования или пачка ID.
+
+        Raises:
+            RuntimeError: В случае ошибки API или оборванного ответа.
+        """
+        response = self._request("GET", route, stream=True)
+        batch: List[int] = []
+        try:
+            if response.status_code != 200:
+                response.read()
+                self._handle_error(response)
+            parser = BookingIdStreamParser()
+            for chunk in response.iter_bytes():
+                for booking_id in parser.feed(chunk):
+                    if batch_size is None:
+                        yield booking_id
+                        continue
+                    batch.append(booking_id)
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+            parser.close()
+        finally:
+            response.close()
+            if self.metrics is not None:
+                self.metrics.complete(response)
+        if batch:
+            yield batch
 
-    def create_booking(self, booking: Booking, route: str) -> BookingResponse:
+    def create_booking(self, booking: Payload, route: str) -> BookingResponse:
         """
         Создаёт новое бронирование.
 
         Args:
-          booking (Booking): Объект бронирования для создания.
+          booking (Payload): Объект бронирования для создания или готовое JSON тело
+            (например, результат encode_booking, сохранённый на весь прогон, или тело из BookingFactory).
           route (str): Относительный путь API для создания бронирования.
         Returns:
           BookingResponse: Ответ с информацией о созданном бронировании.
@@ -44,39 +457,46 @@ class BookerClient:
           RuntimeError: В случае ошибки API.
           ValueError: При ошибке валидации ответа.
         """
-        headers = {"Content-Type": "application/json"}
-        response = self.client.post(
+        response = self._request(
+            "POST",
             route,
-            content=booking.model_dump_json(by_alias=True),
-            headers=headers,
+            content=encode_booking(booking),
+            headers=JSON_HEADERS,
         )
-        return self._handle_response(response, BookingResponse)
+        return self._handle_response(response, BookingResponse, ValidationLevel.STRICT)
 
-    def get_booking(self, route: str) -> Booking:
+    def get_booking(self, route: str, validation: Optional[ValidationLevel] = None) -> Union[Booking, dict]:
         """
         Получает данные бронирования.
 
         Args:
             route (str): Относительный путь API для получения бронирования.
+            validation (Optional[ValidationLevel]): Уровень валидации. По умолчанию уровень клиента.
 
         Returns:
-            Booking: Объект бронирования.
+            Booking: Объект бронирования; для уровней lenient и trusted — словарь с ключами как в JSON.
 
         Raises:
             RuntimeError: В случае ошибки API.
             ValueError: При ошибке валидации ответа.
         """
-        response = self.client.get(route)
-        return self._handle_response(response, Booking)
+        if self.cache is None or not self._cacheable(validation):
+            response = self._request("GET", route)
+            return self._handle_response(response, Booking, validation)
+        entry = self.cache.lookup(route)
+        if entry is not None and entry.fresh:
+            return entry.value
+        response = self._request("GET", route, headers=_conditional_headers(entry))
+        return self._handle_cached_response(response, Booking, route, entry, validation)
 
-    def update_booking(self, booking: Booking, route: str, token: str) -> Booking:
+    def update_booking(self, booking: Payload, route: str, token: Optional[str] = None) -> Booking:
         """
         Обновляет существующее бронирование.
 
         Args:
-            booking (Booking): Объект бронирования с обновлёнными данными.
+            booking (Payload): Объект бронирования с обновлёнными данными или готовое JSON тело.
             route (str): Относительный путь API для обновления бронирования.
-            token (str): Токен аутентификации пользователя.
+            token (Optional[str]): Токен аутентификации пользователя. По умолчанию берётся из token_provider.
 
         Returns:
             Booking: Обновлённый объект бронирования.
@@ -85,21 +505,78 @@ class BookerClient:
             RuntimeError: В случае ошибки API.
             ValueError: При ошибке валидации ответа.
         """
-        headers = {"Content-Type": "application/json", "Cookie": f"token={token}"}
-        response = self.client.put(
-            route,
-            content=booking.model_dump_json(by_alias=True),
-            headers=headers
-        )
-        return self._handle_response(response, Booking)
+        try:
+            response = self._send_authorized(
+                "PUT",
+                route,
+                token,
+                headers=JSON_HEADERS,
+                content=encode_booking(booking),
+            )
+        finally:
+            self._invalidate_cached(route)
+        return self._handle_response(response, Booking, ValidationLevel.STRICT)
+
+    def patch_booking(self, patch: PatchPayload, route: str, token: Optional[str] = None) -> Booking:
+        """
+        Частично обновляет бронирование: PATCH передаёт только заданные поля.
+
+        Args:
+            patch (PatchPayload): Изменение бронирования или готовое JSON тело.
+            route (str): Относительный путь API для обновления бронирования.
+            token (Optional[str]): Токен аутентификации пользователя. По умолчанию берётся из token_provider.
+
+        Returns:
+            Booking: Обновлённый объект бронирования.
+
+        Raises:
+            RuntimeError: В случае ошибки API.
+            ValueError: При ошибке валидации ответа.
+        """
+        try:
+            response = self._send_authorized(
+                "PATCH",
+                route,
+                token,
+                headers=JSON_HEADERS,
+                content=encode_patch(patch),
+            )
+        finally:
+            self._invalidate_cached(route)
+        return self._handle_response(response, Booking, ValidationLevel.STRICT)
+
+    def patch_booking_diff(self, original: Booking, updated: Booking, route: str,
+                           token: Optional[str] = None) -> Booking:
+        """
+        Отправляет минимальное изменение, переводящее original в updated.
+
+        Если бронирования совпадают, запрос не выполняется и возвращается updated.
+
+        Args:
+            original (Booking): Текущее бронирование.
+            updated (Booking): Желаемое бронирование.
+            route (str): Относительный путь API для обновления бронирования.
+            token (Optional[str]): Токен аутентификации пользователя. По умолчанию берётся из token_provider.
+
+        Returns:
+            Booking: Обновлённый объект бронирования.
+
+        Raises:
+            RuntimeError: В случае ошибки API.
+            ValueError: При ошибке валидации ответа.
+        """
+        patch = BookingPatch.diff(original, updated)
+        if not patch:
+            return updated
+        return self.patch_booking(patch, route, token)
 
-    def delete_booking(self, route: str, token: str) -> Optional[int]:
+    def delete_booking(self, route: str, token: Optional[str] = None) -> Optional[int]:
         """
         Удаляет бронирование.
 
         Args:
            route (str): Относительный путь API для удаления бронирования.
-           token (str): Токен аутентификации пользователя.
+           token (Optional[str]): Токен аутентификации пользователя. По умолчанию берётся из token_provider.
 
         Returns:
            Optional[int]: Код статуса 201 при успешном удалении, иначе None.
@@ -107,12 +584,11 @@ class BookerClient:
         Raises:
            RuntimeError: В случае ошибки API.
         """
-        headers = {"Cookie": f"token={token}"}
-        response = self.client.delete(route, headers=headers)
-        if response.status_code == 201:
-            return response.status_code
-        else:
-            self._handle_error(response)
+        try:
+            response = self._send_authorized("DELETE", route, token)
+        finally:
+            self._invalidate_cached(route)
+        return self._handle_delete(response)
 
     def authenticate(self, user_name:str, password: str, route: str) -> AuthResponse:
         """
@@ -131,58 +607,525 @@ class BookerClient:
             ValueError: При ошибке валидации ответа.
         """
         auth_request = AuthRequest(username=user_name, password=password)
-        response = self.client.post(route, json=auth_request.model_dump(by_alias=True))
-        return self._handle_response(response, AuthResponse)
+        response = self._request("POST", route, json=auth_request.model_dump(by_alias=True))
+        return self._handle_response(response, AuthResponse, ValidationLevel.STRICT)
 
-    def _handle_response(self, response: httpx.Response, model):
+    def create_many(self, bookings: Iterable[Payload], route: str = Routes.BOOKING,
+                    max_workers: int = DEFAULT_BULK_WORKERS) -> BulkResult[Payload, BookingResponse]:
         """
-        Обрабатывает ответ API, валидирует и преобразует в модель Pydantic.
+        Создаёт бронирования пакетом в пуле потоков поверх общего пула соединений.
 
         Args:
-            response (httpx.Response): HTTP ответ от API.
-            model (BaseModel): Pydantic модель для валидации и парсинга.
+            bookings (Iterable[Payload]): Бронирования или готовые JSON тела для создания.
+            route (str): Относительный путь API для создания бронирования.
+            max_workers (int): Число потоков.
 
         Returns:
-            BaseModel: Валидированный объект pydantic модели.
+            BulkResult: Результаты в порядке входных данных с ошибками по каждому элементу.
+        """
+        return run_bulk(lambda booking: self.create_booking(booking, route), bookings, max_workers)
+
+    def get_many(self, booking_ids: Iterable[int],
+                 max_workers: int = DEFAULT_BULK_WORKERS) -> BulkResult[int, Booking]:
+        """
+        Получает бронирования по списку ID пакетом.
+
+        Args:
+            booking_ids (Iterable[int]): ID бронирований.
+            max_workers (int): Число потоков.
+
+        Returns:
+            BulkResult: Результаты в порядке входных данных с ошибками по каждому элементу.
+        """
+        return run_bulk(lambda booking_id: self.get_booking(Routes.booking_by_id(booking_id)),
+                        booking_ids, max_workers)
+
+    def delete_many(self, booking_ids: Iterable[int], token: Optional[str] = None,
+                    max_workers: int = DEFAULT_BULK_WORKERS) -> BulkResult[int, Optional[int]]:
+        """
+        Удаляет бронирования по списку ID пакетом.
+
+        Args:
+            booking_ids (Iterable[int]): ID бронирований.
+            token (Optional[str]): Токен аутентификации. По умолчанию берётся из token_provider.
+            max_workers (int): Число потоков.
+
+        Returns:
+            BulkResult: Результаты в порядке входных данных с ошибками по каждому элементу.
+        """
+        return run_bulk(lambda booking_id: self.delete_booking(Routes.booking_by_id(booking_id), token),
+                        booking_ids, max_workers)
+
+    def close(self) -> None:
+        """
+        Закрывает HTTP клиент, освобождая ресурсы.
+        """
+        self.client.close()
+
+
+class AsyncBookerClient(_ResponseHandlerMixin):
+    """
+    Асинхронный клиент API бронирований на базе httpx.AsyncClient.
+
+    Повторяет методы BookerClient. Количество одновременно выполняемых запросов
+    ограничивается семафором, поэтому сотни бронирований можно запускать через
+    asyncio.gather: их задержки перекрываются, а не складываются.
+    """
+
+    def __init__(self, base_url: Optional[str] = None, max_concurrency: Optional[int] = None,
+                 token_provider: Optional[TokenProvider] = None, cache: Optional[ResponseCache] = None,
+                 transport: Optional[httpx.AsyncBaseTransport] = None, metrics: Optional[RequestMetrics] = None,
+                 resilience: Optional[ResiliencePolicy] = None,
+                 validation: ValidationLevel = ValidationLevel.STRICT,
+                 concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None):
+        """
+        Инициализирует AsyncBookerClient.
+
+        Пул соединений, таймауты и HTTP/2 настраиваются через Settings (переменные окружения).
+
+        Args:
+           base_url (Optional[str]): Базовый URL API. По умолчанию берётся из настроек.
+           max_concurrency (Optional[int]): Максимальное число одновременных запросов.
+               По умолчанию равно settings.max_connections.
+           token_provider (Optional[TokenProvider]): Провайдер токенов для изменяющих запросов,
+               вызываемых без явного токена.
+           cache (Optional[ResponseCache]): Кэш ответов get_booking. По умолчанию отключён.
+           transport (Optional[httpx.AsyncBaseTransport]): HTTP транспорт, например FakeRestfulBooker.
+           metrics (Optional[RequestMetrics]): Сборщик метрик запросов. По умолчанию отключён.
+           resilience (Optional[ResiliencePolicy]): Политика повторов, ограничения частоты
+               и автоматического выключателя. По умолчанию отключена.
+           validation (ValidationLevel): Уровень валидации ответов get_booking и get_booking_ids.
+               Остальные методы всегда валидируют ответы полностью.
+           concurrency_limiter (Optional[AdaptiveConcurrencyLimiter]): Адаптивный ограничитель
+               одновременных запросов внутри max_concurrency. По умолчанию отключён.
 
         Raises:
-            RuntimeError: Если ответ содержит ошибку.
-            ValueError: Если валидация ответа не удалась.
+           ValueError: Если max_concurrency меньше 1 или base_url не передан и BASE_URL не задан.
         """
-        if response.status_code == 200:
-            try:
-                data = response.json()
-            except Exception as e:
-                raise RuntimeError(f"Ошибка парсинга JSON: {e}, ответ: {response.text}")
-            if isinstance(data, dict) and "reason" in data:
-                raise RuntimeError(f"API Ошибка: {data['reason']}")
-            try:
-                return model.model_validate(response.json(), by_alias=True)
-            except ValidationError as e:
-                raise ValueError(f"Ошибка валидации ответа: {e}")
+        import asyncio
+
+        config = _settings()
+        base_url = config.require("base_url") if base_url is None else base_url
+        max_concurrency = config.max_connections if max_concurrency is None else max_concurrency
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency должен быть не меньше 1")
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            transport=transport,
+            event_hooks=metrics.async_event_hooks() if metrics is not None else None,
+            # Одно соединение сверх семафора: открытый поток iter_booking_ids не занимает слот
+            # семафора, и запросы потребителя потока не ждут освобождения пула.
+            **_http_options(config, max_connections=max_concurrency + 1),
+        )
+        self.base_url = base_url
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.token_provider = token_provider
+        self.cache = cache
+        self.metrics = metrics
+        self.resilience = resilience
+        self.validation = ValidationLevel(validation)
+        self.concurrency_limiter = concurrency_limiter
+
+    async def _request(self, method: str, route: str, stream: bool = False, **kwargs) -> httpx.Response:
+        """
+        Выполняет HTTP запрос с учётом ограничения параллельности и политики устойчивости.
+
+        Args:
+            method (str): HTTP метод.
+            route (str): Относительный путь API.
+            stream (bool): Не читать тело ответа. Слот семафора занят только до получения
+                заголовков; вызывающий читает и закрывает ответ сам и фиксирует метрики.
+            **kwargs: Дополнительные аргументы httpx.AsyncClient.build_request.
+
+        Returns:
+            httpx.Response: HTTP ответ от API.
+        """
+        if self.resilience is None:
+            return await self._send(method, route, stream, **kwargs)
+        return await self.resilience.call_async(
+            method, self.client.base_url.host, lambda: self._send(method, route, stream, **kwargs)
+        )
+
+    async def _send(self, method: str, route: str, stream: bool = False, **kwargs) -> httpx.Response:
+        request = self.client.build_request(method, route, **kwargs)
+        limiter = self.concurrency_limiter
+        if limiter is None:
+            async with self._semaphore:
+                response = await self.client.send(request, stream=stream)
         else:
-            self._handle_error(response)
+            await limiter.acquire_async()
+            started, response = time.perf_counter(), None
+            try:
+                async with self._semaphore:
+                    response = await self.client.send(request, stream=stream)
+            finally:
+                limiter.release(time.perf_counter() - started, response.status_code if response is not None else None)
+        if self.metrics is not None and not stream:
+            self.metrics.complete(response)
+        return response
 
-    def _handle_error(self, response: httpx.Response) -> None:
+    async def _send_authorized(self, method: str, route: str, token: Optional[str],
+                               headers: Optional[dict] = None, **kwargs) -> httpx.Response:
         """
-        Обрабатывает ошибочный ответ API и выбрасывает исключение.
+        Выполняет запрос с cookie токена; семантика совпадает с BookerClient._send_authorized.
 
         Args:
-            response (httpx.Response): HTTP ответ с ошибкой.
+            method (str): HTTP метод.
+            route (str): Относительный путь API.
+            token (Optional[str]): Токен аутентификации или None для использования token_provider.
+            headers (Optional[dict]): Дополнительные заголовки.
+            **kwargs: Дополнительные аргументы httpx.AsyncClient.request.
+
+        Returns:
+            httpx.Response: HTTP ответ от API.
+        """
+        managed = token is None
+        if managed:
+            if self.token_provider is None:
+                raise ValueError("Токен не передан и token_provider не настроен")
+            token = await self.token_provider.get_token_async(self)
+        response = await self._request(method, route, headers=_with_token(headers, token), **kwargs)
+        if managed and response.status_code == 403:
+            self.token_provider.invalidate(token)
+            token = await self.token_provider.get_token_async(self)
+            response = await self._request(method, route, headers=_with_token(headers, token), **kwargs)
+        return response
+
+    async def get_booking_ids(self, route: str,
+                              validation: Optional[ValidationLevel] = None) -> Union[List[BookingItem], List[dict]]:
+        """
+        Получает список ID бронирований.
+
+        Args:
+            route (str): Относительный путь API для получения списка бронирований.
+            validation (Optional[ValidationLevel]): Уровень валидации. По умолчанию уровень клиента.
+
+        Returns:
+            List[BookingItem]: Список объектов BookingItem с ID бронирований; для уровней
+                lenient и trusted — список словарей {"bookingid": ...}.
+        """
+        response = await self._request("GET", route)
+        return self._handle_response(response, BookingItemList, validation)
+
+    async def get_booking_ids_compact(self, route: str) -> BookingIdSet:
+        """
+        Получает список ID бронирований в компактном виде без объектов BookingItem.
+
+        Args:
+            route (str): Относительный путь API для получения списка бронирований.
+
+        Returns:
+            BookingIdSet: Отсортированный набор ID на базе array('q').
 
         Raises:
-            RuntimeError: Исключение с описанием ошибки.
+            RuntimeError: В случае ошибки API.
+        """
+        response = await self._request("GET", route)
+        return self._handle_id_set(response)
+
+    async def search_booking_ids(self, search: BookingSearch, route: str = Routes.BOOKING) -> BookingIdSet:
+        """
+        Ищет ID бронирований с фильтрами firstname, lastname, checkin и checkout на стороне API.
+
+        Args:
+            search (BookingSearch): Фильтры поиска; незаданные фильтры не передаются.
+            route (str): Относительный путь API для получения списка бронирований.
+
+        Returns:
+            BookingIdSet: Набор ID найденных бронирований.
+
+        Raises:
+            RuntimeError: В случае ошибки API.
         """
+        response = await self._request("GET", route, params=search.to_params())
+        return self._handle_id_set(response)
+
+    async def iter_booking_ids(self, route: str,
+                               batch_size: Optional[int] = None) -> AsyncIterator[Union[int, List[int]]]:
+        """
+        Потоково получает ID бронирований, разбирая тело ответа по мере загрузки.
+
+        Слот семафора занят только до получения заголовков, поэтому потребитель потока
+        может вызывать методы клиента для каждого ID даже при max_concurrency=1.
+
+        Args:
+            route (str): Относительный путь API для получения списка бронирований.
+            batch_size (Optional[int]): Размер пачки. Если не задан, ID выдаются по одному.
+
+        Yields:
+            Union[int, List[int]]: ID бронирования или пачка ID.
+
+        Raises:
+            RuntimeError: В случае ошибки API или оборванного ответа.
+        """
+        response = await self._request("GET", route, stream=True)
+        batch: List[int] = []
         try:
-            error = ErrorResponse.model_validate(response.json())
-            reason = error.message
-        except (ValueError, ValidationError) as e:
-            logging.warning(f"Ошибка парсинга ответа API: {e}")
-            reason = response.text
-        raise RuntimeError(f"HTTP Ошибка {response.status_code}: {reason}")
+            if response.status_code != 200:
+                await response.aread()
+                self._handle_error(response)
+            parser = BookingIdStreamParser()
+            async for chunk in response.aiter_bytes():
+                for booking_id in parser.feed(chunk):
+                    if batch_size is None:
+                        yield booking_id
+                        continue
+                    batch.append(booking_id)
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+            parser.close()
+        finally:
+            await response.aclose()
+            if self.metrics is not None:
+                self.metrics.complete(response)
+        if batch:
+            yield batch
 
-    def close(self) -> None:
+    async def create_booking(self, booking: Payload, route: str) -> BookingResponse:
         """
-        Закрывает HTTP клиент, освобождая ресурсы.
+        Создаёт новое бронирование.
+
+        Args:
+          booking (Payload): Объект бронирования для создания или готовое JSON тело
+            (например, результат encode_booking, сохранённый на весь прогон, или тело из BookingFactory).
+          route (str): Относительный путь API для создания бронирования.
+        Returns:
+          BookingResponse: Ответ с информацией о созданном бронировании.
+        Raises:
+          RuntimeError: В случае ошибки API.
+          ValueError: При ошибке валидации ответа.
+        """
+        response = await self._request(
+            "POST",
+            route,
+            content=encode_booking(booking),
+            headers=JSON_HEADERS,
+        )
+        return self._handle_response(response, BookingResponse, ValidationLevel.STRICT)
+
+    async def get_booking(self, route: str, validation: Optional[ValidationLevel] = None) -> Union[Booking, dict]:
+        """
+        Получает данные бронирования.
+
+        Args:
+            route (str): Относительный путь API для получения бронирования.
+            validation (Optional[ValidationLevel]): Уровень валидации. По умолчанию уровень клиента.
+
+        Returns:
+            Booking: Объект бронирования; для уровней lenient и trusted — словарь с ключами как в JSON.
+
+        Raises:
+            RuntimeError: В случае ошибки API.
+            ValueError: При ошибке валидации ответа.
+        """
+        if self.cache is None or not self._cacheable(validation):
+            response = await self._request("GET", route)
+            return self._handle_response(response, Booking, validation)
+        entry = self.cache.lookup(route)
+        if entry is not None and entry.fresh:
+            return entry.value
+        response = await self._request("GET", route, headers=_conditional_headers(entry))
+        return self._handle_cached_response(response, Booking, route, entry, validation)
+
+    async def update_booking(self, booking: Payload, route: str, token: Optional[str] = None) -> Booking:
         """
-        self.client.close()
\ No newline at end of file
+        Обновляет существующее бронирование.
+
+        Args:
+            booking (Payload): Объект бронирования с обновлёнными данными или готовое JSON тело.
+            route (str): Относительный путь API для обновления бронирования.
+            token (Optional[str]): Токен аутентификации пользователя. По умолчанию берётся из token_provider.
+
+        Returns:
+            Booking: Обновлённый объект бронирования.
+
+        Raises:
+            RuntimeError: В случае ошибки API.
+            ValueError: При ошибке валидации ответа.
+        """
+        try:
+            response = await self._send_authorized(
+                "PUT",
+                route,
+                token,
+                headers=JSON_HEADERS,
+                content=encode_booking(booking),
+            )
+        finally:
+            self._invalidate_cached(route)
+        return self._handle_response(response, Booking, ValidationLevel.STRICT)
+
+    async def patch_booking(self, patch: PatchPayload, route: str, token: Optional[str] = None) -> Booking:
+        """
+        Частично обновляет бронирование: PATCH передаёт только заданные поля.
+
+        Args:
+            patch (PatchPayload): Изменение бронирования или готовое JSON тело.
+            route (str): Относительный путь API для обновления бронирования.
+            token (Optional[str]): Токен аутентификации пользователя. По умолчанию берётся из token_provider.
+
+        Returns:
+            Booking: Обновлённый объект бронирования.
+
+        Raises:
+            RuntimeError: В случае ошибки API.
+            ValueError: При ошибке валидации ответа.
+        """
+        try:
+            response = await self._send_authorized(
+                "PATCH",
+                route,
+                token,
+                headers=JSON_HEADERS,
+                content=encode_patch(patch),
+            )
+        finally:
+            self._invalidate_cached(route)
+        return self._handle_response(response, Booking, ValidationLevel.STRICT)
+
+    async def patch_booking_diff(self, original: Booking, updated: Booking, route: str,
+                                 token: Optional[str] = None) -> Booking:
+        """
+        Отправляет минимальное изменение, переводящее original в updated.
+
+        Если бронирования совпадают, запрос не выполняется и возвращается updated.
+
+        Args:
+            original (Booking): Текущее бронирование.
+            updated (Booking): Желаемое бронирование.
+            route (str): Относительный путь API для обновления бронирования.
+            token (Optional[str]): Токен аутентификации пользователя. По умолчанию берётся из token_provider.
+
+        Returns:
+            Booking: Обновлённый объект бронирования.
+
+        Raises:
+            RuntimeError: В случае ошибки API.
+            ValueError: При ошибке валидации ответа.
+        """
+        patch = BookingPatch.diff(original, updated)
+        if not patch:
+            return updated
+        return await self.patch_booking(patch, route, token)
+
+    async def delete_booking(self, route: str, token: Optional[str] = None) -> Optional[int]:
+        """
+        Удаляет бронирование.
+
+        Args:
+           route (str): Относительный путь API для удаления бронирования.
+           token (Optional[str]): Токен аутентификации пользователя. По умолчанию берётся из token_provider.
+
+        Returns:
+           Optional[int]: Код статуса 201 при успешном удалении, иначе None.
+
+        Raises:
+           RuntimeError: В случае ошибки API.
+        """
+        try:
+            response = await self._send_authorized("DELETE", route, token)
+        finally:
+            self._invalidate_cached(route)
+        return self._handle_delete(response)
+
+    async def authenticate(self, user_name: str, password: str, route: str) -> AuthResponse:
+        """
+        Аутентифицирует пользователя и получает токен.
+
+        Args:
+            user_name (str): Имя пользователя.
+            password (str): Пароль пользователя.
+            route (str): Относительный путь API для аутентификации.
+
+        Returns:
+            AuthResponse: Объект с токеном аутентификации.
+
+        Raises:
+            RuntimeError: В случае ошибки API.
+            ValueError: При ошибке валидации ответа.
+        """
+        auth_request = AuthRequest(username=user_name, password=password)
+        response = await self._request("POST", route, json=auth_request.model_dump(by_alias=True))
+        return self._handle_response(response, AuthResponse, ValidationLevel.STRICT)
+
+    async def create_many(self, bookings: Iterable[Payload],
+                          route: str = Routes.BOOKING) -> BulkResult[Payload, BookingResponse]:
+        """
+        Создаёт бронирования пакетом; параллельность ограничена max_concurrency.
+
+        Args:
+            bookings (Iterable[Payload]): Бронирования или готовые JSON тела для создания.
+            route (str): Относительный путь API для создания бронирования.
+
+        Returns:
+            BulkResult: Результаты в порядке входных данных с ошибками по каждому элементу.
+        """
+        return await run_bulk_async(lambda booking: self.create_booking(booking, route), bookings)
+
+    async def get_many(self, booking_ids: Iterable[int]) -> BulkResult[int, Booking]:
+        """
+        Получает бронирования по списку ID пакетом.
+
+        Args:
+            booking_ids (Iterable[int]): ID бронирований.
+
+        Returns:
+            BulkResult: Результаты в порядке входных данных с ошибками по каждому элементу.
+        """
+        return await run_bulk_async(lambda booking_id: self.get_booking(Routes.booking_by_id(booking_id)),
+                                    booking_ids)
+
+    async def delete_many(self, booking_ids: Iterable[int], token: Optional[str] = None) -> BulkResult[int, Optional[int]]:
+        """
+        Удаляет бронирования по списку ID пакетом.
+
+        Args:
+            booking_ids (Iterable[int]): ID бронирований.
+            token (Optional[str]): Токен аутентификации. По умолчанию берётся из token_provider.
+
+        Returns:
+            BulkResult: Результаты в порядке входных данных с ошибками по каждому элементу.
+        """
+        return await run_bulk_async(
+            lambda booking_id: self.delete_booking(Routes.booking_by_id(booking_id), token), booking_ids
+        )
+
+    async def close(self) -> None:
+        """
+        Закрывает асинхронный HTTP клиент, освобождая ресурсы.
+        """
+        await self.client.aclose()
+
+    async def warm_up(self, connections: Optional[int] = None) -> int:
+        """
+        Заранее открывает соединения параллельными запросами GET /ping.
+
+        Args:
+            connections (Optional[int]): Число соединений. По умолчанию берётся из настроек.
+
+        Returns:
+            int: Число успешных запросов прогрева.
+        """
+        import asyncio
+
+        connections = _settings().warmup_connections if connections is None else connections
+        if connections <= 0:
+            return 0
+        return sum(await asyncio.gather(*(self._ping() for _ in range(connections))))
+
+    async def _ping(self) -> bool:
+        try:
+            await self.client.get(Routes.PING)
+            return True
+        except httpx.HTTPError as e:
+            logging.warning(f"Ошибка прогрева соединения: {e}")
+            return False
+
+    async def __aenter__(self) -> "AsyncBookerClient":
+        await self.warm_up()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
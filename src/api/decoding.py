@@ -0,0 +1,132 @@
+#src/api/decoding.py
+import json
+from enum import Enum
+from functools import lru_cache
+from typing import Any, List, Optional, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import from_json
+from typing_extensions import NotRequired, TypedDict
+
+from src.api.models import BookingItem
+
+BookingItemList = List[BookingItem]
+
+_REASON_MARKER = b'"reason"'
+
+
+class ValidationLevel(str, Enum):
+    """
+    Уровень валидации ответов API.
+
+    STRICT — полная валидация в модели: типы, ограничения (min_length, ge), extra="forbid"
+    и валидаторы полей (например, BookingDates.validate_dates).
+    LENIENT — словари с ключами как в JSON, у которых проверены и приведены только типы полей
+    (даты разбираются в date); ограничения, валидаторы и лишние поля пропускаются.
+    TRUSTED — словари как есть после разбора JSON, без проверки типов; даты остаются строками.
+
+    Основная стоимость STRICT — создание объектов моделей, а не проверки, поэтому LENIENT и
+    TRUSTED возвращают словари: model_construct в Python медленнее валидации в pydantic-core.
+    """
+    STRICT = "strict"
+    LENIENT = "lenient"
+    TRUSTED = "trusted"
+
+
+@lru_cache(maxsize=None)
+def get_adapter(target: Any) -> TypeAdapter:
+    """
+    Возвращает закэшированный TypeAdapter для типа.
+
+    Построение TypeAdapter дорогое, поэтому для каждого типа оно выполняется один раз.
+
+    Args:
+        target (Any): Pydantic модель или аннотация типа (например, List[BookingItem]).
+
+    Returns:
+        TypeAdapter: Адаптер для валидации данных.
+    """
+    return TypeAdapter(target)
+
+
+def probe_error_reason(content: bytes) -> Optional[str]:
+    """
+    Проверяет, является ли тело ответа ошибкой вида {"reason": "..."}.
+
+    Сначала выполняется дешёвый поиск подстроки; JSON разбирается только если маркер найден,
+    поэтому обычные ответы не парсятся повторно.
+
+    Args:
+        content (bytes): Тело ответа.
+
+    Returns:
+        Optional[str]: Текст ошибки или None, если тело не является ошибкой.
+    """
+    if _REASON_MARKER not in content:
+        return None
+    try:
+        data = json.loads(content)
+    except ValueError:
+        return None
+    if isinstance(data, dict) and "reason" in data:
+        return str(data["reason"])
+    return None
+
+
+def _is_model(target: Any) -> bool:
+    return isinstance(target, type) and issubclass(target, BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _lenient_type(target: Any) -> Any:
+    """
+    Возвращает облегчённую схему для target: TypedDict с ключами-алиасами и типами полей
+    без ограничений и валидаторов; лишние ключи игнорируются.
+    """
+    if _is_model(target):
+        fields = {}
+        for name, field in target.model_fields.items():
+            annotation = _lenient_type(field.annotation)
+            fields[field.alias or name] = annotation if field.is_required() else NotRequired[annotation]
+        return TypedDict(f"Lenient{target.__name__}", fields)
+    origin = get_origin(target)
+    if origin is list:
+        return List[_lenient_type(get_args(target)[0])]
+    if origin is Union:
+        return Union[tuple(_lenient_type(arg) for arg in get_args(target))]
+    return target
+
+
+def decode_json(content: bytes, target: Any, level: ValidationLevel = ValidationLevel.STRICT) -> Any:
+    """
+    Валидирует сырые байты ответа за один проход через TypeAdapter.validate_json.
+
+    Args:
+        content (bytes): Тело ответа.
+        target (Any): Pydantic модель или аннотация типа.
+        level (ValidationLevel): Уровень валидации.
+
+    Returns:
+        Any: Валидированный объект (STRICT) или словари с ключами как в JSON (LENIENT, TRUSTED).
+
+    Raises:
+        RuntimeError: Если тело не является корректным JSON или содержит ошибку API.
+        ValueError: Если валидация не удалась.
+    """
+    reason = probe_error_reason(content)
+    if reason is not None:
+        raise RuntimeError(f"API Ошибка: {reason}")
+    level = ValidationLevel(level)
+    if level is ValidationLevel.TRUSTED:
+        try:
+            return from_json(content)
+        except ValueError as e:
+            raise RuntimeError(f"Ошибка парсинга JSON: {e}, ответ: {content.decode(errors='replace')}")
+    try:
+        if level is ValidationLevel.LENIENT:
+            return get_adapter(_lenient_type(target)).validate_json(content)
+        return get_adapter(target).validate_json(content, by_alias=True)
+    except ValidationError as e:
+        if any(error["type"] == "json_invalid" for error in e.errors()):
+            raise RuntimeError(f"Ошибка парсинга JSON: {e}, ответ: {content.decode(errors='replace')}")
+        raise ValueError(f"Ошибка валидации ответа: {e}")
@@ -0,0 +1,43 @@
+#src/api/encoding.py
+from typing import Union
+
+from src.api.models import Booking, BookingPatch
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+Payload = Union[Booking, bytes]
+
+PatchPayload = Union[BookingPatch, bytes]
+
+
+def encode_booking(booking: Payload) -> bytes:
+    """
+    Сериализует бронирование в тело запроса.
+
+    Готовые байты передаются без изменений: тело, неизменное на протяжении прогона,
+    достаточно сериализовать один раз и передавать в create_booking/update_booking.
+
+    Args:
+        booking (Payload): Бронирование или заранее сериализованное тело.
+
+    Returns:
+        bytes: JSON тело запроса.
+    """
+    if isinstance(booking, bytes):
+        return booking
+    return booking.__pydantic_serializer__.to_json(booking, by_alias=True)
+
+
+def encode_patch(patch: PatchPayload) -> bytes:
+    """
+    Сериализует частичное изменение бронирования: в тело попадают только заданные поля.
+
+    Args:
+        patch (PatchPayload): Изменение или заранее сериализованное тело.
+
+    Returns:
+        bytes: JSON тело запроса.
+    """
+    if isinstance(patch, bytes):
+        return patch
+    return patch.__pydantic_serializer__.to_json(patch, by_alias=True, exclude_unset=True)
@@ -0,0 +1,307 @@
+#src/api/metrics.py
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from src.load.histogram import LatencyHistogram
+
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+_TIMING_EXTENSION = "booker_metrics"
+PHASES = ("connect", "tls", "ttfb", "total", "validation")
+
+
+def route_template(path: str) -> str:
+    """
+    Заменяет числовые сегменты пути шаблоном, например /booking/42 -> /booking/{id}.
+
+    Args:
+        path (str): Путь запроса.
+
+    Returns:
+        str: Шаблон маршрута.
+    """
+    return _NUMERIC_SEGMENT.sub("/{id}", path)
+
+
+def _response_bytes(response: httpx.Response) -> int:
+    """
+    Возвращает размер тела ответа: загруженные байты, а для ответов, созданных транспортом
+    в памяти (FakeRestfulBooker, MockTransport) с уже готовым телом, — длину тела.
+    """
+    if response.num_bytes_downloaded:
+        return response.num_bytes_downloaded
+    try:
+        return len(response.content)
+    except httpx.ResponseNotRead:
+        return 0
+
+
+class _RequestTiming:
+    """
+    Временные метки одного запроса, собираемые хуками httpx и trace расширением httpcore.
+    """
+    __slots__ = ("started", "headers_at", "events", "completed")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.headers_at: Optional[float] = None
+        self.events: Dict[str, float] = {}
+        self.completed = False
+
+    def trace(self, name: str, info: dict) -> None:
+        self.events[name.split(".", 1)[-1]] = time.perf_counter()
+
+    async def atrace(self, name: str, info: dict) -> None:
+        self.trace(name, info)
+
+    def phase(self, name: str) -> Optional[float]:
+        started = self.events.get(f"{name}.started")
+        completed = self.events.get(f"{name}.complete")
+        if started is None or completed is None:
+            return None
+        return completed - started
+
+
+@dataclass
+class RouteStats:
+    """
+    Агрегированные метрики одного маршрута (метод + шаблон пути).
+
+    Атрибуты:
+       statuses (Dict[int, int]): Число ответов по кодам статуса.
+       phases (Dict[str, LatencyHistogram]): Гистограммы длительности фаз запроса.
+       request_bytes (int): Суммарный размер тел запросов.
+       response_bytes (int): Суммарный размер тел ответов.
+    """
+    statuses: Dict[int, int] = field(default_factory=dict)
+    phases: Dict[str, LatencyHistogram] = field(default_factory=dict)
+    request_bytes: int = 0
+    response_bytes: int = 0
+
+    def observe_phase(self, phase: str, seconds: Optional[float]) -> None:
+        if seconds is not None:
+            self.phases.setdefault(phase, LatencyHistogram()).record(seconds)
+
+    @property
+    def count(self) -> int:
+        return sum(self.statuses.values())
+
+
+class RequestMetrics:
+    """
+    Сборщик метрик запросов BookerClient на основе event hooks httpx.
+
+    Для каждого запроса фиксируются шаблон маршрута, метод, статус, длительности фаз
+    (connect, tls, ttfb, total) и размеры тел запроса и ответа, а также время валидации
+    ответа в _handle_response. Фазы connect и tls берутся из trace расширения httpcore и
+    доступны только для сетевого транспорта; DNS-резолвинг входит в connect, так как
+    httpcore выполняет его внутри установки TCP соединения.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: Dict[Tuple[str, str], RouteStats] = {}
+        self._children: List["RequestMetrics"] = []
+
+    def event_hooks(self) -> dict:
+        """
+        Возвращает event hooks для httpx.Client.
+        """
+        return {"request": [self._on_request], "response": [self._on_response]}
+
+    def async_event_hooks(self) -> dict:
+        """
+        Возвращает event hooks для httpx.AsyncClient.
+        """
+        async def on_request(request: httpx.Request) -> None:
+            self._on_request(request, asynchronous=True)
+
+        async def on_response(response: httpx.Response) -> None:
+            self._on_response(response)
+
+        return {"request": [on_request], "response": [on_response]}
+
+    def _on_request(self, request: httpx.Request, asynchronous: bool = False) -> None:
+        timing = _RequestTiming()
+        request.extensions[_TIMING_EXTENSION] = timing
+        request.extensions.setdefault("trace", timing.atrace if asynchronous else timing.trace)
+
+    def _on_response(self, response: httpx.Response) -> None:
+        timing = response.request.extensions.get(_TIMING_EXTENSION)
+        if timing is not None:
+            timing.headers_at = time.perf_counter()
+
+    def complete(self, response: httpx.Response) -> None:
+        """
+        Фиксирует метрики запроса после чтения тела ответа.
+
+        Повторный вызов для того же ответа игнорируется.
+
+        Args:
+            response (httpx.Response): Прочитанный HTTP ответ.
+        """
+        request = response.request
+        timing = request.extensions.get(_TIMING_EXTENSION)
+        if timing is None or timing.completed:
+            return
+        timing.completed = True
+        finished = time.perf_counter()
+        key = (request.method, route_template(request.url.path))
+        phases = {
+            "connect": timing.phase("connect_tcp"),
+            "tls": timing.phase("start_tls"),
+            "ttfb": timing.headers_at - timing.started if timing.headers_at is not None else None,
+            "total": finished - timing.started,
+        }
+        request_bytes = len(request.content) if isinstance(request.stream, httpx.ByteStream) else 0
+        response_bytes = _response_bytes(response)
+        for collector in self._collectors():
+            with collector._lock:
+                stats = collector._routes.setdefault(key, RouteStats())
+                stats.statuses[response.status_code] = stats.statuses.get(response.status_code, 0) + 1
+                for phase, seconds in phases.items():
+                    stats.observe_phase(phase, seconds)
+                stats.request_bytes += request_bytes
+                stats.response_bytes += response_bytes
+
+    def observe_validation(self, response: httpx.Response, seconds: float) -> None:
+        """
+        Учитывает время валидации ответа для маршрута запроса.
+
+        Args:
+            response (httpx.Response): HTTP ответ.
+            seconds (float): Время валидации в секундах.
+        """
+        key = (response.request.method, route_template(response.request.url.path))
+        for collector in self._collectors():
+            with collector._lock:
+                collector._routes.setdefault(key, RouteStats()).observe_phase("validation", seconds)
+
+    def _collectors(self) -> List["RequestMetrics"]:
+        with self._lock:
+            return [self, *self._children]
+
+    @contextmanager
+    def capture(self) -> Iterator["RequestMetrics"]:
+        """
+        Временно подключает дочерний сборщик, получающий те же наблюдения.
+
+        Используется для метрик отдельного теста без сброса общих метрик сессии.
+
+        Yields:
+            RequestMetrics: Дочерний сборщик.
+        """
+        child = RequestMetrics()
+        with self._lock:
+            self._children.append(child)
+        try:
+            yield child
+        finally:
+            with self._lock:
+                self._children.remove(child)
+
+    def reset(self) -> None:
+        """
+        Сбрасывает накопленные метрики.
+        """
+        with self._lock:
+            self._routes.clear()
+
+    def snapshot(self) -> dict:
+        """
+        Возвращает JSON-совместимый снимок метрик по маршрутам.
+
+        Returns:
+            dict: Метрики вида {"GET /booking/{id}": {...}}.
+        """
+        with self._lock:
+            routes = {key: stats for key, stats in sorted(self._routes.items())}
+            return {
+                f"{method} {route}": {
+                    "count": stats.count,
+                    "statuses": {str(status): count for status, count in sorted(stats.statuses.items())},
+                    "request_bytes": stats.request_bytes,
+                    "response_bytes": stats.response_bytes,
+                    "phases": {phase: stats.phases[phase].summary() for phase in PHASES if phase in stats.phases},
+                }
+                for (method, route), stats in routes.items()
+            }
+
+    def to_prometheus(self, prefix: str = "booker") -> str:
+        """
+        Экспортирует метрики в текстовом формате Prometheus.
+
+        Args:
+            prefix (str): Префикс имён метрик.
+
+        Returns:
+            str: Метрики в формате Prometheus exposition.
+        """
+        requests, durations, transferred = [], [], []
+        with self._lock:
+            for (method, route), stats in sorted(self._routes.items()):
+                labels = f'method="{method}",route="{route}"'
+                for status, count in sorted(stats.statuses.items()):
+                    requests.append(f'{prefix}_requests_total{{{labels},status="{status}"}} {count}')
+                for phase in PHASES:
+                    histogram = stats.phases.get(phase)
+                    if histogram is None:
+                        continue
+                    phase_labels = f'{labels},phase="{phase}"'
+                    for quantile in (0.5, 0.9, 0.99):
+                        durations.append(
+                            f'{prefix}_request_phase_seconds{{{phase_labels},quantile="{quantile}"}} '
+                            f"{histogram.percentile(quantile * 100):.6f}"
+                        )
+                    durations.append(f"{prefix}_request_phase_seconds_sum{{{phase_labels}}} "
+                                     f"{histogram.total_us / 1_000_000:.6f}")
+                    durations.append(f"{prefix}_request_phase_seconds_count{{{phase_labels}}} {histogram.count}")
+                transferred.append(f'{prefix}_request_bytes_total{{{labels},direction="sent"}} {stats.request_bytes}')
+                transferred.append(
+                    f'{prefix}_request_bytes_total{{{labels},direction="received"}} {stats.response_bytes}'
+                )
+        lines = [
+            f"# HELP {prefix}_requests_total Число запросов к API.",
+            f"# TYPE {prefix}_requests_total counter",
+            *requests,
+            f"# HELP {prefix}_request_phase_seconds Длительность фаз запроса.",
+            f"# TYPE {prefix}_request_phase_seconds summary",
+            *durations,
+            f"# HELP {prefix}_request_bytes_total Объём переданных тел запросов и ответов.",
+            f"# TYPE {prefix}_request_bytes_total counter",
+            *transferred,
+        ]
+        return "\n".join(lines) + "\n"
+
+    def format_table(self) -> str:
+        """
+        Возвращает текстовую таблицу задержек по маршрутам.
+        """
+        header = f"{'маршрут':<28}{'n':>6}{'p50, мс':>10}{'p90, мс':>10}{'p99, мс':>10}{'max, мс':>10}{'валид., мс':>12}"
+        lines = [header, "-" * len(header)]
+        for name, data in self.snapshot().items():
+            total = data["phases"].get("total", {})
+            validation = data["phases"].get("validation", {})
+            lines.append(
+                f"{name:<28}{data['count']:>6}{total.get('p50_ms', 0):>10.1f}{total.get('p90_ms', 0):>10.1f}"
+                f"{total.get('p99_ms', 0):>10.1f}{total.get('max_ms', 0):>10.1f}{validation.get('p50_ms', 0):>12.2f}"
+            )
+        return "\n".join(lines)
+
+    def attach_to_allure(self, name: str = "Задержки запросов") -> None:
+        """
+        Прикрепляет таблицу задержек к текущему шагу Allure, если есть хотя бы один запрос.
+
+        Args:
+            name (str): Название вложения.
+        """
+        if not self._routes:
+            return
+        import allure
+
+        allure.attach(self.format_table(), name=name, attachment_type=allure.attachment_type.TEXT)
@@ -2,7 +2,7 @@
 from datetime import date
 from typing import  Optional
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
 
 
 class ParamBaseModel(BaseModel):
@@ -55,6 +55,119 @@ class Booking(ParamBaseModel):
     additional_needs: Optional[str] = Field(default=None, alias="additionalneeds",
                                             description="Дополнительные пожелания клиента")
 
+class BookingSearch(ParamBaseModel):
+    """
+    Фильтры поиска GET /booking, применяемые на стороне API.
+
+    Атрибуты:
+       first_name (Optional[str]): Точное совпадение имени.
+       last_name (Optional[str]): Точное совпадение фамилии.
+       check_in (Optional[date]): Дата заезда не раньше указанной.
+       check_out (Optional[date]): Дата выезда не раньше указанной.
+    """
+    first_name: Optional[str] = Field(default=None, alias="firstname", description="Имя клиента")
+    last_name: Optional[str] = Field(default=None, alias="lastname", description="Фамилия клиента")
+    check_in: Optional[date] = Field(default=None, alias="checkin", description="Минимальная дата заезда")
+    check_out: Optional[date] = Field(default=None, alias="checkout", description="Минимальная дата выезда")
+
+    def to_params(self) -> dict:
+        """
+        Возвращает параметры строки запроса только для заданных фильтров.
+        """
+        return self.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+class BookingDatesPatch(ParamBaseModel):
+    """
+    Частичное изменение дат бронирования: передаются только заданные даты.
+    """
+    check_in: Optional[date] = Field(default=None, alias="checkin", description="Дата заезда")
+    check_out: Optional[date] = Field(default=None, alias="checkout", description="Дата выезда")
+
+    @field_validator("check_out", mode="after")
+    @classmethod
+    def validate_dates(cls, value: Optional[date], info) -> Optional[date]:
+        """
+        Если заданы обе даты, проверяет, что дата выезда позже даты заезда.
+        """
+        return value if value is None else BookingDates.validate_dates(value, info)
+
+class BookingPatch(ParamBaseModel):
+    """
+    Частичное изменение бронирования для PATCH /booking/{id}.
+
+    В тело запроса попадают только явно заданные поля (model_fields_set), поэтому
+    additional_needs=None передаётся как null, а незаданные поля не передаются вовсе.
+    Ограничения полей те же, что у Booking.
+    """
+    first_name: Optional[str] = Field(default=None, min_length=1, alias="firstname", description="Имя клиента")
+    last_name: Optional[str] = Field(default=None, min_length=1, alias="lastname", description="Фамилия клиента")
+    total_price: Optional[float] = Field(default=None, ge=0, alias="totalprice",
+                                         description="Общая стоимость бронирования")
+    deposit_paid: Optional[bool] = Field(default=None, alias="depositpaid", description="Оплачен ли депозит")
+    booking_dates: Optional[BookingDatesPatch] = Field(default=None, alias="bookingdates",
+                                                       description="Изменяемые даты бронирования")
+    additional_needs: Optional[str] = Field(default=None, alias="additionalneeds",
+                                            description="Дополнительные пожелания клиента")
+
+    @model_validator(mode="after")
+    def forbid_null(self) -> "BookingPatch":
+        """
+        Запрещает явно заданный None для полей, которые в Booking обязательны.
+
+        Raises:
+           ValueError: Если обязательному полю Booking передан None.
+        """
+        nulls = [name for name in self.model_fields_set if name != "additional_needs" and getattr(self, name) is None]
+        if nulls:
+            raise ValueError(f"Поля {', '.join(sorted(nulls))} не могут быть null")
+        return self
+
+    @classmethod
+    def diff(cls, original: Booking, updated: Booking) -> "BookingPatch":
+        """
+        Строит минимальное изменение, переводящее original в updated.
+
+        Args:
+           original (Booking): Текущее бронирование.
+           updated (Booking): Желаемое бронирование.
+
+        Returns:
+           BookingPatch: Изменение только с отличающимися полями; пустое, если бронирования совпадают.
+        """
+        changes = {
+            name: getattr(updated, name) for name in Booking.model_fields
+            if name != "booking_dates" and getattr(original, name) != getattr(updated, name)
+        }
+        dates = {
+            name: getattr(updated.booking_dates, name) for name in BookingDates.model_fields
+            if getattr(original.booking_dates, name) != getattr(updated.booking_dates, name)
+        }
+        if dates:
+            changes["booking_dates"] = BookingDatesPatch(**dates)
+        return cls(**changes)
+
+    def apply(self, booking: Booking) -> Booking:
+        """
+        Применяет изменение к бронированию локально, так же как API применяет PATCH.
+
+        Args:
+           booking (Booking): Исходное бронирование.
+
+        Returns:
+           Booking: Новое бронирование с изменёнными полями.
+
+        Raises:
+           ValueError: Если результат не проходит валидацию Booking.
+        """
+        data = booking.model_dump()
+        changes = self.model_dump(exclude_unset=True)
+        data["booking_dates"].update(changes.pop("booking_dates", {}))
+        data.update(changes)
+        return Booking.model_validate(data)
+
+    def __bool__(self) -> bool:
+        return bool(self.model_fields_set)
+
 class BookingResponse(ParamBaseModel):
     booking_id: int = Field(alias="bookingid", description="Уникальный идентификатор созданного бронирования")
     booking: Booking = Field(..., description="Данные созданного бронирования")
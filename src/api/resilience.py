@@ -0,0 +1,527 @@
+#src/api/resilience.py
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, FrozenSet, Optional
+
+import httpx
+
+
+class CircuitOpenError(RuntimeError):
+    """
+    Исключение, выбрасываемое без обращения к API, пока автоматический выключатель разомкнут.
+    """
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Политика повторов с экспоненциальной задержкой и полным джиттером.
+
+    Атрибуты:
+       max_attempts (int): Максимальное число попыток, включая первую.
+       backoff_base (float): Базовая задержка в секундах.
+       backoff_max (float): Максимальная задержка в секундах.
+       retry_statuses (FrozenSet[int]): Коды ответа, после которых запрос повторяется.
+       retry_methods (FrozenSet[str]): Идемпотентные методы, которые разрешено повторять.
+       respect_retry_after (bool): Учитывать ли заголовок Retry-After.
+       max_retry_after (float): Верхняя граница задержки из Retry-After в секундах.
+    """
+    max_attempts: int = 3
+    backoff_base: float = 0.2
+    backoff_max: float = 5.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    retry_methods: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    respect_retry_after: bool = True
+    max_retry_after: float = 30.0
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts должен быть не меньше 1")
+
+    def backoff(self, attempt: int, rng: random.Random) -> float:
+        """
+        Возвращает задержку перед следующей попыткой (full jitter).
+
+        Args:
+           attempt (int): Номер завершившейся попытки, начиная с 0.
+           rng (random.Random): Генератор случайных чисел.
+
+        Returns:
+           float: Задержка в секундах.
+        """
+        return rng.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def retry_after(self, response: httpx.Response) -> Optional[float]:
+        """
+        Извлекает задержку из заголовка Retry-After (секунды или HTTP-дата).
+
+        Args:
+           response (httpx.Response): HTTP ответ.
+
+        Returns:
+           Optional[float]: Задержка в секундах или None.
+        """
+        value = response.headers.get("Retry-After")
+        if not self.respect_retry_after or value is None:
+            return None
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                delay = parsedate_to_datetime(value).timestamp() - time.time()
+            except (TypeError, ValueError):
+                return None
+        return min(max(delay, 0.0), self.max_retry_after)
+
+
+class TokenBucket:
+    """
+    Ограничитель частоты запросов по алгоритму token bucket.
+
+    Токены резервируются заранее, поэтому один и тот же ограничитель работает
+    и для потоков (time.sleep), и для асинхронных задач (asyncio.sleep).
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Инициализирует TokenBucket.
+
+        Args:
+           rate (float): Скорость пополнения, запросов в секунду.
+           capacity (Optional[float]): Размер всплеска. По умолчанию равен rate.
+
+        Raises:
+           ValueError: Если rate не положительный.
+        """
+        if rate <= 0:
+            raise ValueError("rate должен быть положительным")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """
+        Блокирует поток до получения токена.
+        """
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """
+        Приостанавливает задачу до получения токена.
+        """
+        import asyncio
+
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class CircuitBreaker:
+    """
+    Автоматический выключатель для одного хоста.
+
+    После failure_threshold последовательных отказов (5xx или сетевые ошибки) размыкается
+    и сразу отклоняет запросы. Через recovery_timeout пропускает один пробный запрос:
+    успех замыкает выключатель, отказ снова размыкает.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """
+        Инициализирует CircuitBreaker.
+
+        Args:
+           failure_threshold (int): Число последовательных отказов для размыкания.
+           recovery_timeout (float): Время в разомкнутом состоянии до пробного запроса, в секундах.
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        """
+        Проверяет, можно ли выполнить запрос.
+
+        Raises:
+           CircuitOpenError: Если выключатель разомкнут.
+        """
+        with self._lock:
+            if self.state == "closed":
+                return
+            if self.state == "open" and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                self.state = "half_open"
+                self._probe_in_flight = False
+            if self.state == "half_open" and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+            raise CircuitOpenError("Автоматический выключатель разомкнут: API недоступно")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = "closed"
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """
+        Освобождает пробный запрос, прерванный не отказом хоста (отменой или ошибкой вызывающего
+        кода), не засчитывая отказ: следующий запрос снова сможет стать пробным.
+        """
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self.state == "half_open" or self._failures >= self.failure_threshold:
+                self.state = "open"
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Адаптивный ограничитель числа одновременных запросов по алгоритму AIMD
+    (additive increase / multiplicative decrease).
+
+    Лимит растёт на 1 / limit после каждого быстрого успешного ответа, то есть примерно на
+    единицу за «окно» из limit запросов, и умножается на backoff_ratio при перегрузке:
+    ответе из overload_statuses, сетевой ошибке или задержке выше порога. Порог задаётся
+    явно через latency_target или равен latency_tolerance базовых задержек; базовая задержка —
+    минимум наблюдаемых, медленно дрейфующий вверх, чтобы пережить постоянное замедление API.
+    Ответы на запросы, начатые до последнего снижения, лимит повторно не снижают: одна волна
+    перегрузки уменьшает лимит один раз. Лимит не растёт, пока занято меньше половины слотов.
+
+    Один ограничитель можно разделять между потоками BookerClient и задачами AsyncBookerClient.
+    """
+
+    def __init__(self, initial_limit: int = 8, min_limit: int = 1, max_limit: int = 256,
+                 backoff_ratio: float = 0.75, latency_target: Optional[float] = None,
+                 latency_tolerance: float = 2.0, baseline_drift: float = 0.01,
+                 overload_statuses: FrozenSet[int] = frozenset({429, 502, 503, 504})):
+        """
+        Инициализирует AdaptiveConcurrencyLimiter.
+
+        Args:
+           initial_limit (int): Начальный лимит одновременных запросов.
+           min_limit (int): Нижняя граница лимита.
+           max_limit (int): Верхняя граница лимита.
+           backoff_ratio (float): Множитель лимита при перегрузке, в диапазоне (0, 1).
+           latency_target (Optional[float]): Порог задержки в секундах. По умолчанию вычисляется
+               из базовой задержки.
+           latency_tolerance (float): Во сколько раз задержка может превысить базовую.
+           baseline_drift (float): Доля, на которую базовая задержка сдвигается к каждому измерению.
+           overload_statuses (FrozenSet[int]): Коды ответа, означающие перегрузку API.
+
+        Raises:
+           ValueError: Если границы лимита или коэффициенты некорректны.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Должно выполняться 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0.0 < backoff_ratio < 1.0:
+            raise ValueError("backoff_ratio должен быть в диапазоне (0, 1)")
+        if latency_tolerance <= 1.0 or not 0.0 <= baseline_drift <= 1.0:
+            raise ValueError("latency_tolerance должен быть больше 1, baseline_drift в диапазоне [0, 1]")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_target = latency_target
+        self.latency_tolerance = latency_tolerance
+        self.baseline_drift = baseline_drift
+        self.overload_statuses = overload_statuses
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._baseline: Optional[float] = None
+        self._last_decrease = float("-inf")
+        self._decisions = {"increase": 0, "decrease": 0, "hold": 0}
+        self._overloads = 0
+        self._condition = threading.Condition()
+        self._waiters: list = []
+
+    @property
+    def limit(self) -> int:
+        """
+        Текущий лимит одновременных запросов.
+        """
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Число выполняющихся запросов.
+        """
+        return self._in_flight
+
+    def _try_acquire(self) -> bool:
+        if self._in_flight < int(self._limit):
+            self._in_flight += 1
+            return True
+        return False
+
+    def acquire(self) -> None:
+        """
+        Блокирует поток до освобождения слота.
+        """
+        with self._condition:
+            while not self._try_acquire():
+                self._condition.wait()
+
+    async def acquire_async(self) -> None:
+        """
+        Приостанавливает задачу до освобождения слота.
+        """
+        import asyncio
+
+        while True:
+            with self._condition:
+                if self._try_acquire():
+                    return
+                waiter = asyncio.get_running_loop().create_future()
+                self._waiters.append(waiter)
+            await waiter
+
+    def release(self, latency: float, status: Optional[int]) -> None:
+        """
+        Освобождает слот и корректирует лимит по результату запроса.
+
+        Args:
+           latency (float): Длительность запроса в секундах.
+           status (Optional[int]): Код ответа или None, если запрос завершился сетевой ошибкой.
+        """
+        now = time.monotonic()
+        with self._condition:
+            self._in_flight -= 1
+            self._update(now - latency, latency, status is None or status in self.overload_statuses)
+            self._condition.notify_all()
+            waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            waiter.get_loop().call_soon_threadsafe(_wake, waiter)
+
+    def _update(self, started: float, latency: float, failed: bool) -> None:
+        if not failed:
+            baseline = self._baseline
+            self._baseline = latency if baseline is None else min(
+                latency, baseline + (latency - baseline) * self.baseline_drift
+            )
+        threshold = self.latency_target
+        if threshold is None and self._baseline is not None:
+            threshold = self._baseline * self.latency_tolerance
+        if failed or (threshold is not None and latency > threshold):
+            self._overloads += 1
+            if started >= self._last_decrease:
+                self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+                self._last_decrease = time.monotonic()
+                self._decisions["decrease"] += 1
+                return
+        elif self._in_flight + 1 >= self._limit / 2 and self._limit < self.max_limit:
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+            self._decisions["increase"] += 1
+            return
+        self._decisions["hold"] += 1
+
+    def snapshot(self) -> dict:
+        """
+        Возвращает JSON-совместимый снимок состояния и решений ограничителя.
+
+        Returns:
+           dict: Лимит, число выполняющихся запросов, базовая задержка и счётчики решений.
+        """
+        with self._condition:
+            return {
+                "limit": int(self._limit),
+                "in_flight": self._in_flight,
+                "min_limit": self.min_limit,
+                "max_limit": self.max_limit,
+                "baseline_latency_s": round(self._baseline, 6) if self._baseline is not None else None,
+                "overloads": self._overloads,
+                "decisions": dict(self._decisions),
+            }
+
+    def to_prometheus(self, prefix: str = "booker") -> str:
+        """
+        Экспортирует лимит и решения ограничителя в текстовом формате Prometheus.
+
+        Args:
+           prefix (str): Префикс имён метрик.
+
+        Returns:
+           str: Метрики в формате Prometheus exposition.
+        """
+        data = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_concurrency_limit Текущий лимит одновременных запросов.",
+            f"# TYPE {prefix}_concurrency_limit gauge",
+            f"{prefix}_concurrency_limit {data['limit']}",
+            f"# HELP {prefix}_concurrency_in_flight Число выполняющихся запросов.",
+            f"# TYPE {prefix}_concurrency_in_flight gauge",
+            f"{prefix}_concurrency_in_flight {data['in_flight']}",
+            f"# HELP {prefix}_concurrency_decisions_total Решения адаптивного ограничителя.",
+            f"# TYPE {prefix}_concurrency_decisions_total counter",
+            *(f'{prefix}_concurrency_decisions_total{{decision="{name}"}} {count}'
+              for name, count in data["decisions"].items()),
+        ]
+        return "\n".join(lines) + "\n"
+
+
+def _wake(waiter) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+@dataclass
+class ResiliencePolicy:
+    """
+    Политика устойчивости вокруг вызовов BookerClient: повторы, ограничение частоты
+    и автоматический выключатель для каждого хоста.
+
+    Атрибуты:
+       retry (RetryPolicy): Политика повторов.
+       rate_limiter (Optional[TokenBucket]): Ограничитель частоты запросов.
+       failure_threshold (int): Порог отказов автоматического выключателя.
+       recovery_timeout (float): Время до пробного запроса после размыкания, в секундах.
+       seed (Optional[int]): Seed генератора джиттера.
+    """
+    retry: RetryPolicy = field(default_factory=RetryPolicy)
+    rate_limiter: Optional[TokenBucket] = None
+    failure_threshold: int = 5
+    recovery_timeout: float = 30.0
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+        self._random = random.Random(self.seed)
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        """
+        Возвращает автоматический выключатель для хоста.
+        """
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(self.failure_threshold, self.recovery_timeout)
+            return breaker
+
+    def _next_delay(self, method: str, attempt: int, response: Optional[httpx.Response]) -> Optional[float]:
+        if method not in self.retry.retry_methods or attempt + 1 >= self.retry.max_attempts:
+            return None
+        if response is not None:
+            retry_after = self.retry.retry_after(response)
+            if retry_after is not None:
+                return retry_after
+        with self._lock:
+            return self.retry.backoff(attempt, self._random)
+
+    def _record(self, breaker: CircuitBreaker, response: Optional[httpx.Response]) -> bool:
+        if response is None or response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response is None or response.status_code in self.retry.retry_statuses
+
+    def call(self, method: str, host: str, send: Callable[[], httpx.Response]) -> httpx.Response:
+        """
+        Выполняет синхронный запрос с учётом политики.
+
+        Args:
+            method (str): HTTP метод.
+            host (str): Хост API.
+            send (Callable): Функция, отправляющая запрос.
+
+        Returns:
+            httpx.Response: Последний полученный ответ.
+
+        Raises:
+            CircuitOpenError: Если выключатель хоста разомкнут.
+            httpx.TransportError: Если сетевая ошибка не устранилась повторами.
+        """
+        breaker = self.breaker(host)
+        attempt = 0
+        while True:
+            breaker.before_call()
+            response, error = None, None
+            try:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+                response = send()
+            except httpx.TransportError as e:
+                error = e
+            except BaseException:
+                # Отмена или ошибка вызывающего кода — не отказ хоста, но пробный запрос
+                # полуоткрытого выключателя иначе остался бы «в полёте» навсегда.
+                breaker.release_probe()
+                raise
+            if not self._record(breaker, response):
+                return response
+            delay = self._next_delay(method, attempt, response)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+            if response is not None:
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    async def call_async(self, method: str, host: str,
+                         send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """
+        Асинхронный вариант call.
+
+        Args:
+            method (str): HTTP метод.
+            host (str): Хост API.
+            send (Callable): Корутинная функция, отправляющая запрос.
+
+        Returns:
+            httpx.Response: Последний полученный ответ.
+
+        Raises:
+            CircuitOpenError: Если выключатель хоста разомкнут.
+            httpx.TransportError: Если сетевая ошибка не устранилась повторами.
+        """
+        import asyncio
+
+        breaker = self.breaker(host)
+        attempt = 0
+        while True:
+            breaker.before_call()
+            response, error = None, None
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async()
+                response = await send()
+            except httpx.TransportError as e:
+                error = e
+            except BaseException:
+                breaker.release_probe()
+                raise
+            if not self._record(breaker, response):
+                return response
+            delay = self._next_delay(method, attempt, response)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+            if response is not None:
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
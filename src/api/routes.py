@@ -6,6 +6,7 @@ class Routes:
     """
     AUTH = "/auth"
     BOOKING = "/booking"
+    PING = "/ping"
 
     @staticmethod
     def booking_by_id(booking_id: int) -> str:
@@ -1,22 +1,43 @@
 #src/config.py
+from functools import lru_cache
+from typing import Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from dotenv import load_dotenv
 
-load_dotenv()
 
 class Settings(BaseSettings):
     """
     Класс для конфигурации приложения, загружающий настройки из .env файла и переменных окружения.
 
+    Параметры подключения необязательны при загрузке, поэтому инструменты, не обращающиеся
+    к сети, работают без .env; отсутствие нужного параметра обнаруживает require.
+
     Атрибуты:
        base_url (str): Базовый URL API сервиса.
        user_name (str): Имя пользователя для аутентификации.
        password (str): Пароль пользователя для аутентификации.
+       max_connections (int): Максимальное число соединений в пуле HTTP клиента.
+       max_keepalive_connections (int): Максимальное число простаивающих keep-alive соединений.
+       keepalive_expiry (float): Время жизни простаивающего соединения в секундах.
+       connect_timeout (float): Таймаут установки соединения в секундах.
+       read_timeout (float): Таймаут чтения ответа в секундах.
+       write_timeout (float): Таймаут отправки запроса в секундах.
+       pool_timeout (float): Таймаут ожидания свободного соединения из пула в секундах.
+       http2 (bool): Использовать ли HTTP/2 (требуется пакет h2: pip install httpx[http2]).
+       warmup_connections (int): Число соединений, открываемых заранее при создании клиента.
     """
-    base_url: str
-    user_name: str
-    password: str
+    base_url: Optional[str] = None
+    user_name: Optional[str] = None
+    password: Optional[str] = None
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 5.0
+    connect_timeout: float = 10.0
+    read_timeout: float = 10.0
+    write_timeout: float = 10.0
+    pool_timeout: float = 10.0
+    http2: bool = False
+    warmup_connections: int = 0
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -24,5 +45,42 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
-settings = Settings()
+    def require(self, name: str) -> str:
+        """
+        Возвращает обязательный параметр подключения.
+
+        Args:
+           name (str): Имя параметра, например "base_url".
+
+        Returns:
+           str: Значение параметра.
+
+        Raises:
+           ValueError: Если параметр не задан ни в .env, ни в переменных окружения.
+        """
+        value = getattr(self, name)
+        if value is None:
+            raise ValueError(f"Не задан параметр {name.upper()}: укажите его в .env или переменной окружения")
+        return value
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """
+    Загружает настройки при первом обращении: читает .env и создаёт Settings.
+
+    Returns:
+        Settings: Настройки приложения, общие для всего процесса.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return Settings()
+
+
+def __getattr__(name: str):
+    # Обратная совместимость: src.config.settings вычисляется лениво при первом обращении.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
@@ -0,0 +1,265 @@
+#src/fake/restful_booker.py
+import asyncio
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from datetime import date, timedelta
+from typing import Callable, Optional, Union
+
+import httpx
+from pydantic import ValidationError
+
+from src.api.models import Booking
+
+_BOOKING_ID_PATH = re.compile(r"^/booking/(?P<booking_id>[^/]+)$")
+_FIRST_NAMES = ("Alice", "Bob", "Carol", "Dave", "Eve", "Frank", "Grace", "Heidi", "Ivan", "Judy")
+_LAST_NAMES = ("Smith", "Brown", "Jones", "Wilson", "Taylor", "Clark", "Lewis", "Young", "Walker", "Hall")
+_ADDITIONAL_NEEDS = (None, "Breakfast", "Lunch", "Dinner", "Late checkout")
+
+LatencySpec = Union[float, Callable[[random.Random], float]]
+OFFLINE_BASE_URL = "http://restful-booker.local"
+
+
+class FakeRestfulBooker(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    Работающая в памяти замена Restful-Booker для офлайн-тестов и воспроизводимых бенчмарков.
+
+    Подключается к BookerClient/AsyncBookerClient как httpx транспорт, без сокетов.
+    Повторяет маршруты /auth, /ping, /booking и /booking/{id} с теми же кодами ответа
+    и проверкой токена в cookie, что и публичный сервис. Задержка, доля ошибок и размер
+    набора данных настраиваются; все случайные решения берутся из генератора с seed.
+    """
+
+    def __init__(self, user_name: str = "admin", password: str = "password123", dataset_size: int = 10,
+                 latency: LatencySpec = 0.0, error_rate: float = 0.0, error_status: int = 503,
+                 seed: int = 0):
+        """
+        Инициализирует FakeRestfulBooker.
+
+        Args:
+           user_name (str): Имя пользователя, принимаемое /auth.
+           password (str): Пароль, принимаемый /auth.
+           dataset_size (int): Число предзаполненных бронирований.
+           latency (LatencySpec): Задержка ответа в секундах или функция от генератора случайных чисел.
+           error_rate (float): Доля запросов, на которые возвращается ошибка error_status.
+           error_status (int): Код ответа для внедрённых ошибок.
+           seed (int): Seed генератора случайных чисел.
+
+        Raises:
+           ValueError: Если error_rate вне диапазона [0, 1] или dataset_size отрицательный.
+        """
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError("error_rate должен быть в диапазоне [0, 1]")
+        if dataset_size < 0:
+            raise ValueError("dataset_size не может быть отрицательным")
+        self.user_name = user_name
+        self.password = password
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.bookings: dict[int, dict] = {}
+        self.tokens: set[str] = set()
+        self.request_count = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._next_id = 1
+        for _ in range(dataset_size):
+            self._insert(self._random_booking())
+
+    @classmethod
+    def from_settings(cls, **kwargs) -> "FakeRestfulBooker":
+        """
+        Создаёт FakeRestfulBooker с учётными данными из настроек; если USER_NAME или PASSWORD
+        не заданы, используются значения по умолчанию.
+
+        Returns:
+           FakeRestfulBooker: Транспорт с имитацией API.
+        """
+        from src.config import get_settings
+
+        config = get_settings()
+        credentials = {"user_name": config.user_name, "password": config.password}
+        return cls(**{name: value for name, value in credentials.items() if value is not None}, **kwargs)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        delay, response = self._dispatch(request)
+        if delay > 0:
+            time.sleep(delay)
+        return response
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        delay, response = self._dispatch(request)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return response
+
+    def _dispatch(self, request: httpx.Request) -> tuple[float, httpx.Response]:
+        with self._lock:
+            self.request_count += 1
+            delay = self.latency(self._random) if callable(self.latency) else self.latency
+            if self.error_rate and self._random.random() < self.error_rate:
+                return delay, _text(self.error_status, "Service Unavailable")
+            return delay, self._route(request)
+
+    def _route(self, request: httpx.Request) -> httpx.Response:
+        path, method = request.url.path, request.method
+        if path == "/ping" and method == "GET":
+            return _text(201, "Created")
+        if path == "/auth" and method == "POST":
+            return self._auth(request)
+        if path == "/booking":
+            if method == "GET":
+                return self._list(request)
+            if method == "POST":
+                return self._create(request)
+        match = _BOOKING_ID_PATH.match(path)
+        if match:
+            booking_id = _parse_id(match.group("booking_id"))
+            if method == "GET":
+                return self._get(request, booking_id)
+            if method == "PUT":
+                return self._update(request, booking_id)
+            if method == "PATCH":
+                return self._patch(request, booking_id)
+            if method == "DELETE":
+                return self._delete(request, booking_id)
+        return _text(404, "Not Found")
+
+    def _auth(self, request: httpx.Request) -> httpx.Response:
+        try:
+            credentials = json.loads(request.content or b"{}")
+        except ValueError:
+            return _text(400, "Bad Request")
+        if credentials.get("username") == self.user_name and credentials.get("password") == self.password:
+            token = f"{self._random.getrandbits(60):015x}"
+            self.tokens.add(token)
+            return _json(200, {"token": token})
+        return _json(200, {"reason": "Bad credentials"})
+
+    def _list(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        items = [
+            {"bookingid": booking_id}
+            for booking_id, booking in self.bookings.items()
+            if _matches(booking, params)
+        ]
+        return _json(200, items)
+
+    def _create(self, request: httpx.Request) -> httpx.Response:
+        booking = _validate(request.content)
+        if booking is None:
+            return _text(500, "Internal Server Error")
+        booking_id = self._insert(booking)
+        return _json(200, {"bookingid": booking_id, "booking": booking})
+
+    def _get(self, request: httpx.Request, booking_id: Optional[int]) -> httpx.Response:
+        booking = self.bookings.get(booking_id)
+        if booking is None:
+            return _text(404, "Not Found")
+        return _json(200, booking, request)
+
+    def _update(self, request: httpx.Request, booking_id: Optional[int]) -> httpx.Response:
+        if not self._authorized(request):
+            return _text(403, "Forbidden")
+        if booking_id not in self.bookings:
+            return _text(405, "Method Not Allowed")
+        booking = _validate(request.content)
+        if booking is None:
+            return _text(400, "Bad Request")
+        self.bookings[booking_id] = booking
+        return _json(200, booking)
+
+    def _patch(self, request: httpx.Request, booking_id: Optional[int]) -> httpx.Response:
+        if not self._authorized(request):
+            return _text(403, "Forbidden")
+        if booking_id not in self.bookings:
+            return _text(405, "Method Not Allowed")
+        try:
+            changes = json.loads(request.content or b"{}")
+        except ValueError:
+            return _text(400, "Bad Request")
+        if not isinstance(changes, dict):
+            return _text(400, "Bad Request")
+        merged = {**self.bookings[booking_id], **changes}
+        if isinstance(changes.get("bookingdates"), dict):
+            merged["bookingdates"] = {**self.bookings[booking_id]["bookingdates"], **changes["bookingdates"]}
+        booking = _validate(json.dumps(merged).encode())
+        if booking is None:
+            return _text(400, "Bad Request")
+        self.bookings[booking_id] = booking
+        return _json(200, booking)
+
+    def _delete(self, request: httpx.Request, booking_id: Optional[int]) -> httpx.Response:
+        if not self._authorized(request):
+            return _text(403, "Forbidden")
+        if self.bookings.pop(booking_id, None) is None:
+            return _text(405, "Method Not Allowed")
+        return _text(201, "Created")
+
+    def _authorized(self, request: httpx.Request) -> bool:
+        cookies = dict(
+            part.strip().split("=", 1) for part in request.headers.get("Cookie", "").split(";") if "=" in part
+        )
+        return cookies.get("token") in self.tokens
+
+    def _insert(self, booking: dict) -> int:
+        booking_id = self._next_id
+        self._next_id += 1
+        self.bookings[booking_id] = booking
+        return booking_id
+
+    def _random_booking(self) -> dict:
+        check_in = date(2025, 1, 1) + timedelta(days=self._random.randrange(365))
+        check_out = check_in + timedelta(days=self._random.randint(1, 14))
+        return {
+            "firstname": self._random.choice(_FIRST_NAMES),
+            "lastname": self._random.choice(_LAST_NAMES),
+            "totalprice": self._random.randint(0, 1000),
+            "depositpaid": self._random.random() < 0.5,
+            "bookingdates": {"checkin": check_in.isoformat(), "checkout": check_out.isoformat()},
+            "additionalneeds": self._random.choice(_ADDITIONAL_NEEDS),
+        }
+
+
+def _parse_id(raw: str) -> Optional[int]:
+    try:
+        return int(raw)
+    except ValueError:
+        return None
+
+
+def _validate(content: bytes) -> Optional[dict]:
+    try:
+        return Booking.model_validate_json(content).model_dump(mode="json", by_alias=True)
+    except ValidationError:
+        return None
+
+
+def _matches(booking: dict, params: httpx.QueryParams) -> bool:
+    if "firstname" in params and booking["firstname"] != params["firstname"]:
+        return False
+    if "lastname" in params and booking["lastname"] != params["lastname"]:
+        return False
+    if "checkin" in params and booking["bookingdates"]["checkin"] < params["checkin"]:
+        return False
+    if "checkout" in params and booking["bookingdates"]["checkout"] < params["checkout"]:
+        return False
+    return True
+
+
+def _text(status_code: int, text: str) -> httpx.Response:
+    return httpx.Response(status_code, text=text)
+
+
+def _json(status_code: int, payload, request: Optional[httpx.Request] = None) -> httpx.Response:
+    content = json.dumps(payload, separators=(",", ":")).encode()
+    etag = f'W/"{hashlib.blake2b(content, digest_size=8).hexdigest()}"'
+    if request is not None and request.headers.get("If-None-Match") == etag:
+        return httpx.Response(304, headers={"ETag": etag})
+    return httpx.Response(status_code, content=content,
+                          headers={"Content-Type": "application/json; charset=utf-8", "ETag": etag})
@@ -0,0 +1,348 @@
+#src/load/driver.py
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from src.api.client import BookerClient
+from src.api.encoding import Payload, encode_booking
+from src.api.models import Booking
+from src.api.routes import Routes
+from src.load.histogram import LatencyHistogram
+
+OPERATIONS = ("get", "create", "update", "delete")
+
+DEFAULT_BOOKING = {
+    "firstname": "Load",
+    "lastname": "Driver",
+    "totalprice": 150,
+    "depositpaid": True,
+    "bookingdates": {"checkin": "2025-06-01", "checkout": "2025-06-10"},
+    "additionalneeds": "Breakfast",
+}
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """
+    Разбирает строку распределения операций вида "get=70,create=20,update=5,delete=5".
+
+    Args:
+        spec (str): Описание распределения с весами операций.
+
+    Returns:
+        Dict[str, float]: Нормированные доли операций.
+
+    Raises:
+        ValueError: Если указана неизвестная операция или сумма весов не положительна.
+    """
+    weights: Dict[str, float] = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(f"Неизвестная операция: {name!r}, допустимые: {', '.join(OPERATIONS)}")
+        weights[name] = float(weight)
+    total = sum(weights.values())
+    if total <= 0 or any(weight < 0 for weight in weights.values()):
+        raise ValueError("Веса операций должны быть неотрицательными с положительной суммой")
+    return {name: weight / total for name, weight in weights.items()}
+
+
+@dataclass
+class LoadConfig:
+    """
+    Параметры нагрузочного прогона.
+
+    Атрибуты:
+       mix (Dict[str, float]): Доли операций get/create/update/delete.
+       concurrency (int): Число рабочих потоков.
+       rate (Optional[float]): Целевая частота запросов в секунду; None — без ограничения.
+       duration (Optional[float]): Длительность прогона в секундах.
+       requests (Optional[int]): Общее число запросов.
+       seed (int): Seed генератора выбора операций.
+       cleanup (bool): Удалять ли созданные прогоном бронирования по завершении.
+    """
+    mix: Dict[str, float]
+    concurrency: int = 8
+    rate: Optional[float] = None
+    duration: Optional[float] = None
+    requests: Optional[int] = None
+    seed: int = 0
+    cleanup: bool = True
+
+    def __post_init__(self):
+        if self.duration is None and self.requests is None:
+            raise ValueError("Нужно задать duration или requests")
+        if self.concurrency < 1:
+            raise ValueError("concurrency должен быть не меньше 1")
+        if self.rate is not None and self.rate <= 0:
+            raise ValueError("rate должен быть положительным")
+
+
+@dataclass
+class OperationStats:
+    """
+    Статистика одной операции: гистограмма задержек успешных запросов и число ошибок.
+    """
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+    errors: int = 0
+
+    def merge(self, other: "OperationStats") -> "OperationStats":
+        self.histogram.merge(other.histogram)
+        self.errors += other.errors
+        return self
+
+
+@dataclass
+class LoadReport:
+    """
+    Итог нагрузочного прогона.
+
+    Атрибуты:
+       config (LoadConfig): Параметры прогона.
+       elapsed (float): Фактическая длительность в секундах.
+       operations (Dict[str, OperationStats]): Статистика по операциям.
+    """
+    config: LoadConfig
+    elapsed: float
+    operations: Dict[str, OperationStats]
+
+    def to_dict(self) -> dict:
+        """
+        Возвращает машиночитаемую сводку прогона для сохранения в JSON и сравнения в CI.
+        """
+        operations = {}
+        total = OperationStats()
+        for name, stats in sorted(self.operations.items()):
+            operations[name] = self._summary(stats)
+            total.merge(OperationStats(LatencyHistogram().merge(stats.histogram), stats.errors))
+        return {
+            "config": {
+                "mix": self.config.mix,
+                "concurrency": self.config.concurrency,
+                "rate": self.config.rate,
+                "duration": self.config.duration,
+                "requests": self.config.requests,
+                "seed": self.config.seed,
+            },
+            "elapsed_s": round(self.elapsed, 3),
+            "total": self._summary(total),
+            "operations": operations,
+        }
+
+    def _summary(self, stats: OperationStats) -> dict:
+        summary = stats.histogram.summary()
+        summary["errors"] = stats.errors
+        summary["throughput_rps"] = round(stats.histogram.count / self.elapsed, 2) if self.elapsed else 0.0
+        return summary
+
+    def format_table(self) -> str:
+        """
+        Возвращает текстовую таблицу сводки для вывода в консоль.
+        """
+        data = self.to_dict()
+        header = f"{'операция':<10}{'ok':>8}{'err':>6}{'rps':>10}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}"
+        lines = [header, "-" * len(header)]
+        rows = list(data["operations"].items()) + [("total", data["total"])]
+        for name, row in rows:
+            lines.append(
+                f"{name:<10}{row['count']:>8}{row['errors']:>6}{row['throughput_rps']:>10.1f}"
+                f"{row['p50_ms']:>10.1f}{row['p90_ms']:>10.1f}{row['p99_ms']:>10.1f}{row['max_ms']:>10.1f}"
+            )
+        lines.append(f"Длительность: {data['elapsed_s']} с, задержки в мс")
+        return "\n".join(lines)
+
+
+class _IdList:
+    """
+    Список ID со случайным выбором и удалением за O(1): удаляемый элемент заменяется последним.
+    """
+    __slots__ = ("_items", "_positions")
+
+    def __init__(self, ids: Iterable[int] = ()):
+        self._items: List[int] = []
+        self._positions: Dict[int, int] = {}
+        for booking_id in ids:
+            self.append(booking_id)
+
+    def append(self, booking_id: int) -> None:
+        if booking_id not in self._positions:
+            self._positions[booking_id] = len(self._items)
+            self._items.append(booking_id)
+
+    def remove(self, booking_id: int) -> None:
+        position = self._positions.pop(booking_id, None)
+        if position is None:
+            return
+        last = self._items.pop()
+        if last != booking_id:
+            self._items[position] = last
+            self._positions[last] = position
+
+    def choice(self, rng: random.Random) -> int:
+        return rng.choice(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._items)
+
+
+class LoadDriver:
+    """
+    Нагрузочный драйвер: выполняет смесь CRUD операций через BookerClient в нескольких потоках.
+
+    Чтение выполняется по ID из снимка GET /booking и созданным прогоном бронированиям.
+    Обновление и удаление затрагивают только бронирования, созданные этим прогоном; если
+    таких нет, вместо них выполняется создание.
+
+    С заданной частотой (rate) задержка отсчитывается от запланированного момента запроса,
+    а не от фактической отправки: если API тормозит и потоки не успевают к своему слоту,
+    время ожидания входит в задержку (без coordinated omission).
+    """
+
+    def __init__(self, client: BookerClient, config: LoadConfig, booking: Optional[Booking] = None,
+                 payloads: Optional[Iterator[bytes]] = None,
+                 on_stats: Optional[Callable[[Dict[str, OperationStats]], None]] = None,
+                 stats_interval: float = 1.0, stop: Optional[Any] = None):
+        """
+        Инициализирует LoadDriver.
+
+        Args:
+           client (BookerClient): Клиент API с настроенным token_provider.
+           config (LoadConfig): Параметры прогона.
+           booking (Optional[Booking]): Шаблон бронирования для create/update. Тело запроса
+              сериализуется один раз на весь прогон.
+           payloads (Optional[Iterator[bytes]]): Готовые JSON тела для create/update, например
+              BookingFactory.stream(); каждый запрос берёт следующее тело вместо шаблона booking.
+           on_stats (Optional[Callable[[Dict[str, OperationStats]], None]]): Получает статистику,
+              накопленную рабочим потоком с прошлого вызова, не реже раза в stats_interval секунд
+              и в конце прогона; сумма всех вызовов равна итоговому отчёту.
+           stats_interval (float): Интервал передачи статистики on_stats в секундах.
+           stop (Optional[Any]): Событие с методом is_set() (threading.Event, multiprocessing.Event),
+              досрочно завершающее прогон.
+        """
+        self.client = client
+        self.config = config
+        self.booking = booking or Booking.model_validate(DEFAULT_BOOKING)
+        self._body = encode_booking(self.booking)
+        self.payloads = payloads
+        self.on_stats = on_stats
+        self.stats_interval = stats_interval
+        self.stop = stop
+        self._operations = list(config.mix)
+        self._weights = [config.mix[name] for name in self._operations]
+        self._lock = threading.Lock()
+        self._issued = 0
+        self._known_ids = _IdList()
+        self._own_ids = _IdList()
+        self._operations_stats: Dict[str, OperationStats] = {}
+
+    def run(self, wait_start: Optional[Callable[[], Any]] = None) -> LoadReport:
+        """
+        Выполняет прогон и возвращает отчёт.
+
+        Args:
+            wait_start (Optional[Callable[[], Any]]): Вызывается после загрузки снимка ID перед
+               началом отсчёта, например чтобы дождаться общего старта нескольких процессов.
+
+        Returns:
+            LoadReport: Статистика по операциям.
+        """
+        if "get" in self.config.mix:
+            self._known_ids = _IdList(self.client.get_booking_ids_compact(Routes.BOOKING))
+        if wait_start is not None:
+            wait_start()
+        started = time.perf_counter()
+        deadline = started + self.config.duration if self.config.duration is not None else None
+        workers = [
+            threading.Thread(target=self._worker, args=(index, started, deadline), daemon=True)
+            for index in range(self.config.concurrency)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - started
+
+        if self.config.cleanup and self._own_ids:
+            self.client.delete_many(list(self._own_ids))
+        return LoadReport(self.config, elapsed, self._operations_stats)
+
+    def _flush(self, stats: Dict[str, OperationStats]) -> None:
+        with self._lock:
+            for name, partial in stats.items():
+                self._operations_stats.setdefault(name, OperationStats()).merge(partial)
+        if self.on_stats is not None and stats:
+            self.on_stats(stats)
+
+    def _next_slot(self, started: float, deadline: Optional[float]) -> Optional[float]:
+        with self._lock:
+            if self.config.requests is not None and self._issued >= self.config.requests:
+                return None
+            if self.stop is not None and self.stop.is_set():
+                return None
+            slot = started + self._issued / self.config.rate if self.config.rate else time.perf_counter()
+            if deadline is not None and slot >= deadline:
+                return None
+            self._issued += 1
+            return slot
+
+    def _worker(self, index: int, started: float, deadline: Optional[float]) -> None:
+        rng = random.Random(self.config.seed * 1_000_003 + index)
+        stats: Dict[str, OperationStats] = {}
+        flushed = time.perf_counter()
+        while True:
+            if self.on_stats is not None and time.perf_counter() - flushed >= self.stats_interval:
+                self._flush(stats)
+                stats, flushed = {}, time.perf_counter()
+            slot = self._next_slot(started, deadline)
+            if slot is None:
+                break
+            delay = slot - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            name, booking_id = self._plan(rng.choices(self._operations, self._weights)[0], rng)
+            operation_started = slot if self.config.rate else time.perf_counter()
+            try:
+                self._execute(name, booking_id)
+            except Exception:
+                stats.setdefault(name, OperationStats()).errors += 1
+                continue
+            stats.setdefault(name, OperationStats()).histogram.record(time.perf_counter() - operation_started)
+        self._flush(stats)
+
+    def _plan(self, name: str, rng: random.Random) -> tuple[str, Optional[int]]:
+        with self._lock:
+            if name in ("update", "delete") and self._own_ids:
+                booking_id = self._own_ids.choice(rng)
+                if name == "delete":
+                    self._own_ids.remove(booking_id)
+                    self._known_ids.remove(booking_id)
+                return name, booking_id
+            if name == "get" and (self._known_ids or self._own_ids):
+                return name, (self._known_ids or self._own_ids).choice(rng)
+            return "create", None
+
+    def _payload(self) -> Payload:
+        if self.payloads is None:
+            return self._body
+        with self._lock:
+            return next(self.payloads)
+
+    def _execute(self, name: str, booking_id: Optional[int]) -> None:
+        if name == "get":
+            self.client.get_booking(Routes.booking_by_id(booking_id))
+        elif name == "update":
+            self.client.update_booking(self._payload(), Routes.booking_by_id(booking_id))
+        elif name == "delete":
+            self.client.delete_booking(Routes.booking_by_id(booking_id))
+        else:
+            response = self.client.create_booking(self._payload(), Routes.BOOKING)
+            with self._lock:
+                self._own_ids.append(response.booking_id)
+                self._known_ids.append(response.booking_id)
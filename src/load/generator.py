@@ -0,0 +1,139 @@
+#src/load/generator.py
+import json
+from datetime import date, timedelta
+from typing import Iterator, List, Optional, Sequence
+
+FIRST_NAMES = (
+    "Alice", "Bob", "Carol", "Dave", "Eve", "Frank", "Grace", "Heidi", "Ivan", "Judy",
+    "Karl", "Laura", "Mallory", "Nina", "Oscar", "Peggy", "Quinn", "Rupert", "Sybil", "Trent",
+)
+LAST_NAMES = (
+    "Smith", "Brown", "Jones", "Wilson", "Taylor", "Clark", "Lewis", "Young", "Walker", "Hall",
+    "Allen", "King", "Wright", "Scott", "Green", "Baker", "Adams", "Nelson", "Hill", "Campbell",
+)
+ADDITIONAL_NEEDS = (None, "Breakfast", "Lunch", "Dinner", "Late checkout")
+
+_ROW = (b'{"firstname":%s,"lastname":%s,"totalprice":%d,"depositpaid":%s,'
+        b'"bookingdates":{"checkin":"%s","checkout":"%s"},"additionalneeds":%s}')
+
+
+def _fragments(values: Sequence[Optional[str]]) -> List[bytes]:
+    return [json.dumps(value).encode() for value in values]
+
+
+class BookingFactory:
+    """
+    Генератор синтетических тел запросов POST /booking для нагрузочных и длительных прогонов.
+
+    Пакет строится по столбцам: индексы имён, цены, признак депозита, дата заезда и длительность
+    проживания генерируются массивами NumPy, а строки собираются из заранее закодированных
+    JSON фрагментов без создания модели Pydantic на строку. Дата выезда всегда позже даты
+    заезда (длительность не меньше одного дня), цена неотрицательна, поэтому каждое тело
+    проходит валидацию Booking. При одном seed последовательность пакетов воспроизводима.
+    """
+
+    def __init__(self, seed: int = 0, first_names: Sequence[str] = FIRST_NAMES,
+                 last_names: Sequence[str] = LAST_NAMES,
+                 additional_needs: Sequence[Optional[str]] = ADDITIONAL_NEEDS,
+                 start: date = date(2025, 1, 1), horizon_days: int = 365, max_stay: int = 14,
+                 max_price: int = 1000, deposit_rate: float = 0.5):
+        """
+        Инициализирует BookingFactory.
+
+        Args:
+           seed (int): Seed генератора NumPy.
+           first_names (Sequence[str]): Словарь имён.
+           last_names (Sequence[str]): Словарь фамилий.
+           additional_needs (Sequence[Optional[str]]): Варианты дополнительных пожеланий, None — null.
+           start (date): Самая ранняя дата заезда.
+           horizon_days (int): Число дней, на которые распределяются даты заезда.
+           max_stay (int): Максимальная длительность проживания в днях.
+           max_price (int): Максимальная цена включительно.
+           deposit_rate (float): Доля бронирований с оплаченным депозитом.
+
+        Raises:
+           ImportError: Если не установлен NumPy.
+           ValueError: Если параметры не позволяют построить корректные бронирования.
+        """
+        try:
+            import numpy
+        except ImportError as e:
+            raise ImportError("BookingFactory требует NumPy: pip install numpy") from e
+        if not first_names or not last_names or not additional_needs:
+            raise ValueError("Словари имён, фамилий и пожеланий не могут быть пустыми")
+        if any(not name for name in (*first_names, *last_names)):
+            raise ValueError("Имена и фамилии не могут быть пустыми строками")
+        if horizon_days < 1 or max_stay < 1:
+            raise ValueError("horizon_days и max_stay должны быть не меньше 1")
+        if max_price < 0 or not 0.0 <= deposit_rate <= 1.0:
+            raise ValueError("max_price должен быть неотрицательным, deposit_rate в диапазоне [0, 1]")
+        self._rng = numpy.random.default_rng(seed)
+        self.horizon_days = horizon_days
+        self.max_stay = max_stay
+        self.max_price = max_price
+        self.deposit_rate = deposit_rate
+        self._first_names = _fragments(first_names)
+        self._last_names = _fragments(last_names)
+        self._additional_needs = _fragments(additional_needs)
+        self._dates = [(start + timedelta(days=offset)).isoformat().encode()
+                       for offset in range(horizon_days + max_stay)]
+
+    def columns(self, size: int) -> dict:
+        """
+        Генерирует столбцы пакета.
+
+        Args:
+           size (int): Число строк.
+
+        Returns:
+           dict: Массивы NumPy first_name, last_name, additional_needs (индексы в словарях),
+              total_price, deposit_paid, check_in (смещение в днях от start) и stay (дни).
+        """
+        rng = self._rng
+        return {
+            "first_name": rng.integers(0, len(self._first_names), size),
+            "last_name": rng.integers(0, len(self._last_names), size),
+            "total_price": rng.integers(0, self.max_price, size, endpoint=True),
+            "deposit_paid": rng.random(size) < self.deposit_rate,
+            "check_in": rng.integers(0, self.horizon_days, size),
+            "stay": rng.integers(1, self.max_stay, size, endpoint=True),
+            "additional_needs": rng.integers(0, len(self._additional_needs), size),
+        }
+
+    def batch(self, size: int) -> List[bytes]:
+        """
+        Генерирует пакет JSON тел бронирований, готовых к отправке через create_booking.
+
+        Args:
+           size (int): Число бронирований.
+
+        Returns:
+           List[bytes]: Тела запросов.
+        """
+        columns = self.columns(size)
+        check_in = columns["check_in"]
+        first_names, last_names, needs, dates = (self._first_names, self._last_names,
+                                                 self._additional_needs, self._dates)
+        deposits = (b"false", b"true")
+        return [
+            _ROW % (first_names[first], last_names[last], price, deposits[deposit],
+                    dates[day], dates[out], needs[need])
+            for first, last, price, deposit, day, out, need in zip(
+                columns["first_name"].tolist(), columns["last_name"].tolist(), columns["total_price"].tolist(),
+                columns["deposit_paid"].tolist(), check_in.tolist(), (check_in + columns["stay"]).tolist(),
+                columns["additional_needs"].tolist(),
+            )
+        ]
+
+    def stream(self, batch_size: int = 10_000) -> Iterator[bytes]:
+        """
+        Бесконечно выдаёт тела бронирований, генерируя их пакетами по batch_size.
+
+        Args:
+           batch_size (int): Размер пакета.
+
+        Returns:
+           Iterator[bytes]: Тела запросов.
+        """
+        while True:
+            yield from self.batch(batch_size)
@@ -0,0 +1,141 @@
+#src/load/histogram.py
+from typing import Dict, Optional
+
+_SUB_BUCKET_BITS = 7
+_SUB_BUCKET_COUNT = 1 << _SUB_BUCKET_BITS
+_HALF_SUB_BUCKET_COUNT = _SUB_BUCKET_COUNT // 2
+
+
+def _bucket_index(value: int) -> int:
+    if value < _SUB_BUCKET_COUNT:
+        return value
+    shift = value.bit_length() - _SUB_BUCKET_BITS
+    return _SUB_BUCKET_COUNT + (shift - 1) * _HALF_SUB_BUCKET_COUNT + (value >> shift) - _HALF_SUB_BUCKET_COUNT
+
+
+def _bucket_upper_bound(index: int) -> int:
+    if index < _SUB_BUCKET_COUNT:
+        return index
+    shift = (index - _SUB_BUCKET_COUNT) // _HALF_SUB_BUCKET_COUNT + 1
+    mantissa = (index - _SUB_BUCKET_COUNT) % _HALF_SUB_BUCKET_COUNT + _HALF_SUB_BUCKET_COUNT
+    return ((mantissa + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    Гистограмма задержек в стиле HDR с логарифмически-линейными корзинами.
+
+    Значения хранятся в микросекундах; относительная погрешность перцентилей не превышает
+    1/64 (~1.6%) во всём диапазоне. Корзины хранятся разреженно, поэтому гистограммы
+    компактно сериализуются и точно объединяются (merge) без усреднения перцентилей.
+    """
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us = 0
+
+    def record(self, seconds: float) -> None:
+        """
+        Записывает одно измерение.
+
+        Args:
+           seconds (float): Задержка в секундах.
+        """
+        value = max(0, round(seconds * 1_000_000))
+        index = _bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total_us += value
+        self.max_us = max(self.max_us, value)
+        self.min_us = value if self.min_us is None else min(self.min_us, value)
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """
+        Добавляет измерения другой гистограммы в текущую.
+
+        Args:
+           other (LatencyHistogram): Гистограмма для объединения.
+
+        Returns:
+           LatencyHistogram: Текущая гистограмма.
+        """
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total_us += other.total_us
+        self.max_us = max(self.max_us, other.max_us)
+        if other.min_us is not None:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+        return self
+
+    def percentile(self, percent: float) -> float:
+        """
+        Возвращает значение перцентиля в секундах.
+
+        Args:
+           percent (float): Перцентиль в диапазоне [0, 100].
+
+        Returns:
+           float: Наибольшее значение, эквивалентное корзине перцентиля, в секундах.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(_bucket_upper_bound(index), self.max_us) / 1_000_000
+        return self.max_us / 1_000_000
+
+    @property
+    def mean(self) -> float:
+        return self.total_us / self.count / 1_000_000 if self.count else 0.0
+
+    @property
+    def max(self) -> float:
+        return self.max_us / 1_000_000
+
+    def summary(self) -> dict:
+        """
+        Возвращает сводку перцентилей в миллисекундах.
+
+        Returns:
+           dict: count, mean, p50, p90, p99, max.
+        """
+        return {
+            "count": self.count,
+            "mean_ms": round(self.mean * 1000, 3),
+            "p50_ms": round(self.percentile(50) * 1000, 3),
+            "p90_ms": round(self.percentile(90) * 1000, 3),
+            "p99_ms": round(self.percentile(99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+    def to_dict(self) -> dict:
+        """
+        Сериализует гистограмму для передачи между процессами или сохранения.
+        """
+        return {
+            "counts": {str(index): count for index, count in self.counts.items()},
+            "count": self.count,
+            "total_us": self.total_us,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        """
+        Восстанавливает гистограмму из результата to_dict.
+        """
+        histogram = cls()
+        histogram.counts = {int(index): count for index, count in data["counts"].items()}
+        histogram.count = data["count"]
+        histogram.total_us = data["total_us"]
+        histogram.min_us = data["min_us"]
+        histogram.max_us = data["max_us"]
+        return histogram
@@ -0,0 +1,243 @@
+#src/load/multiprocess.py
+import multiprocessing
+import queue
+import time
+import traceback
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, List, Optional
+
+from src.api.auth import TokenProvider
+from src.api.client import BookerClient
+from src.load.driver import LoadConfig, LoadDriver, LoadReport, OperationStats
+from src.load.histogram import LatencyHistogram
+
+# Как часто родитель проверяет, живы ли процессы, пока ждёт от них сообщений, в секундах.
+_POLL_INTERVAL = 0.5
+
+
+@dataclass
+class ClientFactory:
+    """
+    Создаёт BookerClient в рабочем процессе: к живому API или к собственному FakeRestfulBooker.
+
+    Передаётся в процессы вместо клиента, поэтому у каждого процесса свой клиент и пул соединений.
+
+    Атрибуты:
+       offline (bool): Использовать FakeRestfulBooker вместо сети.
+       dataset_size (int): Число бронирований FakeRestfulBooker.
+       latency (float): Задержка FakeRestfulBooker в секундах.
+       error_rate (float): Доля ошибок FakeRestfulBooker.
+       seed (int): Seed FakeRestfulBooker.
+    """
+    offline: bool = False
+    dataset_size: int = 100
+    latency: float = 0.0
+    error_rate: float = 0.0
+    seed: int = 0
+
+    def __call__(self) -> BookerClient:
+        if self.offline:
+            from src.fake.restful_booker import OFFLINE_BASE_URL, FakeRestfulBooker
+
+            transport = FakeRestfulBooker.from_settings(
+                dataset_size=self.dataset_size,
+                latency=self.latency,
+                error_rate=self.error_rate,
+                seed=self.seed,
+            )
+            token_provider = TokenProvider(transport.user_name, transport.password)
+            return BookerClient(OFFLINE_BASE_URL, token_provider=token_provider, transport=transport)
+        return BookerClient(token_provider=TokenProvider.from_settings())
+
+
+def _split(total: int, parts: int) -> List[int]:
+    return [total // parts + (1 if index < total % parts else 0) for index in range(parts)]
+
+
+def _encode_stats(stats: Dict[str, OperationStats]) -> dict:
+    return {name: {"histogram": item.histogram.to_dict(), "errors": item.errors} for name, item in stats.items()}
+
+
+def _decode_stats(data: dict) -> Dict[str, OperationStats]:
+    return {
+        name: OperationStats(LatencyHistogram.from_dict(item["histogram"]), item["errors"])
+        for name, item in data.items()
+    }
+
+
+def _worker_main(index: int, config: LoadConfig, client_factory: Callable[[], BookerClient], synthetic: bool,
+                 stats_interval: float, messages, start, stop) -> None:
+    try:
+        client = client_factory()
+        payloads = None
+        if synthetic:
+            from src.load.generator import BookingFactory
+
+            payloads = BookingFactory(seed=config.seed).stream()
+        driver = LoadDriver(client, config, payloads=payloads,
+                            on_stats=lambda stats: messages.put(("stats", index, _encode_stats(stats))),
+                            stats_interval=stats_interval, stop=stop)
+
+        def _wait_start() -> None:
+            messages.put(("ready", index, None))
+            start.wait()
+
+        try:
+            report = driver.run(_wait_start)
+        finally:
+            client.close()
+        messages.put(("done", index, report.elapsed))
+    except BaseException:
+        messages.put(("error", index, traceback.format_exc()))
+
+
+class MultiProcessLoadRunner:
+    """
+    Распределяет нагрузочный прогон LoadDriver по нескольким процессам.
+
+    Каждый процесс создаёт свой клиент через client_factory и выполняет свою долю запросов,
+    потоков и целевой частоты; все процессы стартуют одновременно после готовности последнего.
+    Процессы периодически передают родителю гистограммы задержек, накопленные с прошлой
+    передачи; родитель объединяет корзины гистограмм, поэтому итоговые перцентили точные,
+    а не усреднённые по процессам.
+    """
+
+    def __init__(self, config: LoadConfig, processes: int, client_factory: Callable[[], BookerClient],
+                 synthetic: bool = False, stats_interval: float = 1.0, startup_timeout: float = 60.0,
+                 on_progress: Optional[Callable[[Dict[str, OperationStats]], None]] = None):
+        """
+        Инициализирует MultiProcessLoadRunner.
+
+        Args:
+           config (LoadConfig): Общие параметры прогона; requests, concurrency и rate делятся между процессами.
+           processes (int): Число рабочих процессов.
+           client_factory (Callable[[], BookerClient]): Сериализуемая pickle фабрика клиента, например ClientFactory.
+           synthetic (bool): Отправлять в create/update тела BookingFactory (нужен numpy).
+           stats_interval (float): Интервал передачи гистограмм из процессов в секундах.
+           startup_timeout (float): Сколько секунд ждать готовности процессов.
+           on_progress (Optional[Callable[[Dict[str, OperationStats]], None]]): Вызывается в родителе
+              с накопленной статистикой после каждой полученной порции.
+
+        Raises:
+           ValueError: Если processes меньше 1 или больше concurrency.
+        """
+        if processes < 1:
+            raise ValueError("processes должен быть не меньше 1")
+        if processes > config.concurrency:
+            raise ValueError("processes не может превышать concurrency: каждому процессу нужен хотя бы один поток")
+        self.config = config
+        self.processes = processes
+        self.client_factory = client_factory
+        self.synthetic = synthetic
+        self.stats_interval = stats_interval
+        self.startup_timeout = startup_timeout
+        self.on_progress = on_progress
+
+    def worker_configs(self) -> List[LoadConfig]:
+        """
+        Делит параметры прогона между процессами.
+
+        Returns:
+           List[LoadConfig]: Параметры каждого процесса: доля запросов, потоков и частоты, свой seed.
+        """
+        config, count = self.config, self.processes
+        concurrency = _split(config.concurrency, count)
+        requests = _split(config.requests, count) if config.requests is not None else [None] * count
+        active = [index for index in range(count) if requests[index] is None or requests[index] > 0]
+        return [
+            replace(
+                config,
+                concurrency=concurrency[index],
+                requests=requests[index],
+                rate=config.rate / len(active) if config.rate is not None else None,
+                seed=config.seed * 1_000 + index,
+            )
+            for index in active
+        ]
+
+    def run(self) -> LoadReport:
+        """
+        Запускает процессы, дожидается их завершения и объединяет статистику.
+
+        Returns:
+           LoadReport: Итоговый отчёт с объединёнными гистограммами всех процессов.
+
+        Raises:
+           RuntimeError: Если процесс завершился ошибкой, неожиданно завершился (например, был убит)
+              или не успел подготовиться за startup_timeout.
+        """
+        context = multiprocessing.get_context("spawn")
+        messages = context.Queue()
+        start = context.Event()
+        stop = context.Event()
+        configs = self.worker_configs()
+        workers = [
+            context.Process(
+                target=_worker_main,
+                args=(index, config, self.client_factory, self.synthetic, self.stats_interval, messages, start, stop),
+                name=f"load-worker-{index}",
+                daemon=True,
+            )
+            for index, config in enumerate(configs)
+        ]
+        for worker in workers:
+            worker.start()
+
+        operations: Dict[str, OperationStats] = {}
+        ready = 0
+        finished: Dict[int, float] = {}
+        deadline = time.monotonic() + self.startup_timeout
+        try:
+            while len(finished) < len(workers):
+                timeout = _POLL_INTERVAL
+                if not start.is_set():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise RuntimeError(f"Процессы нагрузки не подготовились за {self.startup_timeout} с")
+                    timeout = min(timeout, remaining)
+                try:
+                    kind, index, payload = messages.get(timeout=timeout)
+                except queue.Empty:
+                    # Процесс отправляет "done" до выхода, поэтому при пустой очереди вышедший без него
+                    # процесс уже не пришлёт ничего; ненулевой код выхода проверяется на каждом проходе.
+                    self._check_workers(workers, finished, clean_exit_is_error=True)
+                    continue
+                if kind == "ready":
+                    ready += 1
+                    if ready == len(workers):
+                        start.set()
+                elif kind == "stats":
+                    for name, stats in _decode_stats(payload).items():
+                        operations.setdefault(name, OperationStats()).merge(stats)
+                    if self.on_progress is not None:
+                        self.on_progress(operations)
+                elif kind == "done":
+                    finished[index] = payload
+                else:
+                    raise RuntimeError(f"Процесс нагрузки {index} завершился ошибкой:\n{payload}")
+                self._check_workers(workers, finished, clean_exit_is_error=False)
+        except BaseException:
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+            raise
+        finally:
+            stop.set()
+            start.set()
+            for worker in workers:
+                worker.join(timeout=30)
+                if worker.is_alive():
+                    worker.terminate()
+                    worker.join()
+        # Процессы замеряют время прогона без удаления созданных бронирований и завершения,
+        # поэтому длительность общего прогона — наибольшая из них, а не время ожидания родителя.
+        elapsed = max(finished.values(), default=0.0)
+        return LoadReport(self.config, elapsed, operations)
+
+    @staticmethod
+    def _check_workers(workers: list, finished: Dict[int, float], clean_exit_is_error: bool) -> None:
+        for index, worker in enumerate(workers):
+            if index in finished or worker.exitcode is None:
+                continue
+            if worker.exitcode != 0 or clean_exit_is_error:
+                raise RuntimeError(f"Процесс нагрузки {index} неожиданно завершился с кодом {worker.exitcode}")
@@ -0,0 +1,278 @@
+#src/load/scenario.py
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.api.client import AsyncBookerClient
+from src.api.models import Booking
+from src.api.routes import Routes
+from src.load.driver import DEFAULT_BOOKING, OperationStats
+from src.load.histogram import LatencyHistogram
+
+
+class StepContext:
+    """
+    Контекст шага сценария: номер экземпляра и результаты завершённых шагов.
+
+    Шаг читает результаты своих зависимостей по имени: context["create"].
+    """
+    __slots__ = ("instance", "results")
+
+    def __init__(self, instance: int):
+        self.instance = instance
+        self.results: Dict[str, Any] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        return self.results[name]
+
+
+StepAction = Callable[[AsyncBookerClient, StepContext], Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class Step:
+    """
+    Шаг сценария.
+
+    Атрибуты:
+       name (str): Уникальное имя шага.
+       action (StepAction): Корутинная функция (client, context), результат которой доступен зависимым шагам.
+       depends_on (Tuple[str, ...]): Имена шагов, которые должны завершиться до начала этого.
+    """
+    name: str
+    action: StepAction
+    depends_on: Tuple[str, ...] = ()
+
+
+class Scenario:
+    """
+    Сценарий — ориентированный ациклический граф шагов (DAG).
+
+    Шаги без взаимной зависимости выполняются одновременно, зависимый шаг начинается,
+    как только завершились все его зависимости. Порядок шагов проверяется при создании.
+    """
+
+    def __init__(self, name: str, steps: Iterable[Step]):
+        """
+        Инициализирует Scenario.
+
+        Args:
+           name (str): Имя сценария.
+           steps (Iterable[Step]): Шаги сценария в любом порядке.
+
+        Raises:
+           ValueError: Если имена шагов повторяются, зависимость не существует или граф содержит цикл.
+        """
+        self.name = name
+        self.steps: Dict[str, Step] = {}
+        for step in steps:
+            if step.name in self.steps:
+                raise ValueError(f"Шаг {step.name!r} объявлен дважды")
+            self.steps[step.name] = step
+        for step in self.steps.values():
+            missing = [name for name in step.depends_on if name not in self.steps]
+            if missing:
+                raise ValueError(f"Шаг {step.name!r} зависит от неизвестных шагов: {', '.join(missing)}")
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> List[str]:
+        pending = {name: set(step.depends_on) for name, step in self.steps.items()}
+        order: List[str] = []
+        while pending:
+            ready = [name for name, depends_on in pending.items() if not depends_on]
+            if not ready:
+                raise ValueError(f"Сценарий {self.name!r} содержит цикл: {', '.join(sorted(pending))}")
+            for name in ready:
+                order.append(name)
+                del pending[name]
+            for depends_on in pending.values():
+                depends_on.difference_update(ready)
+        return order
+
+
+@dataclass
+class ScenarioReport:
+    """
+    Итог прогона сценария.
+
+    Атрибуты:
+       scenario (str): Имя сценария.
+       instances (int): Число запущенных экземпляров.
+       completed (int): Число экземпляров, все шаги которых завершились успешно.
+       elapsed (float): Длительность прогона в секундах.
+       steps (Dict[str, OperationStats]): Задержки и ошибки по шагам.
+       workflow (LatencyHistogram): Сквозная длительность успешных экземпляров.
+       skipped (Dict[str, int]): Сколько раз шаг пропущен из-за ошибки зависимости.
+    """
+    scenario: str
+    instances: int
+    completed: int
+    elapsed: float
+    steps: Dict[str, OperationStats]
+    workflow: LatencyHistogram = field(default_factory=LatencyHistogram)
+    skipped: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def workflows_per_second(self) -> float:
+        """
+        Пропускная способность: успешных экземпляров сценария в секунду.
+        """
+        return self.completed / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        """
+        Возвращает машиночитаемую сводку прогона.
+        """
+        steps = {}
+        for name, stats in self.steps.items():
+            summary = stats.histogram.summary()
+            summary["errors"] = stats.errors
+            summary["skipped"] = self.skipped.get(name, 0)
+            steps[name] = summary
+        return {
+            "scenario": self.scenario,
+            "instances": self.instances,
+            "completed": self.completed,
+            "failed": self.instances - self.completed,
+            "elapsed_s": round(self.elapsed, 3),
+            "workflows_per_second": round(self.workflows_per_second, 2),
+            "workflow": self.workflow.summary(),
+            "steps": steps,
+        }
+
+    def format_table(self) -> str:
+        """
+        Возвращает текстовую таблицу сводки для вывода в консоль.
+        """
+        data = self.to_dict()
+        header = f"{'шаг':<12}{'ok':>8}{'err':>6}{'skip':>6}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}"
+        lines = [header, "-" * len(header)]
+        rows = list(data["steps"].items()) + [("workflow", {**data["workflow"], "errors": data["failed"],
+                                                            "skipped": 0})]
+        for name, row in rows:
+            lines.append(
+                f"{name:<12}{row['count']:>8}{row['errors']:>6}{row['skipped']:>6}"
+                f"{row['p50_ms']:>10.1f}{row['p90_ms']:>10.1f}{row['p99_ms']:>10.1f}{row['max_ms']:>10.1f}"
+            )
+        lines.append(f"Сценарий {data['scenario']}: {data['completed']}/{data['instances']} за {data['elapsed_s']} с, "
+                     f"{data['workflows_per_second']} сценариев/с, задержки в мс")
+        return "\n".join(lines)
+
+
+class ScenarioRunner:
+    """
+    Выполняет много независимых экземпляров сценария одновременно через AsyncBookerClient.
+
+    Число одновременно выполняемых экземпляров ограничивает concurrency, число одновременных
+    HTTP запросов — семафор клиента. Ошибка шага помечает экземпляр неуспешным, зависимые
+    от него шаги пропускаются, независимые ветви выполняются до конца.
+    """
+
+    def __init__(self, client: AsyncBookerClient, scenario: Scenario, concurrency: int = 32):
+        """
+        Инициализирует ScenarioRunner.
+
+        Args:
+           client (AsyncBookerClient): Асинхронный клиент API.
+           scenario (Scenario): Сценарий.
+           concurrency (int): Максимум одновременно выполняемых экземпляров.
+
+        Raises:
+           ValueError: Если concurrency меньше 1.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency должен быть не меньше 1")
+        self.client = client
+        self.scenario = scenario
+        self.concurrency = concurrency
+
+    async def run(self, instances: int) -> ScenarioReport:
+        """
+        Выполняет instances экземпляров сценария.
+
+        Args:
+           instances (int): Число экземпляров.
+
+        Returns:
+           ScenarioReport: Задержки шагов и сквозная пропускная способность.
+        """
+        import asyncio
+
+        report = ScenarioReport(self.scenario.name, instances, 0, 0.0,
+                                {name: OperationStats() for name in self.scenario.order})
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _limited(instance: int) -> None:
+            async with semaphore:
+                await self._run_instance(instance, report)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(_limited(instance) for instance in range(instances)))
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    async def _run_instance(self, instance: int, report: ScenarioReport) -> None:
+        import asyncio
+
+        context = StepContext(instance)
+        tasks: Dict[str, "asyncio.Task[bool]"] = {}
+
+        async def _run_step(step: Step) -> bool:
+            dependencies = await asyncio.gather(*(tasks[name] for name in step.depends_on))
+            if not all(dependencies):
+                report.skipped[step.name] = report.skipped.get(step.name, 0) + 1
+                return False
+            step_started = time.perf_counter()
+            try:
+                context.results[step.name] = await step.action(self.client, context)
+            except Exception:
+                report.steps[step.name].errors += 1
+                return False
+            report.steps[step.name].histogram.record(time.perf_counter() - step_started)
+            return True
+
+        started = time.perf_counter()
+        for name in self.scenario.order:
+            tasks[name] = asyncio.create_task(_run_step(self.scenario.steps[name]))
+        if all(await asyncio.gather(*tasks.values())):
+            report.completed += 1
+            report.workflow.record(time.perf_counter() - started)
+
+
+def crud_scenario(booking: Optional[Booking] = None, updated: Optional[Booking] = None) -> Scenario:
+    """
+    Строит сценарий пользователя из main.py: аутентификация и создание выполняются
+    одновременно, затем получение, обновление и удаление созданного бронирования.
+
+    Args:
+       booking (Optional[Booking]): Данные создаваемого бронирования.
+       updated (Optional[Booking]): Данные для обновления. По умолчанию booking с другим именем.
+
+    Returns:
+       Scenario: Сценарий auth ∥ create → get → update → delete.
+    """
+    booking = booking or Booking.model_validate(DEFAULT_BOOKING)
+    updated = updated or booking.model_copy(update={"first_name": "Updated"})
+
+    async def auth(client: AsyncBookerClient, context: StepContext) -> str:
+        return await client.token_provider.get_token_async(client)
+
+    async def create(client: AsyncBookerClient, context: StepContext) -> int:
+        return (await client.create_booking(booking, Routes.BOOKING)).booking_id
+
+    async def get(client: AsyncBookerClient, context: StepContext) -> Booking:
+        return await client.get_booking(Routes.booking_by_id(context["create"]))
+
+    async def update(client: AsyncBookerClient, context: StepContext) -> Booking:
+        return await client.update_booking(updated, Routes.booking_by_id(context["create"]), context["auth"])
+
+    async def delete(client: AsyncBookerClient, context: StepContext) -> Optional[int]:
+        return await client.delete_booking(Routes.booking_by_id(context["create"]), context["auth"])
+
+    return Scenario("crud", [
+        Step("auth", auth),
+        Step("create", create),
+        Step("get", get, ("create",)),
+        Step("update", update, ("auth", "get")),
+        Step("delete", delete, ("auth", "update")),
+    ])
@@ -0,0 +1,179 @@
+#src/sync/mirror.py
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Union
+
+from src.api.booking_ids import BookingIdSet
+from src.api.bulk import BulkResult, run_bulk
+from src.api.client import DEFAULT_BULK_WORKERS, BookerClient
+from src.api.decoding import ValidationLevel
+from src.api.encoding import encode_booking
+from src.api.models import Booking
+from src.api.routes import Routes
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bookings (
+    booking_id INTEGER PRIMARY KEY,
+    body BLOB NOT NULL,
+    fetched_at REAL NOT NULL,
+    verified_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS bookings_verified_at ON bookings (verified_at);
+"""
+
+
+@dataclass
+class SyncReport:
+    """
+    Итоги одной синхронизации зеркала.
+
+    Атрибуты:
+       added (int): Сколько новых бронирований загружено.
+       removed (int): Сколько удалённых на сервере бронирований удалено из зеркала.
+       verified (int): Сколько сохранённых бронирований перепроверено.
+       changed (int): Сколько перепроверенных бронирований изменилось на сервере.
+       failed (int): Сколько загрузок завершилось ошибкой; они повторятся при следующей синхронизации.
+       total (int): Число бронирований в зеркале после синхронизации.
+       elapsed (float): Длительность синхронизации в секундах.
+    """
+    added: int = 0
+    removed: int = 0
+    verified: int = 0
+    changed: int = 0
+    failed: int = 0
+    total: int = 0
+    elapsed: float = 0.0
+
+
+class BookingMirror:
+    """
+    Локальное зеркало бронирований в SQLite с инкрементальной синхронизацией.
+
+    Каждая синхронизация выполняет один GET /booking и сравнивает набор ID с сохранённым:
+    новые бронирования загружаются параллельно через пул потоков, исчезнувшие удаляются,
+    а уже сохранённые перепроверяются выборочно — не более verify_batch самых давно
+    проверенных записей старше verify_after секунд. Повторная синхронизация неизменного
+    набора данных стоит одного запроса вместо полного обхода.
+    """
+
+    def __init__(self, path: Union[str, Path], client: BookerClient, verify_batch: int = 100,
+                 verify_after: float = 3600.0, max_workers: int = DEFAULT_BULK_WORKERS,
+                 route: str = Routes.BOOKING):
+        """
+        Инициализирует BookingMirror и создаёт схему базы при необходимости.
+
+        Args:
+           path (Union[str, Path]): Путь к файлу SQLite (":memory:" — база в памяти).
+           client (BookerClient): Клиент API.
+           verify_batch (int): Максимум перепроверяемых бронирований за одну синхронизацию.
+           verify_after (float): Через сколько секунд после последней проверки запись можно перепроверить.
+           max_workers (int): Число потоков загрузки.
+           route (str): Маршрут списка бронирований.
+        """
+        self.client = client
+        self.verify_batch = verify_batch
+        self.verify_after = verify_after
+        self.max_workers = max_workers
+        self.route = route
+        self._db = sqlite3.connect(str(path))
+        self._db.executescript(_SCHEMA)
+
+    def _fetch(self, booking_ids: List[int]) -> BulkResult[int, bytes]:
+        return run_bulk(
+            lambda booking_id: encode_booking(
+                self.client.get_booking(Routes.booking_by_id(booking_id), ValidationLevel.STRICT)
+            ),
+            booking_ids, self.max_workers,
+        )
+
+    def _due_for_verification(self, now: float) -> List[int]:
+        if self.verify_batch <= 0:
+            return []
+        rows = self._db.execute(
+            "SELECT booking_id FROM bookings WHERE verified_at <= ? ORDER BY verified_at LIMIT ?",
+            (now - self.verify_after, self.verify_batch),
+        )
+        return [booking_id for booking_id, in rows]
+
+    def sync(self) -> SyncReport:
+        """
+        Синхронизирует зеркало с API.
+
+        Returns:
+           SyncReport: Итоги синхронизации.
+
+        Raises:
+           RuntimeError: Если не удалось получить список ID бронирований.
+        """
+        started = time.perf_counter()
+        report = SyncReport()
+        remote = self.client.get_booking_ids_compact(self.route)
+        local = self.ids()
+        removed = list(local - remote)
+        added = list(remote - local)
+
+        now = time.time()
+        verify = self._due_for_verification(now)
+        verify = [booking_id for booking_id in verify if booking_id in remote]
+        stored = dict(self._db.execute(
+            f"SELECT booking_id, body FROM bookings WHERE booking_id IN ({','.join('?' * len(verify))})", verify,
+        )) if verify else {}
+
+        result = self._fetch(added + verify)
+        with self._db:
+            self._db.executemany("DELETE FROM bookings WHERE booking_id = ?", ((booking_id,) for booking_id in removed))
+            for item in result.items:
+                if not item.ok:
+                    report.failed += 1
+                    continue
+                if item.item in stored:
+                    report.verified += 1
+                    if stored[item.item] != item.value:
+                        report.changed += 1
+                        self._db.execute("UPDATE bookings SET body = ?, fetched_at = ?, verified_at = ? "
+                                         "WHERE booking_id = ?", (item.value, now, now, item.item))
+                    else:
+                        self._db.execute("UPDATE bookings SET verified_at = ? WHERE booking_id = ?",
+                                         (now, item.item))
+                else:
+                    report.added += 1
+                    self._db.execute("INSERT OR REPLACE INTO bookings VALUES (?, ?, ?, ?)",
+                                     (item.item, item.value, now, now))
+        report.removed = len(removed)
+        report.total = len(self)
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    def ids(self) -> BookingIdSet:
+        """
+        Возвращает ID бронирований в зеркале.
+        """
+        return BookingIdSet(booking_id for booking_id, in self._db.execute("SELECT booking_id FROM bookings"))
+
+    def get(self, booking_id: int) -> Optional[Booking]:
+        """
+        Возвращает сохранённое бронирование по ID или None.
+        """
+        row = self._db.execute("SELECT body FROM bookings WHERE booking_id = ?", (booking_id,)).fetchone()
+        return Booking.model_validate_json(row[0]) if row is not None else None
+
+    def bookings(self) -> Iterator[Tuple[int, Booking]]:
+        """
+        Перебирает сохранённые бронирования в порядке ID, например для построения BookingIndex.
+
+        Returns:
+           Iterator[Tuple[int, Booking]]: Пары (ID бронирования, бронирование).
+        """
+        for booking_id, body in self._db.execute("SELECT booking_id, body FROM bookings ORDER BY booking_id"):
+            yield booking_id, Booking.model_validate_json(body)
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM bookings").fetchone()[0]
+
+    def close(self) -> None:
+        """
+        Закрывает соединение с базой.
+        """
+        self._db.close()
@@ -0,0 +1,283 @@
+#src/testing/cassette.py
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import httpx
+
+_MAGIC = b"BKCASS1\n"
+# Заголовок записи: точный и нормализованный ключи запроса, код ответа, длины заголовков и тела.
+_RECORD = struct.Struct("<16s16sHII")
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+_SKIPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection"})
+_MUTATING_METHODS = frozenset({"PUT", "PATCH", "DELETE"})
+
+
+class CassetteMode(str, Enum):
+    """
+    Режим работы CassetteTransport.
+
+    REPLAY отвечает только из кассеты, RECORD перезаписывает кассету ответами реального
+    транспорта, AUTO отвечает из кассеты и дозаписывает отсутствующие в ней запросы.
+    """
+    REPLAY = "replay"
+    RECORD = "record"
+    AUTO = "auto"
+
+
+def _canonical_body(content: bytes) -> bytes:
+    if not content:
+        return b""
+    try:
+        return json.dumps(json.loads(content), sort_keys=True, separators=(",", ":")).encode()
+    except ValueError:
+        return content
+
+
+def _digest(*parts: bytes) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part)
+        digest.update(b"\0")
+    return digest.digest()
+
+
+def request_keys(request: httpx.Request, history: bytes = b"",
+                 aliases: Optional[Dict[str, str]] = None) -> Tuple[bytes, bytes]:
+    """
+    Вычисляет ключи запроса для поиска в кассете.
+
+    Заголовки (cookie с токеном, If-None-Match) в ключ не входят, JSON тело приводится
+    к каноническому виду. В точном ключе ID бронирований, созданных в этой сессии,
+    заменяются псевдонимом запроса создания, так что бронирования с одинаковыми данными
+    взаимозаменяемы. Нормализованный ключ заменяет любые числовые сегменты пути на {id}.
+
+    Args:
+       request (httpx.Request): Запрос с прочитанным телом.
+       history (bytes): Свёртка изменяющих запросов (PUT, PATCH, DELETE), ранее выполненных по тому же пути.
+       aliases (Optional[Dict[str, str]]): Псевдонимы ID созданных бронирований.
+
+    Returns:
+       Tuple[bytes, bytes]: Точный и нормализованный ключи.
+    """
+    query = "&".join(sorted(f"{name}={value}" for name, value in request.url.params.multi_items())).encode()
+    body = _canonical_body(request.content)
+    method, path = request.method.encode(), request.url.path
+    if aliases:
+        exact = _ID_SEGMENT.sub(lambda match: "/" + aliases.get(match.group()[1:], match.group()[1:]), path)
+    else:
+        exact = path
+    return (_digest(method, exact.encode(), query, body, history),
+            _digest(method, _ID_SEGMENT.sub("/{id}", path).encode(), query, body, history))
+
+
+class CassetteTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    httpx транспорт, записывающий пары запрос/ответ в файл-кассету и воспроизводящий их.
+
+    Кассета — файл только для дозаписи: после заголовка формата идут записи из двух
+    16-байтовых ключей запроса, кода ответа, заголовков в JSON и тела. При открытии файл
+    отображается в память (mmap), индекс строится по заголовкам записей, а тела читаются
+    из отображения только при воспроизведении.
+
+    Запрос сначала ищется по точному ключу, затем по нормализованному, в котором ID
+    бронирований в пути заменены на {id}. В ключ входит история изменяющих запросов
+    к тому же пути, поэтому GET после PUT или DELETE получает ответ, записанный после
+    такого же изменения, даже если бронирование досталось тесту с другим ID, чем при
+    записи. Несколько ответов на один ключ воспроизводятся в порядке записи, после
+    последнего повторяется последний. Запись из нескольких процессов одновременно
+    не поддерживается.
+    """
+
+    def __init__(self, path: Union[str, Path], mode: CassetteMode = CassetteMode.REPLAY,
+                 inner: Optional[Union[httpx.BaseTransport, httpx.AsyncBaseTransport]] = None):
+        """
+        Инициализирует CassetteTransport.
+
+        Args:
+           path (Union[str, Path]): Путь к файлу кассеты.
+           mode (CassetteMode): Режим работы.
+           inner (Optional[Union[httpx.BaseTransport, httpx.AsyncBaseTransport]]): Транспорт для
+              записи ответов. По умолчанию httpx.HTTPTransport или httpx.AsyncHTTPTransport.
+
+        Raises:
+           FileNotFoundError: Если в режиме replay файл кассеты не существует.
+           ValueError: Если файл не является кассетой.
+        """
+        self.path = Path(path)
+        self.mode = CassetteMode(mode)
+        self.inner = inner
+        self._owns_inner = inner is None
+        self.recorded = 0
+        self.replayed = 0
+        self._lock = threading.Lock()
+        self._exact: Dict[bytes, List[int]] = {}
+        self._normalized: Dict[bytes, List[int]] = {}
+        self._positions: Dict[Tuple[bool, bytes], int] = {}
+        self._history: Dict[str, bytes] = {}
+        self._aliases: Dict[str, str] = {}
+        self._map: Optional[mmap.mmap] = None
+
+        if self.mode is CassetteMode.RECORD:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "w+b")
+        elif self.mode is CassetteMode.AUTO:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "r+b" if self.path.exists() else "w+b")
+        else:
+            self._file = open(self.path, "rb")
+        self._size = os.fstat(self._file.fileno()).st_size
+        if self._size == 0 and self.mode is not CassetteMode.REPLAY:
+            self._file.write(_MAGIC)
+            self._file.flush()
+            self._size = len(_MAGIC)
+        self._load_index()
+        if self.mode is CassetteMode.AUTO and os.fstat(self._file.fileno()).st_size > self._size:
+            self._map.close()
+            self._map = None
+            self._file.truncate(self._size)
+
+    def _remap(self) -> mmap.mmap:
+        if self._map is None or len(self._map) < self._size:
+            if self._map is not None:
+                self._map.close()
+            self._file.flush()
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def _load_index(self) -> None:
+        if self._size < len(_MAGIC):
+            raise ValueError(f"Файл {self.path} не является кассетой")
+        data = self._remap()
+        if data[:len(_MAGIC)] != _MAGIC:
+            raise ValueError(f"Файл {self.path} не является кассетой")
+        offset = len(_MAGIC)
+        while offset + _RECORD.size <= self._size:
+            exact, normalized, _, headers_size, body_size = _RECORD.unpack_from(data, offset)
+            end = offset + _RECORD.size + headers_size + body_size
+            if end > self._size:
+                # Незавершённая запись в конце файла (прерванная запись) игнорируется.
+                break
+            self._index(exact, normalized, offset)
+            offset = end
+        self._size = offset
+
+    def _index(self, exact: bytes, normalized: bytes, offset: int) -> None:
+        self._exact.setdefault(exact, []).append(offset)
+        self._normalized.setdefault(normalized, []).append(offset)
+
+    def _lookup(self, keys: Tuple[bytes, bytes]) -> Optional[int]:
+        for normalized, (key, index) in enumerate(zip(keys, (self._exact, self._normalized))):
+            offsets = index.get(key)
+            if offsets:
+                position = self._positions.get((bool(normalized), key), 0)
+                self._positions[(bool(normalized), key)] = position + 1
+                return offsets[min(position, len(offsets) - 1)]
+        return None
+
+    def _read(self, offset: int) -> httpx.Response:
+        data = self._remap()
+        _, _, status, headers_size, body_size = _RECORD.unpack_from(data, offset)
+        start = offset + _RECORD.size
+        headers = [(name, value) for name, value in json.loads(data[start:start + headers_size])]
+        content = data[start + headers_size:start + headers_size + body_size]
+        return httpx.Response(status, headers=headers, content=content)
+
+    def _append(self, keys: Tuple[bytes, bytes], response: httpx.Response) -> None:
+        headers = json.dumps([
+            [name, value] for name, value in response.headers.multi_items() if name.lower() not in _SKIPPED_HEADERS
+        ]).encode()
+        body = response.content
+        self._file.seek(self._size)
+        self._file.write(_RECORD.pack(*keys, response.status_code, len(headers), len(body)) + headers + body)
+        self._index(*keys, self._size)
+        self._size += _RECORD.size + len(headers) + len(body)
+        self.recorded += 1
+
+    def _replay(self, request: httpx.Request) -> Tuple[Tuple[bytes, bytes], Optional[httpx.Response]]:
+        path = request.url.path
+        with self._lock:
+            history = self._history.get(path, b"")
+            keys = request_keys(request, history, self._aliases)
+            if request.method in _MUTATING_METHODS:
+                self._history[path] = _digest(history, keys[1])
+            offset = self._lookup(keys) if self.mode is not CassetteMode.RECORD else None
+            if offset is None:
+                if self.mode is CassetteMode.REPLAY:
+                    raise RuntimeError(f"Запрос отсутствует в кассете {self.path}: {request.method} {request.url}")
+                return keys, None
+            self.replayed += 1
+            response = self._read(offset)
+            self._learn(request, keys, response)
+            return keys, response
+
+    def _store(self, request: httpx.Request, keys: Tuple[bytes, bytes], response: httpx.Response) -> httpx.Response:
+        with self._lock:
+            self._append(keys, response)
+            response = self._read(self._exact[keys[0]][-1])
+            self._learn(request, keys, response)
+            return response
+
+    def _learn(self, request: httpx.Request, keys: Tuple[bytes, bytes], response: httpx.Response) -> None:
+        if request.method != "POST" or response.status_code != 200:
+            return
+        try:
+            booking_id = json.loads(response.content).get("bookingid")
+        except (ValueError, AttributeError):
+            return
+        if isinstance(booking_id, int):
+            self._aliases[str(booking_id)] = "@" + keys[1].hex()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.read()
+        keys, response = self._replay(request)
+        if response is not None:
+            return response
+        if self.inner is None:
+            self.inner = httpx.HTTPTransport()
+        response = self.inner.handle_request(request)
+        try:
+            response.read()
+        finally:
+            response.close()
+        return self._store(request, keys, response)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await request.aread()
+        keys, response = self._replay(request)
+        if response is not None:
+            return response
+        if self.inner is None:
+            self.inner = httpx.AsyncHTTPTransport()
+        response = await self.inner.handle_async_request(request)
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        return self._store(request, keys, response)
+
+    def close(self) -> None:
+        """
+        Дописывает кассету на диск и закрывает файл и собственный транспорт записи.
+        """
+        with self._lock:
+            if self._file.closed:
+                return
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._file.close()
+        if self._owns_inner and isinstance(self.inner, httpx.BaseTransport):
+            self.inner.close()
+
+    async def aclose(self) -> None:
+        self.close()
+        if self._owns_inner and isinstance(self.inner, httpx.AsyncBaseTransport):
+            await self.inner.aclose()
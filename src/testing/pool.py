@@ -0,0 +1,204 @@
+#src/testing/pool.py
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+from src.api.booking_ids import BookingIdSet
+from src.api.client import BookerClient
+from src.api.models import Booking
+from src.api.routes import Routes
+
+
+class _TemplatePool:
+    """
+    Готовые и создаваемые бронирования одного шаблона данных и ещё не выделенный спрос на них.
+    """
+    __slots__ = ("key", "data", "booking", "ready", "pending", "demand")
+
+    def __init__(self, key: str, data: dict):
+        self.key = key
+        self.data = data
+        self.booking = Booking.model_validate(data)
+        self.ready: Deque[int] = deque()
+        self.pending: Deque[Future] = deque()
+        self.demand = 0
+
+
+class BookingPool:
+    """
+    Пул заранее созданных бронирований для тестов.
+
+    Бронирования создаются в фоновых потоках, тест получает готовое бронирование без
+    ожидания POST /booking, а пул асинхронно пополняется до target штук на шаблон.
+    Бронирования выдаются каждому тесту в единоличное пользование и не возвращаются в пул.
+
+    Фоновое создание ограничено спросом: каждое созданное бронирование забирает единицу
+    из оставшегося спроса шаблона, и пул не пополняется, когда спрос исчерпан, поэтому
+    в конце прогона не остаётся лишних бронирований. Спрос объявляется через prewarm
+    или, для нескольких процессов pytest-xdist, берётся из общей таблицы через claim.
+    """
+
+    def __init__(self, client: BookerClient, target: int = 2, workers: int = 4,
+                 on_create: Optional[Callable[[int], None]] = None, route: str = Routes.BOOKING,
+                 claim: Optional[Callable[[str, int], int]] = None):
+        """
+        Инициализирует BookingPool.
+
+        Args:
+           client (BookerClient): Клиент API.
+           target (int): Сколько бронирований каждого шаблона держать наготове.
+           workers (int): Число фоновых потоков создания.
+           on_create (Optional[Callable[[int], None]]): Вызывается с ID каждого созданного бронирования,
+              например для регистрации в реестре очистки.
+           route (str): Маршрут создания бронирований.
+           claim (Optional[Callable[[str, int], int]]): Выделяет до count единиц спроса шаблона
+              с ключом key и возвращает выделенное число, например SharedSessionState.claim.
+              По умолчанию спрос учитывается локально по вызовам prewarm.
+        """
+        self.client = client
+        self.target = target
+        self.on_create = on_create
+        self.route = route
+        self.claim = claim
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="booking-pool")
+        self._pools: Dict[str, _TemplatePool] = {}
+        # Колбэк уже завершившегося future вызывается сразу в _top_up под этой же блокировкой.
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def key(data: dict) -> str:
+        """
+        Возвращает ключ шаблона данных бронирования, не зависящий от порядка полей.
+        """
+        return json.dumps(data, sort_keys=True)
+
+    def _pool(self, data: dict) -> _TemplatePool:
+        key = self.key(data)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = _TemplatePool(key, data)
+        return pool
+
+    def _claim(self, pool: _TemplatePool, count: int) -> int:
+        if count <= 0:
+            return 0
+        if self.claim is not None:
+            return self.claim(pool.key, count)
+        granted = min(count, pool.demand)
+        pool.demand -= granted
+        return granted
+
+    def _create(self, pool: _TemplatePool) -> int:
+        booking_id = self.client.create_booking(pool.booking, self.route).booking_id
+        if self.on_create is not None:
+            self.on_create(booking_id)
+        return booking_id
+
+    def _on_created(self, pool: _TemplatePool, future: Future) -> None:
+        with self._lock:
+            if future in pool.pending:
+                pool.pending.remove(future)
+                if future.exception() is None:
+                    pool.ready.append(future.result())
+
+    def _top_up(self, pool: _TemplatePool, count: int) -> None:
+        for _ in range(self._claim(pool, count - len(pool.ready) - len(pool.pending))):
+            future = self._executor.submit(self._create, pool)
+            pool.pending.append(future)
+            future.add_done_callback(lambda done, pool=pool: self._on_created(pool, done))
+
+    def prewarm(self, data: dict, count: Optional[int] = None) -> None:
+        """
+        Запускает фоновое создание бронирований шаблона, не дожидаясь результата.
+
+        Без claim count также объявляет локальный спрос: столько бронирований шаблона
+        ожидается получить через acquire.
+
+        Args:
+           data (dict): Данные бронирования.
+           count (Optional[int]): Сколько бронирований подготовить. По умолчанию target.
+        """
+        count = self.target if count is None else count
+        with self._lock:
+            pool = self._pool(data)
+            if self.claim is None:
+                pool.demand += count
+            self._top_up(pool, count)
+
+    def acquire(self, data: dict) -> Tuple[int, dict]:
+        """
+        Выдаёт бронирование шаблона и, пока остаётся спрос, запускает пополнение пула.
+
+        Если готовых бронирований нет, ожидает ближайшее создаваемое; если не создаётся и
+        оно, создаёт бронирование синхронно, забирая единицу спроса, если она осталась.
+
+        Args:
+           data (dict): Данные бронирования.
+
+        Returns:
+           Tuple[int, dict]: ID бронирования и исходные данные.
+
+        Raises:
+           RuntimeError: Если создание бронирования завершилось ошибкой API.
+        """
+        with self._lock:
+            pool = self._pool(data)
+            booking_id = pool.ready.popleft() if pool.ready else None
+            future = pool.pending.popleft() if booking_id is None and pool.pending else None
+            if booking_id is None and future is None:
+                self._claim(pool, 1)
+            self._top_up(pool, self.target)
+        if booking_id is None:
+            booking_id = future.result() if future is not None else self._create(pool)
+        return booking_id, pool.data
+
+    def close(self) -> None:
+        """
+        Дожидается фоновых созданий и останавливает потоки пула.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+class BookingIdSnapshot:
+    """
+    Снимок ID бронирований, обновляемый не чаще одного раза в ttl секунд.
+
+    Заменяет GET /booking на каждый тест одним запросом на интервал.
+    """
+
+    def __init__(self, loader: Callable[[], BookingIdSet], ttl: float = 30.0):
+        """
+        Инициализирует BookingIdSnapshot.
+
+        Args:
+           loader (Callable[[], BookingIdSet]): Функция загрузки ID, например client.get_booking_ids_compact.
+           ttl (float): Время жизни снимка в секундах.
+        """
+        self.loader = loader
+        self.ttl = ttl
+        self._ids: Optional[BookingIdSet] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> BookingIdSet:
+        """
+        Возвращает актуальный снимок, загружая его при отсутствии или устаревании.
+
+        Returns:
+           BookingIdSet: ID бронирований.
+        """
+        with self._lock:
+            if self._ids is None or time.monotonic() - self._loaded_at >= self.ttl:
+                self._ids = self.loader()
+                self._loaded_at = time.monotonic()
+            return self._ids
+
+    def invalidate(self) -> None:
+        """
+        Помечает снимок устаревшим.
+        """
+        with self._lock:
+            self._ids = None
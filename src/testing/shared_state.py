@@ -0,0 +1,233 @@
+#src/testing/shared_state.py
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional
+
+from src.api.auth import TokenProvider
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """
+    Межпроцессная эксклюзивная блокировка на основе файла (fcntl на POSIX, msvcrt на Windows).
+
+    Блокировка не реентерабельна: повторный захват тем же процессом приведёт к взаимной блокировке.
+
+    Args:
+        path (Path): Путь к файлу блокировки.
+    """
+    with open(path, "a+b") as handle:
+        if os.name == "nt":
+            import msvcrt
+
+            handle.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    time.sleep(0.05)
+            try:
+                yield
+            finally:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+class SharedSessionState:
+    """
+    Общее состояние тестового прогона в каталоге, разделяемом процессами pytest-xdist.
+
+    Хранит токен аутентификации, однократно созданные объекты и реестр созданных
+    бронирований, по которому в конце прогона выполняется единая очистка.
+    """
+
+    def __init__(self, root: Path):
+        """
+        Инициализирует SharedSessionState.
+
+        Args:
+           root (Path): Каталог общего состояния; создаётся при необходимости.
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._ledger = self.root / "bookings.ledger"
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+
+    @contextmanager
+    def lock(self) -> Iterator[None]:
+        """
+        Эксклюзивная блокировка общего состояния между процессами и потоками.
+
+        Реентерабельна в пределах потока, поэтому memoize может вызывать register_booking.
+        """
+        with self._thread_lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield
+                finally:
+                    self._depth -= 1
+                return
+            with file_lock(self.root / "state.lock"):
+                self._depth = 1
+                try:
+                    yield
+                finally:
+                    self._depth = 0
+
+    def read(self, key: str) -> Optional[Any]:
+        """
+        Читает значение по ключу без блокировки.
+
+        Args:
+           key (str): Ключ значения.
+
+        Returns:
+           Optional[Any]: Значение или None, если оно не сохранено.
+        """
+        path = self.root / f"{key}.json"
+        if not path.exists():
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def write(self, key: str, value: Any) -> None:
+        """
+        Атомарно сохраняет JSON-совместимое значение по ключу.
+
+        Args:
+           key (str): Ключ значения.
+           value (Any): Значение.
+        """
+        path = self.root / f"{key}.json"
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_text(json.dumps(value), encoding="utf-8")
+        os.replace(temporary, path)
+
+    def delete(self, key: str) -> None:
+        """
+        Удаляет значение по ключу.
+        """
+        (self.root / f"{key}.json").unlink(missing_ok=True)
+
+    def memoize(self, key: str, factory: Callable[[], Any]) -> Any:
+        """
+        Возвращает значение по ключу, вычисляя его один раз на весь прогон.
+
+        Args:
+           key (str): Ключ значения.
+           factory (Callable): Функция, вычисляющая JSON-совместимое значение.
+
+        Returns:
+           Any: Сохранённое или только что вычисленное значение.
+        """
+        with self.lock():
+            value = self.read(key)
+            if value is None:
+                value = factory()
+                self.write(key, value)
+            return value
+
+    def claim(self, key: str, name: str, count: int) -> int:
+        """
+        Атомарно забирает до count единиц из счётчика name в словаре, сохранённом по ключу key.
+
+        Args:
+           key (str): Ключ словаря счётчиков, например записанного через memoize.
+           name (str): Имя счётчика.
+           count (int): Сколько единиц запрошено.
+
+        Returns:
+           int: Сколько единиц выдано; 0, если счётчика нет или он исчерпан.
+        """
+        with self.lock():
+            counters = self.read(key) or {}
+            granted = max(0, min(count, counters.get(name, 0)))
+            if granted:
+                counters[name] -= granted
+                self.write(key, counters)
+            return granted
+
+    def register_booking(self, booking_id: int) -> None:
+        """
+        Добавляет ID созданного бронирования в общий реестр.
+
+        Args:
+           booking_id (int): ID бронирования.
+        """
+        with self.lock(), open(self._ledger, "a", encoding="utf-8") as ledger:
+            ledger.write(f"{booking_id}\n")
+
+    def booking_ids(self) -> List[int]:
+        """
+        Возвращает ID всех зарегистрированных бронирований без повторов.
+
+        Returns:
+           List[int]: ID в порядке регистрации.
+        """
+        if not self._ledger.exists():
+            return []
+        with self.lock():
+            lines = self._ledger.read_text(encoding="utf-8").split()
+        return list(dict.fromkeys(int(line) for line in lines))
+
+
+class SharedTokenProvider(TokenProvider):
+    """
+    TokenProvider, разделяющий токен между процессами через SharedSessionState.
+
+    Процесс сначала использует свой кэш, затем общий файл токена, и только если оба
+    устарели, под межпроцессной блокировкой выполняет POST /auth: один запрос на весь прогон.
+    """
+
+    _KEY = "auth_token"
+
+    def __init__(self, user_name: str, password: str, state: SharedSessionState, **kwargs):
+        """
+        Инициализирует SharedTokenProvider.
+
+        Args:
+           user_name (str): Имя пользователя.
+           password (str): Пароль пользователя.
+           state (SharedSessionState): Общее состояние прогона.
+           **kwargs: Параметры TokenProvider (route, ttl, refresh_margin).
+        """
+        super().__init__(user_name, password, **kwargs)
+        self.state = state
+
+    def get_token(self, client) -> str:
+        token = self._fresh_token()
+        if token is not None:
+            return token
+        with self._lock, self.state.lock():
+            token = self._fresh_token()
+            if token is not None:
+                return token
+            shared = self.state.read(self._KEY)
+            if shared is not None and time.time() < shared["expires_at"] - self.refresh_margin:
+                self._token = shared["token"]
+                self._expires_at = time.monotonic() + (shared["expires_at"] - time.time())
+                return self._token
+            token = self._store(client.authenticate(self.user_name, self.password, self.route).token)
+            self.state.write(self._KEY, {"token": token, "expires_at": time.time() + self.ttl})
+            return token
+
+    def invalidate(self, token: Optional[str] = None) -> None:
+        super().invalidate(token)
+        with self.state.lock():
+            shared = self.state.read(self._KEY)
+            if shared is not None and (token is None or shared["token"] == token):
+                self.state.delete(self._KEY)
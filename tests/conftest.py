@@ -1,64 +1,278 @@
 #tests/conftest.py
 
 import logging
+import shutil
+import tempfile
+from typing import Optional
 import allure
+import httpx
 import pytest
+from src.api.auth import TokenProvider
+from src.api.cache import ResponseCache
 from src.api.client import BookerClient
+from src.api.decoding import ValidationLevel
+from src.api.metrics import RequestMetrics
 from src.api.models import Booking
 from src.api.routes import Routes
-from src.config import settings
-import random
+from src.fake.restful_booker import OFFLINE_BASE_URL, FakeRestfulBooker
+from src.testing.cassette import CassetteMode, CassetteTransport
+from src.testing.pool import BookingIdSnapshot, BookingPool
+from src.testing.shared_state import SharedSessionState, SharedTokenProvider
+
+STATE_DIR_KEY = pytest.StashKey[str]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--offline",
+        action="store_true",
+        default=False,
+        help="Запускать тесты против FakeRestfulBooker в памяти, без обращения к сети",
+    )
+    parser.addoption(
+        "--latency-report",
+        action="store_true",
+        default=False,
+        help="Прикреплять к отчёту Allure таблицу задержек запросов каждого теста",
+    )
+    parser.addoption(
+        "--cassette",
+        default=None,
+        help="Путь к кассете запросов: записывать в неё ответы API или воспроизводить их без сети",
+    )
+    parser.addoption(
+        "--cassette-mode",
+        default=CassetteMode.REPLAY.value,
+        choices=[mode.value for mode in CassetteMode],
+        help="replay — только из кассеты, record — перезаписать кассету, auto — дозаписывать новые запросы",
+    )
+
+
+def _cassette(config, mode=None):
+    """
+    Создаёт транспорт кассеты по опциям --cassette и --cassette-mode.
+
+    Returns:
+        Optional[CassetteTransport]: транспорт или None, если кассета не задана или прогон офлайн.
+    """
+    path = config.getoption("--cassette")
+    if path is None or config.getoption("--offline"):
+        return None
+    return CassetteTransport(path, mode or config.getoption("--cassette-mode"))
+
+
+def pytest_configure(config):
+    """
+    Выбирает каталог общего состояния прогона.
+
+    Контроллер pytest-xdist (или обычный прогон) создаёт каталог и передаёт его воркерам,
+    поэтому токен, однократно созданные бронирования и реестр очистки общие для всех процессов.
+    С опцией --offline у каждого воркера свой FakeRestfulBooker, поэтому и состояние своё.
+    """
+    workerinput = getattr(config, "workerinput", None)
+    if config.getoption("--cassette") and config.getoption("--cassette-mode") != CassetteMode.REPLAY.value:
+        if workerinput is not None or config.getoption("numprocesses", None):
+            raise pytest.UsageError("Запись кассеты не поддерживается в параллельном прогоне pytest-xdist")
+    if workerinput is not None and not config.getoption("--offline"):
+        config.stash[STATE_DIR_KEY] = workerinput["booker_state_dir"]
+    else:
+        config.stash[STATE_DIR_KEY] = tempfile.mkdtemp(prefix="booker-state-")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    node.workerinput["booker_state_dir"] = node.config.stash[STATE_DIR_KEY]
+
+
+def pytest_sessionfinish(session):
+    """
+    Удаляет все бронирования из общего реестра одним пакетом и каталог состояния.
+
+    В прогоне pytest-xdist очистку выполняет контроллер после завершения всех воркеров;
+    offline-воркеры только удаляют свой каталог, так как их данные живут в памяти.
+    """
+    config = session.config
+    state_dir = config.stash.get(STATE_DIR_KEY, None)
+    if state_dir is None:
+        return
+    is_worker = hasattr(config, "workerinput")
+    offline = config.getoption("--offline")
+    if is_worker and not offline:
+        return
+    state = SharedSessionState(state_dir)
+    booking_ids = state.booking_ids()
+    if booking_ids and not offline:
+        # Удаления после записи дописываются в ту же кассету, а не перезаписывают её.
+        recording = config.getoption("--cassette-mode") == CassetteMode.RECORD.value
+        client = BookerClient(token_provider=SharedTokenProvider.from_settings(state=state),
+                              transport=_cassette(config, CassetteMode.AUTO if recording else None))
+        try:
+            result = client.delete_many(booking_ids)
+            for failed in result.failed:
+                logging.warning(f"Ошибка при удалении бронирования {failed.item}: {failed.error}")
+        finally:
+            client.close()
+    shutil.rmtree(state_dir, ignore_errors=True)
+
 
 @pytest.fixture(scope="session")
-def client() -> BookerClient():
+def shared_state(pytestconfig) -> SharedSessionState:
+    """
+    Фикстура общего состояния прогона, разделяемого процессами pytest-xdist.
+
+    Returns:
+        SharedSessionState: общее состояние.
+    """
+    return SharedSessionState(pytestconfig.stash[STATE_DIR_KEY])
+
+
+@pytest.fixture(scope="session")
+def client(request, shared_state: SharedSessionState) -> BookerClient:
     """
     Фикстура для создания и управления клиентом BookerClient.
 
     Создаёт экземпляр клиента для работы с API бронирования, используемый в тестах на протяжении всей сессии.
+    Клиент получает SharedTokenProvider, поэтому токен запрашивается один раз на прогон,
+    в том числе при параллельном запуске через pytest-xdist.
+    С опцией --offline клиент работает с FakeRestfulBooker через httpx транспорт без сети,
+    с опцией --cassette — записывает ответы API в кассету или воспроизводит их из неё.
+    Метрики запросов собираются в client.metrics.
     После завершения тестовой сессии закрывает клиент, освобождая ресурсы.
 
     Returns:
         BookerClient: экземпляр клиента для взаимодействия с API.
     """
-    client = BookerClient()
+    if request.config.getoption("--offline"):
+        transport = FakeRestfulBooker.from_settings()
+        token_provider = SharedTokenProvider(transport.user_name, transport.password, state=shared_state)
+        client = BookerClient(OFFLINE_BASE_URL, token_provider=token_provider, transport=transport,
+                              metrics=RequestMetrics())
+    else:
+        client = BookerClient(token_provider=SharedTokenProvider.from_settings(state=shared_state),
+                              transport=_cassette(request.config), metrics=RequestMetrics())
     yield client
     try:
         client.close()
     except Exception as e:
         logging.warning(f"Ошибка при закрытии клиента: {e}")
 
+@pytest.fixture(scope="function")
+def offline_client():
+    """
+    Фикстура-фабрика клиентов BookerClient к FakeRestfulBooker без сети и прогрева соединений.
+
+    Фабрика принимает fake (по умолчанию пустой FakeRestfulBooker, с учётными данными которого
+    создаётся TokenProvider), а также необязательные transport вместо самого fake, cache,
+    metrics, validation и параметры TokenProvider (ttl, refresh_margin). Созданные клиенты
+    закрываются после теста.
+
+    Returns:
+        Callable[..., BookerClient]: фабрика клиентов.
+    """
+    clients = []
+
+    def _create(fake: Optional[FakeRestfulBooker] = None, transport: Optional[httpx.BaseTransport] = None,
+                cache: Optional[ResponseCache] = None, metrics: Optional[RequestMetrics] = None,
+                validation: ValidationLevel = ValidationLevel.STRICT, **provider_options) -> BookerClient:
+        if fake is None:
+            fake = FakeRestfulBooker(dataset_size=0)
+        client = BookerClient(OFFLINE_BASE_URL, token_provider=TokenProvider(fake.user_name, fake.password,
+                                                                             **provider_options),
+                              cache=cache, transport=transport or fake, metrics=metrics,
+                              warmup_connections=0, validation=validation)
+        clients.append(client)
+        return client
+
+    yield _create
+    for client in clients:
+        client.close()
+
+@pytest.fixture(autouse=True)
+def latency_report(request):
+    """
+    Фикстура, прикрепляющая к отчёту Allure таблицу задержек запросов теста.
+
+    Активна только с опцией --latency-report и только для тестов, использующих фикстуру client.
+    """
+    if not request.config.getoption("--latency-report") or "client" not in request.fixturenames:
+        yield
+        return
+    client = request.getfixturevalue("client")
+    with client.metrics.capture() as test_metrics:
+        yield
+    test_metrics.attach_to_allure()
+
 @pytest.fixture(scope="session")
-def create_booking(client: BookerClient):
+def create_booking(client: BookerClient, shared_state: SharedSessionState):
     """
     Фикстура для создания бронирования через API.
 
     Возвращает функцию, которая принимает данные бронирования, валидирует их и создаёт бронирование.
-    Все созданные бронирования будут удалены после завершения сессии тестов.
+    ID созданных бронирований заносятся в общий реестр и удаляются одним пакетом в конце прогона.
 
     Returns:
         function: Функция для создания бронирования, возвращающая кортеж (booking_id, исходные данные).
     """
-    created_ids: list[int] = []
-
     def _create(booking_data, route=Routes.BOOKING):
         booking = Booking.model_validate(booking_data)
         with allure.step("Создаем бронирование"):
             response = client.create_booking(booking, route)
-            created_ids.append(response.booking_id)
+            shared_state.register_booking(response.booking_id)
             return response.booking_id, booking_data
 
-    yield _create
+    return _create
+
+@pytest.fixture(scope="session")
+def booking_pool(request, client: BookerClient, shared_state: SharedSessionState):
+    """
+    Фикстура пула заранее созданных бронирований.
 
-    if created_ids:
-        token = client.authenticate(settings.user_name, settings.password, Routes.AUTH).token
-        for booking_id in created_ids:
-            with allure.step(f"Удаление бронирования с ID {booking_id}"):
-                try:
-                    delete_route = Routes.booking_by_id(booking_id)
-                    client.delete_booking(delete_route, token)
-                except Exception as e:
-                    logging.warning(f"Ошибка при удалении бронирования {booking_id}: {e}")
-                    pass
+    Спрос — сколько тестов, использующих pooled_booking, ждут бронирование с данными
+    каждого шаблона booking_test_data — один раз на прогон заносится в общую таблицу.
+    Каждый процесс pytest-xdist заранее создаёт не больше target бронирований на шаблон
+    и дальше пополняет пул только из остатка общей таблицы, поэтому всего создаётся
+    не больше бронирований, чем тестов. Созданные бронирования заносятся в общий реестр
+    и удаляются в конце прогона.
+
+    Returns:
+        BookingPool: пул бронирований.
+    """
+    templates: dict[str, dict] = {}
+    demand: dict[str, int] = {}
+    for item in request.session.items:
+        callspec = getattr(item, "callspec", None)
+        if "pooled_booking" not in getattr(item, "fixturenames", ()) or callspec is None:
+            continue
+        data = callspec.params.get("booking_test_data")
+        if isinstance(data, dict):
+            key = BookingPool.key(data)
+            templates[key] = data
+            demand[key] = demand.get(key, 0) + 1
+    shared_state.memoize("booking_pool_demand", lambda: demand)
+    pool = BookingPool(client, on_create=shared_state.register_booking,
+                       claim=lambda key, count: shared_state.claim("booking_pool_demand", key, count))
+    for data in templates.values():
+        pool.prewarm(data)
+    yield pool
+    pool.close()
+
+@pytest.fixture(scope="function")
+def pooled_booking(booking_pool: BookingPool, booking_test_data):
+    """
+    Фикстура, выдающая тесту готовое бронирование с данными booking_test_data из пула.
+
+    Returns:
+        кортеж (booking_id, исходные данные).
+    """
+    with allure.step("Получаем бронирование из пула"):
+        return booking_pool.acquire(booking_test_data)
+
+@pytest.fixture(scope="session")
+def booking_id_snapshot(client: BookerClient) -> BookingIdSnapshot:
+    """
+    Фикстура снимка ID бронирований, обновляемого по TTL вместо запроса на каждый тест.
+    """
+    return BookingIdSnapshot(lambda: client.get_booking_ids_compact(Routes.BOOKING))
 
 @pytest.fixture(scope="session")
 def get_auth_token(client: BookerClient) -> str:
@@ -74,34 +288,31 @@ def get_auth_token(client: BookerClient) -> str:
        str: токен аутентификации.
     """
     with allure.step("Получение токена аутентификации"):
-        auth_response = client.authenticate(settings.user_name, settings.password, Routes.AUTH)
-    return auth_response.token
+        token = client.token_provider.get_token(client)
+    return token
 
 @pytest.fixture(scope="session")
 def default_booking_test_data():
     pass
 
 @pytest.fixture(scope="session")
-def created_booking_once(client, create_booking, default_booking_test_data):
+def created_booking_once(shared_state, create_booking, default_booking_test_data):
     """
-    Фикстура, которая создаёт бронирование один раз за сессию
+    Фикстура, которая создаёт бронирование один раз за прогон, в том числе для всех воркеров pytest-xdist.
+
+    Бронирование удаляется вместе с остальными из общего реестра в конце прогона.
 
     Returns:
         booking_id и данные.
     """
-    booking_id, data = create_booking(default_booking_test_data)
-
-    yield booking_id, data
-
-    token = client.authenticate(settings.user_name, settings.password, Routes.AUTH).token
-    try:
-        client.delete_booking(Routes.booking_by_id(booking_id), token)
-    except Exception as e:
-        logging.warning(f"Ошибка при удалении бронирования {booking_id}: {e}")
+    booking_id, data = shared_state.memoize(
+        "created_booking_once", lambda: list(create_booking(default_booking_test_data))
+    )
+    return booking_id, data
 
 @pytest.fixture(scope="function")
-def random_booking_id(client) -> int:
-    booking_ids = client.get_booking_ids(Routes.BOOKING)
+def random_booking_id(booking_id_snapshot: BookingIdSnapshot) -> int:
+    booking_ids = booking_id_snapshot.get()
     if not booking_ids:
         pytest.skip("Нет доступных бронирований для выбора случайного ID")
-    return random.choice(booking_ids).booking_id
\ No newline at end of file
+    return booking_ids.sample()
\ No newline at end of file
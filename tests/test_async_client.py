@@ -0,0 +1,110 @@
+#tests/test_async_client.py
+import asyncio
+
+import allure
+import httpx
+import pytest
+
+from src.api.auth import TokenProvider
+from src.api.client import AsyncBookerClient
+from src.api.models import Booking, BookingPatch
+from src.api.routes import Routes
+from src.fake.restful_booker import OFFLINE_BASE_URL, FakeRestfulBooker
+
+BOOKING = {
+    "firstname": "Async",
+    "lastname": "Booking",
+    "totalprice": 120,
+    "depositpaid": False,
+    "bookingdates": {"checkin": "2025-07-01", "checkout": "2025-07-04"},
+    "additionalneeds": "Breakfast",
+}
+
+
+class _InFlightCounter(httpx.AsyncBaseTransport):
+    """
+    Транспорт, запоминающий наибольшее число одновременных запросов к FakeRestfulBooker.
+    """
+
+    def __init__(self, fake: FakeRestfulBooker):
+        self.fake = fake
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return await self.fake.handle_async_request(request)
+        finally:
+            self.in_flight -= 1
+
+
+@allure.feature("Async client")
+class TestAsyncBookerClient:
+    @allure.title("Число одновременных запросов не превышает max_concurrency")
+    def test_max_concurrency(self):
+        """
+        Проверяет, что 30 одновременных get_booking к медленному FakeRestfulBooker выполняются
+        не более чем по max_concurrency за раз и что лимит используется полностью.
+        """
+        transport = _InFlightCounter(FakeRestfulBooker(dataset_size=30, latency=0.01))
+
+        async def _run() -> list:
+            async with AsyncBookerClient(OFFLINE_BASE_URL, max_concurrency=4, transport=transport) as client:
+                return await asyncio.gather(*(client.get_booking(Routes.booking_by_id(booking_id))
+                                              for booking_id in range(1, 31)))
+
+        assert len(asyncio.run(_run())) == 30
+        assert transport.max_in_flight == 4
+
+    @allure.title("max_concurrency меньше 1 отклоняется")
+    @pytest.mark.parametrize("max_concurrency", [0, -1])
+    def test_invalid_max_concurrency(self, max_concurrency):
+        """
+        Проверяет, что клиент без единого слота семафора не создаётся.
+        """
+        with pytest.raises(ValueError):
+            AsyncBookerClient(OFFLINE_BASE_URL, max_concurrency=max_concurrency, transport=FakeRestfulBooker())
+
+    @allure.title("Асинхронные методы возвращают те же модели, что и BookerClient")
+    def test_matches_sync_client(self, offline_client):
+        """
+        Проверяет, что create, get, update, patch и delete на двух одинаковых FakeRestfulBooker
+        дают одинаковые результаты в синхронном и асинхронном клиентах.
+        """
+        sync_fake, async_fake = FakeRestfulBooker(dataset_size=5, seed=3), FakeRestfulBooker(dataset_size=5, seed=3)
+        updated = {**BOOKING, "firstname": "Updated"}
+        patch = BookingPatch(totalprice=99)
+
+        def _sync_calls() -> list:
+            client = offline_client(sync_fake)
+            created = client.create_booking(Booking.model_validate(BOOKING), Routes.BOOKING)
+            route = Routes.booking_by_id(created.booking_id)
+            return [
+                created,
+                client.get_booking(route),
+                client.update_booking(Booking.model_validate(updated), route),
+                client.patch_booking(patch, route),
+                client.get_booking_ids(Routes.BOOKING),
+                client.delete_booking(route),
+            ]
+
+        async def _async_calls() -> list:
+            provider = TokenProvider(async_fake.user_name, async_fake.password)
+            async with AsyncBookerClient(OFFLINE_BASE_URL, transport=async_fake, token_provider=provider) as client:
+                created = await client.create_booking(Booking.model_validate(BOOKING), Routes.BOOKING)
+                route = Routes.booking_by_id(created.booking_id)
+                return [
+                    created,
+                    await client.get_booking(route),
+                    await client.update_booking(Booking.model_validate(updated), route),
+                    await client.patch_booking(patch, route),
+                    await client.get_booking_ids(Routes.BOOKING),
+                    await client.delete_booking(route),
+                ]
+
+        sync_results, async_results = _sync_calls(), asyncio.run(_async_calls())
+        assert sync_results == async_results
+        assert sync_results[3].total_price == 99 and sync_results[3].first_name == "Updated"
+        assert sync_fake.bookings == async_fake.bookings
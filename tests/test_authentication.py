@@ -3,7 +3,6 @@ import allure
 import pytest
 
 from src.api.routes import Routes
-from src.config import settings
 
 
 @allure.feature("Authentication")
@@ -16,7 +15,7 @@ class TestAuthentication:
         Проверяет, что возвращается валидный токен в виде непустой строки.
         """
         with allure.step("Аутентификация с корректными данными"):
-            token = client.authenticate(settings.user_name, settings.password, Routes.AUTH).token
+            token = client.authenticate(client.token_provider.user_name, client.token_provider.password, Routes.AUTH).token
         assert isinstance(token, str)
         assert len(token) > 0
 
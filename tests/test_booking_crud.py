@@ -45,14 +45,13 @@ class TestBookingCRUD:
         assert booking_id > 0, "ID бронирования должен быть положительным"
 
     @allure.title("Получение бронирования по ID")
-    def test_get_booking(self, client, create_booking,booking_test_data):
+    def test_get_booking(self, client, pooled_booking, booking_test_data):
         """
         Проверяет получение бронирования по ID.
 
         Сравнивает полученные данные с исходными.
         """
-        with allure.step("Создание бронирования для получения"):
-            booking_id, test_data = create_booking(booking_test_data)
+        booking_id, test_data = pooled_booking
         route = Routes.booking_by_id(booking_id)
         with allure.step(f"Получение бронирования с ID {booking_id}"):
             response = client.get_booking(route)
@@ -66,14 +65,13 @@ class TestBookingCRUD:
             "additionalneeds": "Lunch"
         }
     ])
-    def test_update_booking(self, client, get_auth_token, create_booking,booking_test_data, updated_test_data):
+    def test_update_booking(self, client, get_auth_token, pooled_booking, booking_test_data, updated_test_data):
         """
         Проверяет обновление бронирования с новыми данными.
 
         Проверяет, что обновлённые данные совпадают с ожидаемыми.
         """
-        with allure.step("Создание бронирования для обновления"):
-            booking_id, data = create_booking(booking_test_data)
+        booking_id, data = pooled_booking
         test_data = {**booking_test_data, **updated_test_data}
         updated_booking_test_data = Booking.model_validate(test_data)
         route = Routes.booking_by_id(booking_id)
@@ -81,15 +79,34 @@ class TestBookingCRUD:
             response = client.update_booking(updated_booking_test_data, route, get_auth_token)
         assert response == Booking.model_validate(test_data)
 
+    @allure.title("Частичное обновление бронирования")
+    @pytest.mark.parametrize("updated_test_data", [
+        {
+            "firstname": "PatchedName",
+            "totalprice": 250,
+            "additionalneeds": "Dinner"
+        }
+    ])
+    def test_patch_booking(self, client, get_auth_token, pooled_booking, booking_test_data, updated_test_data):
+        """
+        Проверяет, что PATCH с минимальным изменением обновляет только отличающиеся поля.
+        """
+        booking_id, data = pooled_booking
+        original = Booking.model_validate(booking_test_data)
+        updated = Booking.model_validate({**booking_test_data, **updated_test_data})
+        route = Routes.booking_by_id(booking_id)
+        with allure.step(f"Частичное обновление бронирования с ID {booking_id}"):
+            response = client.patch_booking_diff(original, updated, route, get_auth_token)
+        assert response == updated
+
     @allure.title("Удаление бронирования")
-    def test_delete_booking(self, client, get_auth_token, create_booking, booking_test_data):
+    def test_delete_booking(self, client, get_auth_token, pooled_booking, booking_test_data):
         """
         Проверяет удаление бронирования и невозможность его последующего получения.
 
         Ожидает ошибку 404 при попытке получить удалённое бронирование.
         """
-        with allure.step("Создание бронирования для удаления"):
-            booking_id, _ = create_booking(booking_test_data)
+        booking_id, _ = pooled_booking
         route = Routes.booking_by_id(booking_id)
         with allure.step(f"Удаление бронирования с ID {booking_id}"):
             client.delete_booking(route, get_auth_token)
@@ -0,0 +1,140 @@
+#tests/test_booking_ids.py
+import asyncio
+import json
+import random
+
+import allure
+import pytest
+
+from src.api.booking_ids import BookingIdSet, BookingIdStreamParser
+from src.api.client import AsyncBookerClient, BookerClient
+from src.api.metrics import RequestMetrics
+from src.api.resilience import ResiliencePolicy, RetryPolicy
+from src.api.routes import Routes
+from src.fake.restful_booker import OFFLINE_BASE_URL, FakeRestfulBooker
+
+
+def _body(ids) -> bytes:
+    return json.dumps([{"bookingid": booking_id} for booking_id in ids]).encode()
+
+
+@allure.feature("Booking ID set")
+class TestBookingIdSet:
+    @allure.title("Извлечение ID регулярным выражением из тела GET /booking")
+    def test_from_json(self):
+        """
+        Проверяет, что ID извлекаются при любых пробелах, сортируются и очищаются от повторов,
+        а тело с ошибкой API и не-массив отклоняются.
+        """
+        content = b'[ {"bookingid" : 7}, {"bookingid":3},{ "bookingid": 7 }, {"bookingid": 12}]'
+        ids = BookingIdSet.from_json(content)
+        assert list(ids) == [3, 7, 12] and ids.nbytes == 24
+        assert list(BookingIdSet.from_json(b"[]")) == []
+        with pytest.raises(RuntimeError, match="API Ошибка"):
+            BookingIdSet.from_json(b'{"reason": "Bad credentials"}')
+        with pytest.raises(RuntimeError, match="ожидался массив"):
+            BookingIdSet.from_json(b"Not Found")
+
+    @allure.title("Разность, принадлежность и случайный выбор")
+    def test_set_operations(self):
+        """
+        Проверяет разность снимков слиянием, бинарный поиск и воспроизводимый выбор по seed.
+        """
+        before = BookingIdSet([5, 1, 3, 9, 7])
+        after = BookingIdSet([3, 4, 9])
+        assert list(before - after) == [1, 5, 7]
+        assert list(after.difference(before)) == [4]
+        assert list(before - BookingIdSet()) == [1, 3, 5, 7, 9]
+        assert 7 in before and 4 not in before and "7" not in before and 10 not in before
+        assert before == BookingIdSet([9, 7, 5, 3, 1, 1]) and before[0] == 1 and len(before) == 5
+        assert {before.sample(random.Random(0)) for _ in range(50)} <= set(before)
+        assert before.sample(random.Random(4)) == before.sample(random.Random(4))
+        with pytest.raises(IndexError):
+            BookingIdSet().sample()
+
+    @allure.title("Потоковый парсер собирает ID, разрезанные на границах фрагментов")
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64])
+    def test_stream_chunk_boundaries(self, chunk_size):
+        """
+        Проверяет, что при любом размере фрагмента, в том числе внутри ключа и числа,
+        парсер возвращает все ID ровно один раз.
+        """
+        ids = [1, 22, 333, 4444, 55555]
+        content = b"  " + _body(ids)
+        parser, parsed = BookingIdStreamParser(), []
+        for offset in range(0, len(content), chunk_size):
+            parsed.extend(parser.feed(content[offset:offset + chunk_size]))
+        parser.close()
+        assert parsed == ids
+
+    @allure.title("Оборванное тело и тело с ошибкой API отклоняются потоковым парсером")
+    def test_stream_errors(self):
+        """
+        Проверяет, что close() выбрасывает RuntimeError для тела, оборванного внутри массива,
+        и для объекта вместо массива (с причиной для {"reason": ...}), даже если тело пришло по байту.
+        """
+        content = _body([1, 2, 3])
+        parser = BookingIdStreamParser()
+        assert parser.feed(content[:-5]) == [1, 2]
+        with pytest.raises(RuntimeError, match="оборван"):
+            parser.close()
+        for content, message in ((b'{"reason": "Bad credentials"}', "Bad credentials"),
+                                 (b'{"bookingid": 1}', "ожидался массив"),
+                                 (b"  ", "ожидался массив")):
+            parser = BookingIdStreamParser()
+            assert [booking_id for byte in range(len(content))
+                    for booking_id in parser.feed(content[byte:byte + 1])] == []
+            with pytest.raises(RuntimeError, match=message):
+                parser.close()
+
+    @allure.title("Тело, не являющееся массивом, отклоняется по первому значащему байту")
+    def test_stream_rejects_non_array_early(self):
+        """
+        Проверяет, что feed() выбрасывает RuntimeError, как только первый значащий байт тела
+        не "[" и не "{", не дожидаясь остального тела и close().
+        """
+        for content in (b"Not Found", b"\n  <html><body>502 Bad Gateway</body></html>", b"42"):
+            parser = BookingIdStreamParser()
+            position = len(content) - len(content.lstrip())
+            assert parser.feed(content[:position]) == []
+            with pytest.raises(RuntimeError, match="ожидался массив"):
+                parser.feed(content[position:position + 1])
+
+
+@allure.feature("Booking ID set")
+class TestIterBookingIds:
+    @allure.title("Потребитель потока ID может вызывать клиент при max_concurrency=1")
+    def test_async_stream_does_not_hold_semaphore(self):
+        """
+        Проверяет, что AsyncBookerClient.iter_booking_ids не удерживает слот семафора,
+        пока выдаёт ID, и get_booking для каждого ID не блокируется.
+        """
+        async def _run() -> list:
+            async with AsyncBookerClient(OFFLINE_BASE_URL, max_concurrency=1,
+                                         transport=FakeRestfulBooker(dataset_size=5)) as client:
+                names = []
+                async for booking_id in client.iter_booking_ids(Routes.BOOKING):
+                    names.append((await client.get_booking(Routes.booking_by_id(booking_id))).first_name)
+                return names
+
+        assert len(asyncio.run(asyncio.wait_for(_run(), timeout=5))) == 5
+
+    @allure.title("Поток ID проходит через повторы и фиксирует метрики при ошибке")
+    def test_sync_stream_uses_send_path(self):
+        """
+        Проверяет, что BookerClient.iter_booking_ids повторяет запрос после 503 по политике
+        устойчивости, а при неустранённой ошибке ответ учитывается в метриках.
+        """
+        fake = FakeRestfulBooker(dataset_size=10, error_rate=0.5, seed=1)
+        policy = ResiliencePolicy(RetryPolicy(max_attempts=20, backoff_base=0.0), failure_threshold=100)
+        client = BookerClient(OFFLINE_BASE_URL, transport=fake, resilience=policy, warmup_connections=0)
+        for _ in range(5):
+            assert list(client.iter_booking_ids(Routes.BOOKING, batch_size=4)) == [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]]
+        assert fake.request_count > 5
+
+        metrics = RequestMetrics()
+        client = BookerClient(OFFLINE_BASE_URL, transport=FakeRestfulBooker(error_rate=1.0), metrics=metrics,
+                              warmup_connections=0)
+        with pytest.raises(RuntimeError):
+            list(client.iter_booking_ids(Routes.BOOKING))
+        assert metrics.snapshot()["GET /booking"]["statuses"] == {"503": 1}
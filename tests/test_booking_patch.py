@@ -0,0 +1,50 @@
+#tests/test_booking_patch.py
+import allure
+import pytest
+
+from src.api.encoding import encode_booking, encode_patch
+from src.api.models import Booking, BookingPatch
+
+BOOKING = Booking.model_validate({
+    "firstname": "Patch",
+    "lastname": "Diff",
+    "totalprice": 150,
+    "depositpaid": True,
+    "bookingdates": {"checkin": "2025-06-01", "checkout": "2025-06-10"},
+    "additionalneeds": "Breakfast",
+})
+
+
+@allure.feature("Booking patch")
+class TestBookingPatch:
+    @allure.title("Минимальное изменение содержит только отличающиеся поля")
+    def test_diff_is_minimal(self):
+        """
+        Проверяет, что diff включает только изменённые поля (в том числе отдельную дату
+        и additionalneeds=null), тело PATCH меньше тела PUT, а apply восстанавливает updated.
+        """
+        updated = Booking.model_validate({
+            **BOOKING.model_dump(by_alias=True),
+            "totalprice": 200,
+            "additionalneeds": None,
+            "bookingdates": {"checkin": "2025-06-01", "checkout": "2025-06-12"},
+        })
+        patch = BookingPatch.diff(BOOKING, updated)
+        assert encode_patch(patch) == (b'{"totalprice":200.0,"bookingdates":{"checkout":"2025-06-12"},'
+                                       b'"additionalneeds":null}')
+        assert len(encode_patch(patch)) < len(encode_booking(updated))
+        assert patch.apply(BOOKING) == updated
+        assert not BookingPatch.diff(BOOKING, BOOKING)
+
+    @allure.title("Изменение проверяется по правилам Booking")
+    @pytest.mark.parametrize("changes", [
+        {"firstname": None},
+        {"totalprice": -1},
+        {"bookingdates": {"checkin": "2025-06-10", "checkout": "2025-06-01"}},
+    ])
+    def test_invalid_patch(self, changes):
+        """
+        Проверяет, что обязательные поля нельзя обнулить, а ограничения и порядок дат сохраняются.
+        """
+        with pytest.raises(ValueError):
+            BookingPatch.model_validate(changes)
@@ -0,0 +1,101 @@
+#tests/test_booking_search.py
+from datetime import date
+
+import allure
+
+from src.api.booking_index import BookingIndex
+from src.api.client import BookerClient
+from src.api.models import Booking, BookingSearch
+from src.api.routes import Routes
+from src.fake.restful_booker import OFFLINE_BASE_URL, FakeRestfulBooker
+
+
+def _booking(first_name: str, last_name: str, check_in: str, check_out: str) -> Booking:
+    return Booking.model_validate({
+        "firstname": first_name,
+        "lastname": last_name,
+        "totalprice": 100,
+        "depositpaid": True,
+        "bookingdates": {"checkin": check_in, "checkout": check_out},
+    })
+
+
+@allure.feature("Booking search")
+class TestBookingSearch:
+    @allure.title("Фильтры поиска передаются API, локальный индекс даёт тот же результат")
+    def test_search_matches_index(self):
+        """
+        Проверяет, что search_booking_ids применяет фильтры на стороне сервера и что
+        BookingIndex, построенный по get_many, находит те же ID без запросов к API.
+        """
+        client = BookerClient(OFFLINE_BASE_URL, transport=FakeRestfulBooker(dataset_size=50, seed=7))
+        ids = client.get_booking_ids_compact(Routes.BOOKING)
+        index = BookingIndex.from_bulk(client.get_many(ids))
+        assert len(index) == len(ids)
+
+        sample = index.get(ids[0])
+        searches = (
+            BookingSearch(),
+            BookingSearch(firstname=sample.first_name),
+            BookingSearch(firstname=sample.first_name, lastname=sample.last_name),
+            BookingSearch(checkin=sample.booking_dates.check_in),
+            BookingSearch(lastname=sample.last_name, checkout=sample.booking_dates.check_out),
+        )
+        for search in searches:
+            found = client.search_booking_ids(search)
+            assert ids[0] in found
+            assert list(found) == list(index.search(search))
+        client.close()
+
+    @allure.title("Индекс отвечает на запросы по диапазонам дат и пересечению периодов")
+    def test_index_date_ranges(self):
+        """
+        Проверяет полуинтервалы дат заезда и выезда, поиск пересекающихся проживаний
+        и обновление индекса при замене и удалении бронирований.
+        """
+        index = BookingIndex([
+            (1, _booking("Ann", "Lee", "2025-06-01", "2025-06-05")),
+            (2, _booking("Bob", "Lee", "2025-06-03", "2025-06-20")),
+            (3, _booking("Ann", "Ray", "2025-06-10", "2025-06-12")),
+        ])
+        assert list(index.by_name("Ann")) == [1, 3]
+        assert list(index.by_name(last_name="Lee")) == [1, 2]
+        assert list(index.by_name("Ann", "Lee")) == [1]
+        assert list(index.check_in_between(date(2025, 6, 1), date(2025, 6, 10))) == [1, 2]
+        assert list(index.check_out_between(start=date(2025, 6, 12))) == [2, 3]
+        assert list(index.overlapping(date(2025, 6, 5), date(2025, 6, 11))) == [2, 3]
+
+        index.add(1, _booking("Ann", "Lee", "2025-07-01", "2025-07-02"))
+        index.remove(3)
+        assert list(index.overlapping(date(2025, 6, 5), date(2025, 6, 11))) == [2]
+        assert list(index.by_name("Ann")) == [1]
+        assert 3 not in index
+
+    @allure.title("Пакетная загрузка индекса совпадает с поштучным добавлением")
+    def test_index_bulk_load(self):
+        """
+        Проверяет, что индекс, построенный одной сортировкой, отвечает на запросы так же,
+        как индекс, заполненный вызовами add, включая повторяющиеся и заменяемые ID.
+        """
+        bookings = [
+            (5, _booking("Ann", "Lee", "2025-06-03", "2025-06-04")),
+            (2, _booking("Bob", "Lee", "2025-06-01", "2025-06-09")),
+            (7, _booking("Ann", "Ray", "2025-06-03", "2025-06-05")),
+            (2, _booking("Bob", "Ray", "2025-06-03", "2025-06-06")),
+            (1, _booking("Cid", "Lee", "2025-05-30", "2025-06-02")),
+        ]
+        incremental = BookingIndex()
+        for booking_id, booking in bookings:
+            incremental.add(booking_id, booking)
+        bulk = BookingIndex(bookings)
+        bulk.update([(7, _booking("Ann", "Ray", "2025-06-02", "2025-06-03"))])
+        incremental.add(7, _booking("Ann", "Ray", "2025-06-02", "2025-06-03"))
+
+        assert list(bulk) == list(incremental)
+        for index in (bulk, incremental):
+            assert list(index.check_in_between(date(2025, 6, 3), date(2025, 6, 4))) == [2, 5]
+            assert list(index.check_in_between(end=date(2025, 6, 3))) == [1, 7]
+        assert list(bulk.check_out_between()) == list(incremental.check_out_between())
+        assert list(bulk.by_name(last_name="Ray")) == list(incremental.by_name(last_name="Ray"))
+        assert list(bulk.overlapping(date(2025, 6, 1), date(2025, 6, 4))) == \
+            list(incremental.overlapping(date(2025, 6, 1), date(2025, 6, 4)))
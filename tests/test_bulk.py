@@ -0,0 +1,103 @@
+#tests/test_bulk.py
+import asyncio
+import time
+
+import allure
+import pytest
+
+from src.api.auth import TokenProvider
+from src.api.bulk import run_bulk, run_bulk_async
+from src.api.client import AsyncBookerClient
+from src.api.models import Booking
+from src.fake.restful_booker import OFFLINE_BASE_URL, FakeRestfulBooker
+
+BOOKING = {
+    "firstname": "Bulk",
+    "lastname": "Booking",
+    "totalprice": 80,
+    "depositpaid": True,
+    "bookingdates": {"checkin": "2025-08-01", "checkout": "2025-08-03"},
+    "additionalneeds": None,
+}
+
+
+def _square(value: int) -> int:
+    # Чем меньше значение, тем дольше операция: порядок завершения обратен порядку входа.
+    time.sleep((5 - value) * 0.005)
+    if value == 3:
+        raise ValueError("нечётная тройка")
+    return value * value
+
+
+@allure.feature("Bulk operations")
+class TestBulk:
+    @allure.title("run_bulk сохраняет порядок входа и собирает ошибки по элементам")
+    def test_run_bulk(self):
+        """
+        Проверяет, что результаты идут в порядке входных данных, ошибка одного элемента
+        попадает в failed и не прерывает пакет, а ops_per_second считается по elapsed.
+        """
+        result = run_bulk(_square, [1, 2, 3, 4], max_workers=4)
+        assert [item.index for item in result.items] == [0, 1, 2, 3]
+        assert result.values == [1, 4, None, 16]
+        assert [item.item for item in result.failed] == [3]
+        assert isinstance(result.failed[0].error, ValueError)
+        assert [item.value for item in result.succeeded] == [1, 4, 16]
+        assert result.elapsed > 0
+        assert result.ops_per_second == pytest.approx(4 / result.elapsed)
+        empty = run_bulk(_square, [], max_workers=4)
+        assert len(empty) == 0 and empty.ops_per_second == 0.0
+
+    @allure.title("run_bulk_async сохраняет порядок и учитывает отменённые элементы как ошибки")
+    def test_run_bulk_async(self):
+        """
+        Проверяет порядок результатов, ошибки по элементам и то, что отменённая операция
+        попадает в failed с CancelledError, а не в значения.
+        """
+        async def _operation(value: int) -> int:
+            await asyncio.sleep((5 - value) * 0.005)
+            if value == 3:
+                raise ValueError("нечётная тройка")
+            if value == 4:
+                raise asyncio.CancelledError()
+            return value * value
+
+        result = asyncio.run(run_bulk_async(_operation, [1, 2, 3, 4, 5]))
+        assert result.values == [1, 4, None, None, 25]
+        assert [item.item for item in result.failed] == [3, 4]
+        assert isinstance(result.items[2].error, ValueError)
+        assert isinstance(result.items[3].error, asyncio.CancelledError)
+        assert result.ops_per_second == pytest.approx(5 / result.elapsed)
+
+    @allure.title("Пакетные методы клиентов создают, получают и удаляют бронирования")
+    def test_client_bulk_methods(self, offline_client):
+        """
+        Проверяет create_many, get_many и delete_many синхронного и асинхронного клиентов:
+        порядок результатов, ошибку для несуществующего ID и удаление созданных бронирований.
+        """
+        fake = FakeRestfulBooker(dataset_size=0)
+        client = offline_client(fake)
+        bookings = [Booking.model_validate({**BOOKING, "totalprice": price}) for price in range(5)]
+        created = client.create_many(bookings, max_workers=3)
+        assert not created.failed
+        assert [response.booking.total_price for response in created.values] == [0, 1, 2, 3, 4]
+        ids = [response.booking_id for response in created.values]
+
+        fetched = client.get_many([*ids[:2], 999, *ids[2:]], max_workers=3)
+        assert [item.item for item in fetched.failed] == [999]
+        assert [booking.total_price for booking in fetched.values if booking is not None] == [0, 1, 2, 3, 4]
+
+        async def _async_round_trip() -> tuple:
+            provider = TokenProvider(fake.user_name, fake.password)
+            async with AsyncBookerClient(OFFLINE_BASE_URL, transport=fake, token_provider=provider) as async_client:
+                fetched_async = await async_client.get_many([999, *ids])
+                deleted_async = await async_client.delete_many(ids[:2])
+                return fetched_async, deleted_async
+
+        fetched_async, deleted_async = asyncio.run(_async_round_trip())
+        assert [item.index for item in fetched_async.failed] == [0]
+        assert fetched_async.values[1:] == fetched.values[:2] + fetched.values[3:]
+        assert not deleted_async.failed
+        deleted = client.delete_many(ids, max_workers=3)
+        assert [item.item for item in deleted.failed] == ids[:2]
+        assert not fake.bookings
@@ -0,0 +1,79 @@
+#tests/test_cassette.py
+import allure
+import pytest
+
+from src.api.auth import TokenProvider
+from src.api.client import BookerClient
+from src.api.models import Booking
+from src.api.routes import Routes
+from src.fake.restful_booker import OFFLINE_BASE_URL, FakeRestfulBooker
+from src.testing.cassette import CassetteMode, CassetteTransport
+
+BOOKING = Booking.model_validate({
+    "firstname": "Cassette",
+    "lastname": "Replay",
+    "totalprice": 120,
+    "depositpaid": True,
+    "bookingdates": {"checkin": "2025-06-01", "checkout": "2025-06-05"},
+})
+
+
+def _crud(transport) -> list:
+    client = BookerClient(OFFLINE_BASE_URL, transport=transport, token_provider=TokenProvider("admin", "password123"))
+    booking_id = client.create_booking(BOOKING, Routes.BOOKING).booking_id
+    before = client.get_booking(Routes.booking_by_id(booking_id))
+    client.update_booking(BOOKING.model_copy(update={"total_price": 300}), Routes.booking_by_id(booking_id))
+    after = client.get_booking(Routes.booking_by_id(booking_id))
+    status = client.delete_booking(Routes.booking_by_id(booking_id))
+    client.close()
+    return [booking_id, before, after, status]
+
+
+@allure.feature("Cassette transport")
+class TestCassetteTransport:
+    @allure.title("Записанный CRUD сценарий воспроизводится без исходного транспорта")
+    def test_record_and_replay(self, tmp_path):
+        """
+        Проверяет, что сценарий с изменением состояния воспроизводится с теми же ответами
+        в порядке записи, а запрос с другим ID бронирования находится по нормализованному ключу.
+        """
+        path = tmp_path / "crud.cassette"
+        recorded = _crud(CassetteTransport(path, CassetteMode.RECORD, inner=FakeRestfulBooker(dataset_size=3)))
+        assert recorded[1].total_price == 120 and recorded[2].total_price == 300
+
+        replay = CassetteTransport(path)
+        assert _crud(replay) == recorded
+        assert replay.recorded == 0
+
+        replay = CassetteTransport(path)
+        client = BookerClient(OFFLINE_BASE_URL, transport=replay)
+        assert client.get_booking(Routes.booking_by_id(999)) == recorded[1]
+        with pytest.raises(RuntimeError, match="отсутствует в кассете"):
+            client.get_booking_ids(Routes.BOOKING)
+        client.close()
+
+    @allure.title("Режим auto дозаписывает новые запросы и отбрасывает оборванную запись")
+    def test_auto_appends(self, tmp_path):
+        """
+        Проверяет, что режим auto отвечает из кассеты, дозаписывает отсутствующие запросы
+        и восстанавливается после незавершённой записи в конце файла.
+        """
+        path = tmp_path / "auto.cassette"
+        fake = FakeRestfulBooker(dataset_size=3)
+        client = BookerClient(OFFLINE_BASE_URL, transport=CassetteTransport(path, CassetteMode.AUTO, inner=fake))
+        first = client.get_booking_ids(Routes.BOOKING)
+        client.close()
+        with open(path, "ab") as file:
+            file.write(b"\x00" * 20)
+
+        transport = CassetteTransport(path, CassetteMode.AUTO, inner=fake)
+        client = BookerClient(OFFLINE_BASE_URL, transport=transport)
+        assert client.get_booking_ids(Routes.BOOKING) == first
+        booking = client.get_booking(Routes.booking_by_id(1))
+        assert (transport.replayed, transport.recorded) == (1, 1)
+        client.close()
+
+        client = BookerClient(OFFLINE_BASE_URL, transport=CassetteTransport(path))
+        assert client.get_booking(Routes.booking_by_id(1)) == booking
+        assert fake.request_count == 2
+        client.close()
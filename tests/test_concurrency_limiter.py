@@ -0,0 +1,84 @@
+#tests/test_concurrency_limiter.py
+import asyncio
+import time
+
+import allure
+import httpx
+import pytest
+
+from src.api.client import AsyncBookerClient
+from src.api.resilience import AdaptiveConcurrencyLimiter
+from src.api.routes import Routes
+from src.fake.restful_booker import OFFLINE_BASE_URL, FakeRestfulBooker
+
+
+class _PeakTransport(httpx.AsyncBaseTransport):
+    def __init__(self, fake: FakeRestfulBooker):
+        self.fake = fake
+        self.in_flight = 0
+        self.peak = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            return await self.fake.handle_async_request(request)
+        finally:
+            self.in_flight -= 1
+
+
+@allure.feature("Adaptive concurrency")
+class TestAdaptiveConcurrency:
+    @allure.title("Аддитивный рост и мультипликативное снижение лимита")
+    def test_aimd_decisions(self):
+        """
+        Проверяет, что быстрые ответы увеличивают лимит, медленный ответ и 503 снижают его
+        в backoff_ratio раз, а ответы, начатые до снижения, повторно лимит не снижают.
+        """
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=8, backoff_ratio=0.5, latency_target=0.1)
+        for _ in range(5):
+            slots = limiter.limit
+            for _ in range(slots):
+                limiter.acquire()
+            for _ in range(slots):
+                limiter.release(0.01, 200)
+        grown = limiter.limit
+        assert 4 < grown <= 8
+        limiter.acquire()
+        limiter.release(0.01, 503)
+        assert limiter.limit == grown // 2
+        limiter.acquire()
+        limiter.release(10.0, 200)
+        assert limiter.limit == grown // 2
+        time.sleep(0.3)
+        limiter.acquire()
+        limiter.release(0.2, 200)
+        assert limiter.limit == max(1, grown // 4)
+        snapshot = limiter.snapshot()
+        assert snapshot["decisions"]["decrease"] == 2 and snapshot["overloads"] == 3
+        assert 'booker_concurrency_decisions_total{decision="decrease"} 2' in limiter.to_prometheus()
+        assert "booker_concurrency_limit 1" in limiter.to_prometheus()
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(initial_limit=0)
+
+    @allure.title("Ограничитель держит параллельность асинхронного клиента в пределах лимита")
+    def test_async_client_respects_limit(self):
+        """
+        Проверяет, что при 200 одновременных GET запросах число выполняющихся запросов
+        не превышает лимита, лимит растёт при быстрых ответах и падает до минимума при ошибках 503.
+        """
+        async def _run(fake, limiter):
+            transport = _PeakTransport(fake)
+            async with AsyncBookerClient(OFFLINE_BASE_URL, max_concurrency=64, transport=transport,
+                                         concurrency_limiter=limiter) as client:
+                await asyncio.gather(*(client.get_booking(Routes.booking_by_id(index % 10 + 1))
+                                       for index in range(200)), return_exceptions=True)
+            return transport.peak
+
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=32, latency_target=1.0)
+        peak = asyncio.run(_run(FakeRestfulBooker(latency=0.001), limiter))
+        assert limiter.limit > 2 and peak <= limiter.limit and limiter.in_flight == 0
+
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16, latency_target=1.0)
+        asyncio.run(_run(FakeRestfulBooker(latency=0.001, error_rate=1.0), limiter))
+        assert limiter.limit == 1 and limiter.snapshot()["decisions"]["decrease"] >= 4
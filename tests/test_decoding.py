@@ -0,0 +1,52 @@
+#tests/test_decoding.py
+import allure
+import httpx
+import pytest
+
+from src.api.decoding import BookingItemList, ValidationLevel, decode_json, probe_error_reason
+from src.api.models import AuthResponse, Booking
+from src.api.routes import Routes
+
+
+@allure.feature("Response decoding")
+class TestDecoding:
+    @allure.title("probe_error_reason распознаёт только объект с полем reason")
+    def test_probe_error_reason(self):
+        """
+        Проверяет, что причина извлекается из {"reason": ...}, а тела без маркера, с маркером
+        внутри строки или массива и некорректный JSON не считаются ошибкой.
+        """
+        assert probe_error_reason(b'{"reason": "Bad credentials"}') == "Bad credentials"
+        assert probe_error_reason(b'{"token": "abc"}') is None
+        assert probe_error_reason(b'{"firstname": "\\"reason\\""}') is None
+        assert probe_error_reason(b'[{"reason": "x"}]') is None
+        assert probe_error_reason(b'{"reason": ') is None
+
+    @allure.title("Ответ 200 с reason выбрасывает RuntimeError с причиной")
+    @pytest.mark.parametrize("level", list(ValidationLevel))
+    def test_reason_body_raises(self, level, offline_client):
+        """
+        Проверяет, что {"reason": "Bad credentials"} со статусом 200 не валидируется как модель,
+        а выбрасывает RuntimeError с текстом причины, в том числе из authenticate.
+        """
+        body = b'{"reason": "Bad credentials"}'
+        with pytest.raises(RuntimeError, match="Bad credentials"):
+            decode_json(body, AuthResponse, level)
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+        with pytest.raises(RuntimeError, match="Bad credentials"):
+            offline_client(transport=transport).authenticate("admin", "wrong", Routes.AUTH)
+
+    @allure.title("Не-JSON тело с кодом 200 выбрасывает RuntimeError")
+    @pytest.mark.parametrize("level", list(ValidationLevel))
+    @pytest.mark.parametrize("body", [b"<html>Service Unavailable</html>", b'{"firstname": "Cut', b""])
+    def test_invalid_json_raises_runtime_error(self, level, body, offline_client):
+        """
+        Проверяет, что битое тело ответа превращается в RuntimeError с текстом ответа,
+        а не в ValidationError pydantic или JSONDecodeError, на каждом уровне валидации.
+        """
+        for target in (Booking, BookingItemList):
+            with pytest.raises(RuntimeError, match="Ошибка парсинга JSON"):
+                decode_json(body, target, level)
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+        with pytest.raises(RuntimeError, match="Ошибка парсинга JSON"):
+            offline_client(transport=transport, validation=level).get_booking(Routes.booking_by_id(1))
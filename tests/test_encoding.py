@@ -0,0 +1,47 @@
+#tests/test_encoding.py
+import json
+
+import allure
+
+from src.api.encoding import encode_booking, encode_patch
+from src.api.models import Booking, BookingPatch
+from src.api.routes import Routes
+from src.fake.restful_booker import FakeRestfulBooker
+
+BOOKING = {
+    "firstname": "Encoded",
+    "lastname": "Payload",
+    "totalprice": 120,
+    "depositpaid": False,
+    "bookingdates": {"checkin": "2025-06-01", "checkout": "2025-06-10"},
+    "additionalneeds": None,
+}
+
+
+@allure.feature("Payload encoding")
+class TestPayloadEncoding:
+    @allure.title("Заранее сериализованное тело передаётся без повторного кодирования")
+    def test_pre_encoded_body(self):
+        """
+        Проверяет, что готовые байты передаются как есть, совпадают по содержимому с телом
+        из модели, а частичное изменение сериализует только заданные поля.
+        """
+        booking = Booking.model_validate(BOOKING)
+        body = encode_booking(booking)
+        assert encode_booking(body) is body
+        assert json.loads(body) == BOOKING
+        assert json.loads(encode_patch(BookingPatch(firstname="Patched"))) == {"firstname": "Patched"}
+
+    @allure.title("Бронирование создаётся и обновляется из готового тела")
+    def test_create_and_update_from_bytes(self, offline_client):
+        """
+        Проверяет, что create_booking и update_booking принимают тело, сериализованное один раз,
+        и API получает те же данные, что и при передаче модели.
+        """
+        body = encode_booking(Booking.model_validate(BOOKING))
+        client = offline_client(FakeRestfulBooker(dataset_size=0))
+        created = client.create_booking(body, Routes.BOOKING)
+        assert created.booking == Booking.model_validate(BOOKING)
+        updated = client.update_booking(encode_booking(created.booking.model_copy(update={"first_name": "Bytes"})),
+                                        Routes.booking_by_id(created.booking_id))
+        assert updated.first_name == "Bytes"
@@ -0,0 +1,50 @@
+#tests/test_fake_server.py
+import asyncio
+import time
+
+import allure
+import pytest
+
+from src.api.client import AsyncBookerClient, BookerClient
+from src.api.routes import Routes
+from src.fake.restful_booker import OFFLINE_BASE_URL, FakeRestfulBooker
+
+
+@allure.feature("Fake Restful-Booker")
+class TestFakeRestfulBooker:
+    @allure.title("Размер набора данных и детерминированность по seed")
+    def test_dataset_is_reproducible(self):
+        """
+        Проверяет, что предзаполненный набор данных имеет заданный размер и одинаков при одном seed.
+        """
+        first = FakeRestfulBooker(dataset_size=25, seed=7)
+        second = FakeRestfulBooker(dataset_size=25, seed=7)
+        client = BookerClient(OFFLINE_BASE_URL, transport=first)
+        assert len(client.get_booking_ids(Routes.BOOKING)) == 25
+        assert first.bookings == second.bookings
+
+    @allure.title("Внедрение ошибок")
+    def test_error_injection(self):
+        """
+        Проверяет, что при error_rate=1 каждый запрос завершается ошибкой error_status.
+        """
+        client = BookerClient(OFFLINE_BASE_URL, transport=FakeRestfulBooker(error_rate=1.0, error_status=503))
+        with pytest.raises(RuntimeError) as exc_info:
+            client.get_booking(Routes.booking_by_id(1))
+        assert "503" in str(exc_info.value)
+
+    @allure.title("Внедрённая задержка перекрывается в асинхронном клиенте")
+    def test_async_latency_overlaps(self):
+        """
+        Проверяет, что 20 запросов с задержкой 50 мс в AsyncBookerClient выполняются параллельно.
+        """
+        fake = FakeRestfulBooker(dataset_size=20, latency=0.05)
+
+        async def fetch_all():
+            async with AsyncBookerClient(OFFLINE_BASE_URL, transport=fake) as client:
+                return await client.get_many(range(1, 21))
+
+        started = time.perf_counter()
+        result = asyncio.run(fetch_all())
+        assert not result.failed
+        assert time.perf_counter() - started < 0.5
@@ -0,0 +1,46 @@
+#tests/test_generator.py
+from itertools import islice
+
+import allure
+import pytest
+
+from src.api.client import BookerClient
+from src.api.models import Booking
+from src.api.routes import Routes
+from src.fake.restful_booker import OFFLINE_BASE_URL, FakeRestfulBooker
+
+pytest.importorskip("numpy")
+
+from src.load.generator import BookingFactory  # noqa: E402
+
+
+@allure.feature("Synthetic bookings")
+class TestBookingFactory:
+    @allure.title("Сгенерированные тела валидны и воспроизводимы по seed")
+    def test_batch_is_valid_and_reproducible(self):
+        """
+        Проверяет, что каждое тело проходит валидацию Booking (в том числе даты с проживанием
+        в один день), пакеты при одном seed совпадают, а при разных — различаются.
+        """
+        factory = BookingFactory(seed=11, max_stay=1, max_price=0)
+        batch = factory.batch(2_000)
+        bookings = [Booking.model_validate_json(body) for body in batch]
+        assert all(booking.total_price == 0 for booking in bookings)
+        assert all((booking.booking_dates.check_out - booking.booking_dates.check_in).days == 1
+                   for booking in bookings)
+        assert BookingFactory(seed=5).batch(100) == BookingFactory(seed=5).batch(100)
+        assert BookingFactory(seed=5).batch(100) != BookingFactory(seed=6).batch(100)
+        assert len(set(BookingFactory(seed=5).batch(10_000))) > 9_900
+
+    @allure.title("Поток тел для нагрузочного драйвера")
+    def test_stream_feeds_load_driver(self):
+        """
+        Проверяет, что stream выдаёт тела пакетами без ограничения длины и что их
+        можно отправить через create_booking без построения модели.
+        """
+        stream = BookingFactory(seed=1).stream(batch_size=7)
+        bodies = list(islice(stream, 20))
+        client = BookerClient(OFFLINE_BASE_URL, transport=FakeRestfulBooker(dataset_size=0))
+        created = [client.create_booking(body, Routes.BOOKING) for body in bodies]
+        assert [response.booking for response in created] == [Booking.model_validate_json(body) for body in bodies]
+        client.close()
@@ -0,0 +1,91 @@
+#tests/test_http_settings.py
+import asyncio
+
+import allure
+import httpx
+import pytest
+
+from src.api.client import AsyncBookerClient, BookerClient
+from src.config import get_settings
+from src.fake.restful_booker import OFFLINE_BASE_URL, FakeRestfulBooker
+
+HTTP_ENV = {
+    "MAX_CONNECTIONS": "7",
+    "MAX_KEEPALIVE_CONNECTIONS": "3",
+    "KEEPALIVE_EXPIRY": "2.5",
+    "CONNECT_TIMEOUT": "1.5",
+    "READ_TIMEOUT": "2.0",
+    "WRITE_TIMEOUT": "3.0",
+    "POOL_TIMEOUT": "4.0",
+    "WARMUP_CONNECTIONS": "2",
+}
+
+
+@pytest.fixture
+def http_settings(monkeypatch):
+    for name, value in HTTP_ENV.items():
+        monkeypatch.setenv(name, value)
+    get_settings.cache_clear()
+    yield get_settings()
+    get_settings.cache_clear()
+
+
+def _pool(client: httpx.Client):
+    return client._transport._pool
+
+
+@allure.feature("HTTP settings")
+class TestHttpSettings:
+    @allure.title("Настройки пула и таймаутов передаются в httpx клиенты")
+    def test_pool_and_timeouts(self, http_settings):
+        """
+        Проверяет, что таймауты и лимиты пула из переменных окружения попадают в httpx.Client,
+        а пул AsyncBookerClient рассчитан на max_concurrency и одно соединение для потока ID.
+        """
+        client = BookerClient(OFFLINE_BASE_URL, warmup_connections=0)
+        assert client.client.timeout == httpx.Timeout(connect=1.5, read=2.0, write=3.0, pool=4.0)
+        pool = _pool(client.client)
+        assert (pool._max_connections, pool._max_keepalive_connections, pool._keepalive_expiry) == (7, 3, 2.5)
+        assert pool._http2 is False
+        client.close()
+
+        async def _async_pool():
+            async with AsyncBookerClient(OFFLINE_BASE_URL, max_concurrency=4) as async_client:
+                return _pool(async_client.client)._max_connections, async_client.client.timeout.read
+
+        assert asyncio.run(_async_pool()) == (5, 2.0)
+
+    @allure.title("HTTP/2 включается настройкой HTTP2")
+    def test_http2(self, http_settings, monkeypatch):
+        """
+        Проверяет, что HTTP2=true включает HTTP/2 в пуле соединений (нужен пакет h2).
+        """
+        pytest.importorskip("h2")
+        monkeypatch.setenv("HTTP2", "true")
+        get_settings.cache_clear()
+        client = BookerClient(OFFLINE_BASE_URL, warmup_connections=0)
+        assert _pool(client.client)._http2 is True
+        client.close()
+
+    @allure.title("Прогрев открывает соединения запросами GET /ping")
+    def test_warm_up(self, http_settings):
+        """
+        Проверяет, что клиент при создании выполняет WARMUP_CONNECTIONS запросов GET /ping,
+        явный warmup_connections переопределяет настройку, а ошибки прогрева не прерывают работу.
+        """
+        paths = []
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            paths.append((request.method, request.url.path))
+            return FakeRestfulBooker(dataset_size=0).handle_request(request)
+
+        transport = httpx.MockTransport(_handler)
+        client = BookerClient(OFFLINE_BASE_URL, transport=transport)
+        assert paths == [("GET", "/ping")] * 2
+        assert client.warm_up(3) == 3 and len(paths) == 5
+
+        def _refused(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("соединение отклонено", request=request)
+
+        client = BookerClient(OFFLINE_BASE_URL, transport=httpx.MockTransport(_refused), warmup_connections=0)
+        assert client.warm_up(2) == 0
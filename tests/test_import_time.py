@@ -0,0 +1,27 @@
+#tests/test_import_time.py
+import allure
+
+from benchmarks.bench_import import BASELINE_MODULES, IMPORT_BUDGET, import_ratio, loaded_modules
+
+
+@allure.feature("Import time")
+class TestImportTime:
+    @allure.title("Импорт клиента укладывается в бюджет относительно httpx и pydantic")
+    def test_import_budget(self):
+        """
+        Проверяет, что время, которое импорт src.api.client без переменных окружения добавляет
+        к уже импортированным httpx и pydantic, не превышает доли IMPORT_BUDGET от их времени.
+        Сравнение в одном процессе не зависит от скорости машины.
+        """
+        for module, budget in IMPORT_BUDGET.items():
+            own, baseline, ratio = import_ratio(module)
+            assert ratio <= budget, (f"Импорт {module} занял {own:.1f} мс после {', '.join(BASELINE_MODULES)} "
+                                     f"({baseline:.1f} мс): отношение {ratio:.2f} при бюджете {budget:.2f}")
+
+    @allure.title("Настройки, allure и asyncio не загружаются при импорте клиента")
+    def test_lazy_modules(self):
+        """
+        Проверяет, что тяжёлые модули загружаются только при первом использовании.
+        """
+        for module in IMPORT_BUDGET:
+            assert loaded_modules(module) == []
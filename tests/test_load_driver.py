@@ -0,0 +1,84 @@
+#tests/test_load_driver.py
+import json
+
+import allure
+import pytest
+
+from src.fake.restful_booker import FakeRestfulBooker
+from src.load.driver import LoadConfig, LoadDriver, parse_mix
+from src.load.histogram import LatencyHistogram
+
+
+@allure.feature("Load driver")
+class TestLoadDriver:
+    @allure.title("Перцентили гистограммы с погрешностью не более 1/64")
+    def test_histogram_percentiles(self):
+        """
+        Проверяет count, min, max, среднее и перцентили равномерного ряда 1..10000 мкс.
+        """
+        histogram = LatencyHistogram()
+        for value in range(1, 10_001):
+            histogram.record(value / 1_000_000)
+        assert (histogram.count, histogram.min_us, histogram.max_us) == (10_000, 1, 10_000)
+        assert histogram.mean == pytest.approx(0.0050005)
+        for percent in (50, 90, 99, 100):
+            expected = percent * 100 / 1_000_000
+            assert expected <= histogram.percentile(percent) <= expected * (1 + 1 / 64)
+        assert LatencyHistogram().percentile(99) == 0.0 and LatencyHistogram().summary()["count"] == 0
+
+    @allure.title("Объединение и сериализация гистограмм")
+    def test_histogram_merge_and_roundtrip(self):
+        """
+        Проверяет, что объединение двух гистограмм равно гистограмме всех измерений,
+        а to_dict/from_dict через JSON восстанавливает её без потерь.
+        """
+        left, right, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for index, seconds in enumerate([0.001, 0.25, 0.0005, 3.0, 0.04, 0.04]):
+            (left if index % 2 else right).record(seconds)
+            combined.record(seconds)
+        merged = LatencyHistogram().merge(left).merge(right)
+        assert merged.summary() == combined.summary() and merged.counts == combined.counts
+        restored = LatencyHistogram.from_dict(json.loads(json.dumps(merged.to_dict())))
+        assert restored.to_dict() == merged.to_dict() and restored.min_us == 500
+
+    @allure.title("Разбор распределения операций")
+    def test_parse_mix(self):
+        """
+        Проверяет нормировку весов и отклонение неизвестной операции и некорректных весов.
+        """
+        assert parse_mix("get=70, create=20,update=5,delete=5") == {
+            "get": 0.7, "create": 0.2, "update": 0.05, "delete": 0.05,
+        }
+        assert parse_mix("get=1") == {"get": 1.0}
+        with pytest.raises(ValueError, match="Неизвестная операция"):
+            parse_mix("get=1,list=1")
+        with pytest.raises(ValueError, match="неотрицательными"):
+            parse_mix("get=0,create=0")
+        with pytest.raises(ValueError, match="неотрицательными"):
+            parse_mix("get=2,create=-1")
+
+    @allure.title("С заданной частотой задержка включает ожидание слота")
+    def test_rate_latency_includes_queueing(self, offline_client):
+        """
+        Проверяет отсутствие coordinated omission: при частоте 100 rps и ответе за 50 мс один
+        поток отстаёт от расписания, и задержка последних запросов включает это отставание.
+        """
+        fake = FakeRestfulBooker(dataset_size=5, latency=0.05)
+        config = LoadConfig(mix={"get": 1.0}, concurrency=1, rate=100.0, requests=10)
+        report = LoadDriver(offline_client(fake), config).run()
+        histogram = report.operations["get"].histogram
+        assert histogram.count == 10
+        assert histogram.percentile(50) >= 0.2 and histogram.max >= 0.4
+
+    @allure.title("Создание и удаление собственных бронирований без ошибок")
+    def test_create_delete_mix(self, offline_client):
+        """
+        Проверяет, что удаление выбирает только существующие созданные прогоном бронирования,
+        а очистка удаляет оставшиеся. Чтение может попасть на ID, удаляемый соседним потоком,
+        поэтому ошибки проверяются только у удаления.
+        """
+        fake = FakeRestfulBooker(dataset_size=3)
+        config = LoadConfig(mix={"get": 0.2, "create": 0.4, "delete": 0.4}, concurrency=4, requests=300, seed=5)
+        report = LoadDriver(offline_client(fake), config).run()
+        assert report.operations["delete"].errors == 0 and report.operations["delete"].histogram.count > 0
+        assert sorted(fake.bookings) == [1, 2, 3]
@@ -0,0 +1,49 @@
+#tests/test_mirror.py
+import allure
+
+from src.api.auth import TokenProvider
+from src.api.client import BookerClient
+from src.api.models import Booking
+from src.api.routes import Routes
+from src.fake.restful_booker import OFFLINE_BASE_URL, FakeRestfulBooker
+from src.sync.mirror import BookingMirror
+
+
+@allure.feature("Booking mirror")
+class TestBookingMirror:
+    @allure.title("Повторная синхронизация загружает только изменения")
+    def test_incremental_sync(self, tmp_path):
+        """
+        Проверяет, что первая синхронизация загружает все бронирования, повторная без изменений
+        не загружает ни одного, а после создания, удаления и обновления на сервере зеркало
+        загружает новое, удаляет исчезнувшее и находит изменённое при перепроверке.
+        """
+        transport = FakeRestfulBooker(dataset_size=20, seed=3)
+        client = BookerClient(OFFLINE_BASE_URL, transport=transport,
+                              token_provider=TokenProvider(transport.user_name, transport.password))
+        mirror = BookingMirror(tmp_path / "mirror.sqlite", client, verify_after=3600.0)
+
+        first = mirror.sync()
+        assert (first.added, first.removed, first.failed, first.total) == (20, 0, 0, 20)
+        second = mirror.sync()
+        assert (second.added, second.removed, second.verified) == (0, 0, 0)
+
+        ids = mirror.ids()
+        updated = mirror.get(ids[1]).model_copy(update={"first_name": "Changed"})
+        client.update_booking(updated, Routes.booking_by_id(ids[1]))
+        client.delete_booking(Routes.booking_by_id(ids[0]))
+        created = client.create_booking(updated, Routes.BOOKING).booking_id
+
+        mirror.verify_after = 0.0
+        third = mirror.sync()
+        assert (third.added, third.removed, third.changed, third.total) == (1, 1, 1, 20)
+        assert third.verified == 19
+        assert mirror.get(ids[1]).first_name == "Changed"
+        assert ids[0] not in mirror.ids() and created in mirror.ids()
+        assert all(isinstance(booking, Booking) for _, booking in mirror.bookings())
+        mirror.close()
+
+        reopened = BookingMirror(tmp_path / "mirror.sqlite", client)
+        assert reopened.ids() == client.get_booking_ids_compact(Routes.BOOKING)
+        reopened.close()
+        client.close()
@@ -0,0 +1,103 @@
+#tests/test_multiprocess.py
+import os
+import tempfile
+import time
+from dataclasses import dataclass, replace
+
+import allure
+import httpx
+import pytest
+
+from src.api.auth import TokenProvider
+from src.api.client import BookerClient
+from src.fake.restful_booker import OFFLINE_BASE_URL, FakeRestfulBooker
+from src.load.driver import LoadConfig
+from src.load.histogram import LatencyHistogram
+from src.load.multiprocess import ClientFactory, MultiProcessLoadRunner
+
+
+class _DyingTransport(httpx.BaseTransport):
+    """
+    Транспорт, аварийно завершающий первый добравшийся до marker процесс на десятом запросе.
+    """
+
+    def __init__(self, fake: FakeRestfulBooker, marker: str):
+        self.fake = fake
+        self.marker = marker
+        self.requests = 0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self.requests == 10:
+            try:
+                os.close(os.open(self.marker, os.O_CREAT | os.O_EXCL))
+            except FileExistsError:
+                pass
+            else:
+                os._exit(3)
+        return self.fake.handle_request(request)
+
+
+@dataclass
+class _DyingClientFactory(ClientFactory):
+    marker: str = ""
+
+    def __call__(self) -> BookerClient:
+        fake = FakeRestfulBooker(dataset_size=self.dataset_size)
+        return BookerClient(OFFLINE_BASE_URL, token_provider=TokenProvider(fake.user_name, fake.password),
+                            transport=_DyingTransport(fake, self.marker))
+
+
+@allure.feature("Multi-process load runner")
+class TestMultiProcessLoadRunner:
+    @allure.title("Запросы, потоки и частота делятся между процессами")
+    def test_worker_configs(self):
+        """
+        Проверяет, что доли процессов в сумме дают исходные параметры, а seed у процессов разный.
+        """
+        config = LoadConfig(mix={"get": 1.0}, concurrency=5, rate=90.0, requests=10, seed=3)
+        configs = MultiProcessLoadRunner(config, 3, ClientFactory(offline=True)).worker_configs()
+        assert [item.requests for item in configs] == [4, 3, 3]
+        assert [item.concurrency for item in configs] == [2, 2, 1]
+        assert all(item.rate == 30.0 for item in configs)
+        assert len({item.seed for item in configs}) == 3
+        with pytest.raises(ValueError):
+            MultiProcessLoadRunner(config, 6, ClientFactory(offline=True))
+
+        small = replace(config, requests=2)
+        configs = MultiProcessLoadRunner(small, 3, ClientFactory(offline=True)).worker_configs()
+        assert [item.requests for item in configs] == [1, 1]
+        assert sum(item.rate for item in configs) == 90.0
+
+    @allure.title("Гистограммы процессов объединяются без потери измерений")
+    def test_run_merges_histograms(self):
+        """
+        Проверяет, что два процесса выполняют все запросы, а итоговая гистограмма
+        содержит каждое измерение, полученное из процессов порциями.
+        """
+        config = LoadConfig(mix={"get": 0.5, "create": 0.5}, concurrency=2, requests=200)
+        progress = []
+        runner = MultiProcessLoadRunner(config, 2, ClientFactory(offline=True, dataset_size=20),
+                                        stats_interval=0.01, on_progress=lambda stats: progress.append(1))
+        report = runner.run()
+        total = LatencyHistogram()
+        for stats in report.operations.values():
+            total.merge(stats.histogram)
+        errors = sum(stats.errors for stats in report.operations.values())
+        assert total.count + errors == 200
+        assert len(progress) >= 2
+        assert report.to_dict()["total"]["count"] == total.count
+
+    @allure.title("Гибель процесса после старта прерывает прогон, а не подвешивает его")
+    def test_dead_worker_detected(self):
+        """
+        Проверяет, что если процесс убит посреди прогона, родитель не ждёт его сообщений вечно:
+        выбрасывает RuntimeError с номером процесса и кодом выхода и завершает остальные процессы.
+        """
+        config = LoadConfig(mix={"get": 1.0}, concurrency=2, rate=50.0, duration=30.0)
+        marker = os.path.join(tempfile.mkdtemp(prefix="booker-load-"), "died")
+        runner = MultiProcessLoadRunner(config, 2, _DyingClientFactory(dataset_size=20, marker=marker))
+        started = time.monotonic()
+        with pytest.raises(RuntimeError, match=r"Процесс нагрузки \d неожиданно завершился с кодом 3"):
+            runner.run()
+        assert time.monotonic() - started < 20
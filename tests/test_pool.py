@@ -0,0 +1,77 @@
+#tests/test_pool.py
+import tempfile
+
+import allure
+
+from src.api.client import BookerClient
+from src.api.routes import Routes
+from src.fake.restful_booker import OFFLINE_BASE_URL, FakeRestfulBooker
+from src.testing.pool import BookingIdSnapshot, BookingPool
+from src.testing.shared_state import SharedSessionState
+
+BOOKING = {
+    "firstname": "Pool",
+    "lastname": "Booking",
+    "totalprice": 100,
+    "depositpaid": True,
+    "bookingdates": {"checkin": "2025-06-01", "checkout": "2025-06-10"},
+    "additionalneeds": None,
+}
+
+
+@allure.feature("Booking pool")
+class TestBookingPool:
+    @allure.title("Пул выдаёт разные бронирования и не создаёт лишних сверх спроса")
+    def test_acquire_and_top_up(self):
+        """
+        Проверяет, что пул выдаёт уникальные существующие бронирования, регистрирует каждое
+        созданное и после исчерпания объявленного спроса не пополняется впрок.
+        """
+        fake = FakeRestfulBooker(dataset_size=0)
+        client = BookerClient(OFFLINE_BASE_URL, transport=fake)
+        created = []
+        pool = BookingPool(client, target=2, on_create=created.append)
+        pool.prewarm(BOOKING, 3)
+        acquired = [pool.acquire(BOOKING)[0] for _ in range(5)]
+        pool.close()
+        assert len(set(acquired)) == 5
+        assert all(booking_id in fake.bookings for booking_id in acquired)
+        assert sorted(acquired) == sorted(created)
+
+    @allure.title("Процессы делят общий спрос и вместе создают не больше бронирований, чем тестов")
+    def test_shared_demand(self):
+        """
+        Проверяет, что два пула с общей таблицей спроса заранее создают не больше target
+        бронирований каждый, а всего создают ровно столько, сколько бронирований получено.
+        """
+        fake = FakeRestfulBooker(dataset_size=0)
+        client = BookerClient(OFFLINE_BASE_URL, transport=fake)
+        state = SharedSessionState(tempfile.mkdtemp(prefix="booker-state-"))
+        state.memoize("demand", lambda: {BookingPool.key(BOOKING): 6})
+        created = []
+        pools = [BookingPool(client, target=2, on_create=created.append,
+                             claim=lambda key, count: state.claim("demand", key, count)) for _ in range(2)]
+        for pool in pools:
+            pool.prewarm(BOOKING)
+        assert state.read("demand") == {BookingPool.key(BOOKING): 2}
+        acquired = [pools[0].acquire(BOOKING)[0] for _ in range(4)] + [pools[1].acquire(BOOKING)[0] for _ in range(2)]
+        for pool in pools:
+            pool.close()
+        assert len(set(acquired)) == 6
+        assert sorted(acquired) == sorted(created)
+        assert state.read("demand") == {BookingPool.key(BOOKING): 0}
+
+    @allure.title("Снимок ID обновляется только по истечении TTL")
+    def test_id_snapshot_ttl(self):
+        """
+        Проверяет, что повторные обращения к снимку в пределах TTL не запрашивают GET /booking.
+        """
+        fake = FakeRestfulBooker(dataset_size=5)
+        client = BookerClient(OFFLINE_BASE_URL, transport=fake)
+        snapshot = BookingIdSnapshot(lambda: client.get_booking_ids_compact(Routes.BOOKING), ttl=60)
+        for _ in range(10):
+            assert len(snapshot.get()) == 5
+        assert fake.request_count == 1
+        snapshot.invalidate()
+        snapshot.get()
+        assert fake.request_count == 2
@@ -0,0 +1,82 @@
+#tests/test_request_metrics.py
+import asyncio
+
+import allure
+
+from src.api.client import AsyncBookerClient
+from src.api.metrics import RequestMetrics, route_template
+from src.api.routes import Routes
+from src.fake.restful_booker import OFFLINE_BASE_URL, FakeRestfulBooker
+
+
+@allure.feature("Request metrics")
+class TestRequestMetrics:
+    @allure.title("Числовые сегменты пути заменяются шаблоном {id}")
+    def test_route_template(self):
+        """
+        Проверяет группировку путей с ID бронирования в один маршрут.
+        """
+        assert route_template("/booking/123") == "/booking/{id}"
+        assert route_template("/booking/7/extra") == "/booking/{id}/extra"
+        assert route_template("/booking") == "/booking"
+        assert route_template("/booking/abc") == "/booking/abc"
+
+    @allure.title("Снимок метрик по маршрутам, статусам и фазам")
+    def test_snapshot(self, offline_client):
+        """
+        Проверяет, что запросы к разным ID попадают в один маршрут, статусы считаются
+        по кодам, а фаза валидации учитывается только для валидируемых ответов.
+        """
+        metrics, fake = RequestMetrics(), FakeRestfulBooker(dataset_size=3)
+        client = offline_client(fake, metrics=metrics)
+        for booking_id in (1, 2, 3):
+            client.get_booking(Routes.booking_by_id(booking_id))
+        client.delete_booking(Routes.booking_by_id(1))
+        snapshot = metrics.snapshot()
+        get = snapshot["GET /booking/{id}"]
+        assert get["count"] == 3 and get["statuses"] == {"200": 3}
+        assert get["phases"]["total"]["count"] == 3 and get["phases"]["validation"]["count"] == 3
+        assert get["response_bytes"] > 0 and get["request_bytes"] == 0
+        assert snapshot["DELETE /booking/{id}"]["statuses"] == {"201": 1}
+        assert snapshot["POST /auth"]["request_bytes"] > 0
+        metrics.reset()
+        assert metrics.snapshot() == {}
+
+    @allure.title("Экспорт в текстовом формате Prometheus")
+    def test_prometheus(self, offline_client):
+        """
+        Проверяет счётчик запросов с метками метода, маршрута и статуса, перцентили фаз и объём тел.
+        """
+        metrics = RequestMetrics()
+        client = offline_client(FakeRestfulBooker(dataset_size=2), metrics=metrics)
+        client.get_booking(Routes.booking_by_id(1))
+        client.get_booking(Routes.booking_by_id(2))
+        text = metrics.to_prometheus(prefix="test")
+        assert "# TYPE test_requests_total counter" in text
+        assert 'test_requests_total{method="GET",route="/booking/{id}",status="200"} 2' in text
+        assert 'test_request_phase_seconds_count{method="GET",route="/booking/{id}",phase="total"} 2' in text
+        assert 'phase="validation",quantile="0.99"' in text
+        assert 'test_request_bytes_total{method="GET",route="/booking/{id}",direction="received"}' in text
+        assert text.endswith("\n")
+
+    @allure.title("Дочерний сборщик получает наблюдения только внутри capture()")
+    def test_capture(self, offline_client):
+        """
+        Проверяет, что capture() собирает метрики, включая валидацию, только за время контекста,
+        а общий сборщик получает все наблюдения, в том числе от асинхронного клиента.
+        """
+        metrics, fake = RequestMetrics(), FakeRestfulBooker(dataset_size=2)
+        client = offline_client(fake, metrics=metrics)
+        client.get_booking(Routes.booking_by_id(1))
+        with metrics.capture() as captured:
+            client.get_booking(Routes.booking_by_id(2))
+        client.get_booking(Routes.booking_by_id(1))
+        child = captured.snapshot()["GET /booking/{id}"]
+        assert child["count"] == 1 and child["phases"]["validation"]["count"] == 1
+
+        async def _run() -> None:
+            async with AsyncBookerClient(OFFLINE_BASE_URL, transport=fake, metrics=metrics) as async_client:
+                await asyncio.gather(*(async_client.get_booking(Routes.booking_by_id(1)) for _ in range(4)))
+
+        asyncio.run(_run())
+        assert metrics.snapshot()["GET /booking/{id}"]["count"] == 7
@@ -0,0 +1,118 @@
+#tests/test_resilience.py
+import asyncio
+import time
+
+import allure
+import httpx
+import pytest
+
+from src.api.client import BookerClient
+from src.api.resilience import CircuitOpenError, ResiliencePolicy, RetryPolicy, TokenBucket
+from src.api.routes import Routes
+from src.fake.restful_booker import OFFLINE_BASE_URL, FakeRestfulBooker
+
+
+@allure.feature("Resilience")
+class TestResilience:
+    @allure.title("Повтор идемпотентных запросов при ошибках 5xx")
+    def test_retries_transient_errors(self):
+        """
+        Проверяет, что при 50% ошибок 503 все GET запросы завершаются успешно благодаря повторам.
+        """
+        fake = FakeRestfulBooker(dataset_size=20, error_rate=0.5, seed=3)
+        policy = ResiliencePolicy(RetryPolicy(max_attempts=10, backoff_base=0.0), failure_threshold=100, seed=1)
+        client = BookerClient(OFFLINE_BASE_URL, transport=fake, resilience=policy)
+        for booking_id in range(1, 21):
+            client.get_booking(Routes.booking_by_id(booking_id))
+        assert fake.request_count > 20
+
+    @allure.title("Автоматический выключатель отклоняет запросы без обращения к API")
+    def test_circuit_breaker_fails_fast(self):
+        """
+        Проверяет, что после порога отказов запросы отклоняются CircuitOpenError без обращения к API.
+        """
+        fake = FakeRestfulBooker(error_rate=1.0)
+        policy = ResiliencePolicy(RetryPolicy(max_attempts=1), failure_threshold=3, recovery_timeout=60)
+        client = BookerClient(OFFLINE_BASE_URL, transport=fake, resilience=policy)
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                client.get_booking(Routes.booking_by_id(1))
+        with pytest.raises(CircuitOpenError):
+            client.get_booking(Routes.booking_by_id(1))
+        assert fake.request_count == 3
+
+    @allure.title("Ограничитель частоты запросов")
+    def test_token_bucket_caps_rate(self):
+        """
+        Проверяет, что TokenBucket с частотой 100 rps растягивает 30 запросов сверх всплеска на ~0.2 с.
+        """
+        bucket = TokenBucket(rate=100, capacity=10)
+        started = time.perf_counter()
+        for _ in range(30):
+            bucket.acquire()
+        assert time.perf_counter() - started >= 0.18
+
+    @allure.title("Исключение пробного запроса не оставляет выключатель заблокированным")
+    def test_probe_exception_releases_breaker(self):
+        """
+        Проверяет, что если пробный запрос полуоткрытого выключателя выбрасывает не сетевую
+        ошибку (или задача отменяется), отказ не засчитывается, а пробный слот освобождается:
+        следующий запрос сразу становится пробным, а не отклоняется навсегда.
+        """
+        policy = ResiliencePolicy(RetryPolicy(max_attempts=1), failure_threshold=1, recovery_timeout=0.05)
+        breaker = policy.breaker("api")
+        breaker.record_failure()
+        time.sleep(0.06)
+
+        def _broken() -> httpx.Response:
+            raise httpx.DecodingError("битое тело")
+
+        with pytest.raises(httpx.DecodingError):
+            policy.call("GET", "api", _broken)
+        assert breaker.state == "half_open"
+        assert policy.call("GET", "api", lambda: httpx.Response(200)).status_code == 200
+        assert breaker.state == "closed"
+
+        async def _cancelled() -> httpx.Response:
+            raise asyncio.CancelledError()
+
+        breaker.record_failure()
+        time.sleep(0.06)
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(policy.call_async("GET", "api", _cancelled))
+        assert breaker.state == "half_open"
+
+        async def _ok() -> httpx.Response:
+            return httpx.Response(200)
+
+        assert asyncio.run(policy.call_async("GET", "api", _ok)).status_code == 200
+        assert breaker.state == "closed"
+
+    @allure.title("Отмена запросов не размыкает исправный выключатель")
+    def test_cancel_does_not_count_failure(self):
+        """
+        Проверяет, что отмена gather из запросов через замкнутый выключатель не засчитывается
+        как отказ хоста: даже при пороге в один отказ выключатель остаётся замкнутым.
+        """
+        policy = ResiliencePolicy(RetryPolicy(max_attempts=1), failure_threshold=1, recovery_timeout=60)
+        breaker = policy.breaker("api")
+
+        async def _slow() -> httpx.Response:
+            await asyncio.sleep(10)
+            return httpx.Response(200)
+
+        async def _run() -> None:
+            batch = asyncio.gather(*(policy.call_async("GET", "api", _slow) for _ in range(5)))
+            await asyncio.sleep(0.01)
+            batch.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await batch
+
+        def _interrupted() -> httpx.Response:
+            raise KeyboardInterrupt()
+
+        asyncio.run(_run())
+        with pytest.raises(KeyboardInterrupt):
+            policy.call("GET", "api", _interrupted)
+        assert breaker.state == "closed"
+        assert breaker._failures == 0
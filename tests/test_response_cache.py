@@ -0,0 +1,93 @@
+#tests/test_response_cache.py
+import allure
+import httpx
+
+from src.api.cache import ResponseCache
+from src.api.decoding import ValidationLevel
+from src.api.models import Booking
+from src.api.routes import Routes
+from src.fake.restful_booker import FakeRestfulBooker
+
+
+@allure.feature("Response cache")
+class TestResponseCache:
+    @allure.title("Свежая запись возвращается без запроса к API")
+    def test_fresh_hit(self, offline_client):
+        """
+        Проверяет, что повторный get_booking в пределах TTL не обращается к API и возвращает тот же объект.
+        """
+        fake = FakeRestfulBooker(dataset_size=3)
+        cache = ResponseCache(ttl=60)
+        client = offline_client(fake, cache=cache)
+        first = client.get_booking(Routes.booking_by_id(1))
+        assert client.get_booking(Routes.booking_by_id(1)) is first
+        assert fake.request_count == 1
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    @allure.title("Устаревшая запись ревалидируется ответом 304")
+    def test_revalidation(self, offline_client):
+        """
+        Проверяет, что после истечения TTL отправляется If-None-Match и ответ 304 возвращает закэшированный объект.
+        """
+        fake = FakeRestfulBooker(dataset_size=3)
+        cache = ResponseCache(ttl=0)
+        client = offline_client(fake, cache=cache)
+        first = client.get_booking(Routes.booking_by_id(1))
+        assert client.get_booking(Routes.booking_by_id(1)) is first
+        assert fake.request_count == 2
+        assert (cache.stats.revalidations, cache.stats.misses) == (1, 1)
+
+    @allure.title("Вытеснение по LRU")
+    def test_lru_eviction(self, offline_client):
+        """
+        Проверяет, что при max_size=2 вытесняется давно не использованная запись, а недавно прочитанная остаётся.
+        """
+        fake = FakeRestfulBooker(dataset_size=3)
+        cache = ResponseCache(max_size=2, ttl=60)
+        client = offline_client(fake, cache=cache)
+        for booking_id in (1, 2, 1, 3):
+            client.get_booking(Routes.booking_by_id(booking_id))
+        assert cache.stats.evictions == 1 and cache.stats.size == 2
+        requests = fake.request_count
+        client.get_booking(Routes.booking_by_id(1))
+        assert fake.request_count == requests
+        client.get_booking(Routes.booking_by_id(2))
+        assert fake.request_count == requests + 1
+
+    @allure.title("Запись сбрасывается после ответа на изменяющий запрос")
+    def test_invalidation_after_mutation(self, offline_client):
+        """
+        Проверяет, что GET, завершившийся во время PUT, не оставляет в кэше прежнее тело:
+        следующий get_booking возвращает обновлённые данные.
+        """
+        fake = FakeRestfulBooker(dataset_size=3)
+        route = Routes.booking_by_id(1)
+
+        class ConcurrentRead(httpx.BaseTransport):
+            def handle_request(self, request: httpx.Request) -> httpx.Response:
+                if request.method == "PUT":
+                    client.get_booking(route)
+                return fake.handle_request(request)
+
+        client = offline_client(fake, transport=ConcurrentRead(), cache=ResponseCache(ttl=60))
+        original = client.get_booking(route)
+        client.update_booking(original.model_copy(update={"first_name": "Updated"}), route)
+        assert client.get_booking(route).first_name == "Updated"
+        client.delete_booking(route)
+        assert client.cache.stats.size == 0
+
+    @allure.title("Уровни валидации lenient и trusted не смешиваются с кэшем моделей")
+    def test_validation_levels(self, offline_client):
+        """
+        Проверяет, что ответ уровня trusted не попадает в кэш, а следующий вызов уровня strict
+        возвращает Booking, а не словарь.
+        """
+        fake = FakeRestfulBooker(dataset_size=3)
+        cache = ResponseCache(ttl=60)
+        client = offline_client(fake, cache=cache)
+        route = Routes.booking_by_id(1)
+        assert isinstance(client.get_booking(route, ValidationLevel.TRUSTED), dict)
+        assert cache.stats.size == 0
+        assert isinstance(client.get_booking(route), Booking)
+        assert isinstance(client.get_booking(route, ValidationLevel.LENIENT), dict)
+        assert isinstance(client.get_booking(route), Booking) and cache.stats.hits == 1
@@ -0,0 +1,84 @@
+#tests/test_scenario.py
+import asyncio
+import time
+
+import allure
+import pytest
+
+from src.api.auth import TokenProvider
+from src.api.client import AsyncBookerClient
+from src.fake.restful_booker import OFFLINE_BASE_URL, FakeRestfulBooker
+from src.load.scenario import Scenario, ScenarioRunner, Step, crud_scenario
+
+
+async def _noop(client, context):
+    return context.instance
+
+
+async def _fail(client, context):
+    raise RuntimeError("шаг завершился ошибкой")
+
+
+@allure.feature("Scenario engine")
+class TestScenarioEngine:
+    @allure.title("Граф шагов проверяется при создании сценария")
+    def test_invalid_graph(self):
+        """
+        Проверяет, что повтор имени, неизвестная зависимость и цикл отклоняются.
+        """
+        with pytest.raises(ValueError, match="дважды"):
+            Scenario("dup", [Step("a", _noop), Step("a", _noop)])
+        with pytest.raises(ValueError, match="неизвестных"):
+            Scenario("missing", [Step("a", _noop, ("b",))])
+        with pytest.raises(ValueError, match="цикл"):
+            Scenario("cycle", [Step("a", _noop, ("b",)), Step("b", _noop, ("a",))])
+        assert Scenario("ok", [Step("b", _noop, ("a",)), Step("a", _noop)]).order == ["a", "b"]
+
+    @allure.title("Независимые шаги перекрываются, ошибка пропускает зависимые шаги")
+    def test_overlap_and_failure(self):
+        """
+        Проверяет, что два независимых шага одного экземпляра выполняются одновременно, результат
+        передаётся зависимому шагу, а после ошибки зависимый шаг пропускается.
+        """
+        spans = []
+
+        async def slow(client, context):
+            started = time.perf_counter()
+            await asyncio.sleep(0.05)
+            spans.append((started, time.perf_counter()))
+            return context.instance
+
+        async def join(client, context):
+            if context["left"] % 2:
+                raise RuntimeError("нечётный экземпляр")
+            return context["left"] + context["right"]
+
+        scenario = Scenario("diamond", [Step("left", slow), Step("right", slow), Step("join", join, ("left", "right"))])
+        report = asyncio.run(ScenarioRunner(None, scenario, concurrency=1).run(4))
+        assert all(spans[i][0] < spans[i + 1][1] and spans[i + 1][0] < spans[i][1] for i in range(0, 8, 2))
+        assert (report.completed, report.steps["join"].errors) == (2, 2)
+        assert report.steps["left"].histogram.count == 4
+
+        failing = Scenario("failing", [Step("first", _fail), Step("second", _noop, ("first",))])
+        report = asyncio.run(ScenarioRunner(None, failing).run(3))
+        assert report.completed == 0 and report.skipped == {"second": 3}
+
+    @allure.title("CRUD сценарий против FakeRestfulBooker")
+    def test_crud_scenario(self):
+        """
+        Проверяет, что все экземпляры CRUD сценария завершаются успешно, созданные
+        бронирования удалены, а отчёт содержит задержки шагов и сквозную пропускную способность.
+        """
+        async def _run():
+            transport = FakeRestfulBooker(dataset_size=0)
+            async with AsyncBookerClient(OFFLINE_BASE_URL, max_concurrency=16, transport=transport,
+                                         token_provider=TokenProvider(transport.user_name,
+                                                                      transport.password)) as client:
+                report = await ScenarioRunner(client, crud_scenario(), concurrency=8).run(20)
+            return transport, report
+
+        transport, report = asyncio.run(_run())
+        assert report.completed == 20 and not transport.bookings
+        summary = report.to_dict()
+        assert set(summary["steps"]) == {"auth", "create", "get", "update", "delete"}
+        assert summary["workflow"]["count"] == 20 and summary["workflows_per_second"] > 0
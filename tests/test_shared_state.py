@@ -0,0 +1,44 @@
+#tests/test_shared_state.py
+import allure
+
+from src.api.client import BookerClient
+from src.fake.restful_booker import OFFLINE_BASE_URL, FakeRestfulBooker
+from src.testing.shared_state import SharedSessionState, SharedTokenProvider
+
+
+@allure.feature("Shared session state")
+class TestSharedSessionState:
+    @allure.title("Один запрос токена на все процессы прогона")
+    def test_token_is_shared(self, tmp_path):
+        """
+        Проверяет, что второй провайдер с тем же состоянием берёт токен из общего файла без POST /auth.
+        """
+        state = SharedSessionState(tmp_path)
+        fake = FakeRestfulBooker()
+        client = BookerClient(OFFLINE_BASE_URL, transport=fake)
+        first = SharedTokenProvider("admin", "password123", state)
+        second = SharedTokenProvider("admin", "password123", state)
+        token = first.get_token(client)
+        requests = fake.request_count
+        assert second.get_token(client) == token
+        assert fake.request_count == requests
+
+    @allure.title("Однократное вычисление и реестр бронирований")
+    def test_memoize_and_ledger(self, tmp_path):
+        """
+        Проверяет, что memoize вычисляет значение один раз, а реестр возвращает ID без повторов.
+        """
+        state = SharedSessionState(tmp_path)
+        calls = []
+
+        def factory():
+            calls.append(1)
+            state.register_booking(7)
+            return [7, {"firstname": "Jim"}]
+
+        assert state.memoize("booking", factory) == [7, {"firstname": "Jim"}]
+        assert SharedSessionState(tmp_path).memoize("booking", factory) == [7, {"firstname": "Jim"}]
+        state.register_booking(7)
+        state.register_booking(8)
+        assert len(calls) == 1
+        assert state.booking_ids() == [7, 8]
@@ -0,0 +1,124 @@
+#tests/test_token_provider.py
+import asyncio
+import threading
+import time
+
+import allure
+import httpx
+import pytest
+
+from src.api.auth import TokenProvider
+from src.api.client import AsyncBookerClient
+from src.api.routes import Routes
+from src.fake.restful_booker import OFFLINE_BASE_URL, FakeRestfulBooker
+
+
+class _ForbiddenDelete(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    def __init__(self, fake: FakeRestfulBooker):
+        self.fake = fake
+        self.deletes = 0
+
+    def _forbidden(self, request: httpx.Request) -> bool:
+        if request.method != "DELETE":
+            return False
+        self.deletes += 1
+        return True
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self._forbidden(request):
+            return httpx.Response(403, text="Forbidden")
+        return self.fake.handle_request(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._forbidden(request):
+            return httpx.Response(403, text="Forbidden")
+        return await self.fake.handle_async_request(request)
+
+
+@allure.feature("Token provider")
+class TestTokenProvider:
+    @allure.title("Токен переиспользуется до истечения TTL и обновляется после")
+    def test_ttl_expiry(self, offline_client):
+        """
+        Проверяет, что в пределах TTL POST /auth вызывается один раз, а после истечения TTL — снова.
+        """
+        fake = FakeRestfulBooker(dataset_size=0)
+        client = offline_client(fake, ttl=0.2, refresh_margin=0.0)
+        first = client.token_provider.get_token(client)
+        assert client.token_provider.get_token(client) == first and len(fake.tokens) == 1
+        time.sleep(0.25)
+        assert client.token_provider.get_token(client) != first and len(fake.tokens) == 2
+
+    @allure.title("Токен обновляется заранее, в пределах refresh_margin")
+    def test_refresh_margin(self, offline_client):
+        """
+        Проверяет, что токен обновляется, как только до истечения TTL остаётся меньше refresh_margin.
+        """
+        fake = FakeRestfulBooker(dataset_size=0)
+        client = offline_client(fake, ttl=10.0, refresh_margin=9.9)
+        first = client.token_provider.get_token(client)
+        time.sleep(0.15)
+        assert client.token_provider.get_token(client) != first and len(fake.tokens) == 2
+
+    @allure.title("Одновременные потоки и задачи получают токен одним запросом")
+    def test_single_flight(self, offline_client):
+        """
+        Проверяет, что 16 потоков и 16 асинхронных задач при пустом кэше вызывают POST /auth
+        ровно по одному разу и получают один и тот же токен.
+        """
+        fake = FakeRestfulBooker(dataset_size=0, latency=0.02)
+        client = offline_client(fake)
+        barrier, tokens = threading.Barrier(16), []
+
+        def _get() -> None:
+            barrier.wait()
+            tokens.append(client.token_provider.get_token(client))
+
+        threads = [threading.Thread(target=_get) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(set(tokens)) == 1 and len(fake.tokens) == 1
+
+        async def _run() -> set:
+            provider = TokenProvider(fake.user_name, fake.password)
+            async with AsyncBookerClient(OFFLINE_BASE_URL, transport=fake, token_provider=provider) as async_client:
+                return set(await asyncio.gather(*(provider.get_token_async(async_client) for _ in range(16))))
+
+        assert len(asyncio.run(_run())) == 1 and len(fake.tokens) == 2
+
+    @allure.title("После 403 токен сбрасывается и запрос повторяется один раз")
+    def test_forbidden_retried_once(self, offline_client):
+        """
+        Проверяет, что отозванный сервером токен заменяется новым и запрос успешно повторяется.
+        """
+        fake = FakeRestfulBooker(dataset_size=2)
+        client = offline_client(fake)
+        stale = client.token_provider.get_token(client)
+        fake.tokens.clear()
+        assert client.delete_booking(Routes.booking_by_id(1)) == 201
+        assert client.token_provider.get_token(client) != stale and len(fake.tokens) == 1
+
+    @allure.title("Повторный 403 не повторяется")
+    def test_second_forbidden_not_retried(self, offline_client):
+        """
+        Проверяет, что если и новый токен получает 403, клиент выбрасывает ошибку после
+        второй попытки, синхронно и асинхронно.
+        """
+        fake = FakeRestfulBooker(dataset_size=2)
+        transport = _ForbiddenDelete(fake)
+        client = offline_client(fake, transport=transport)
+        with pytest.raises(RuntimeError):
+            client.delete_booking(Routes.booking_by_id(1))
+        assert transport.deletes == 2 and len(fake.tokens) == 2
+
+        async def _run() -> None:
+            provider = TokenProvider(fake.user_name, fake.password)
+            async with AsyncBookerClient(OFFLINE_BASE_URL, transport=transport,
+                                         token_provider=provider) as async_client:
+                await async_client.delete_booking(Routes.booking_by_id(1))
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(_run())
+        assert transport.deletes == 4 and len(fake.tokens) == 4
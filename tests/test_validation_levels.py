@@ -0,0 +1,46 @@
+#tests/test_validation_levels.py
+from datetime import date
+
+import allure
+import httpx
+import pytest
+
+from src.api.decoding import ValidationLevel
+from src.api.routes import Routes
+
+INVALID_BOOKING = {
+    "firstname": "",
+    "lastname": "Dates",
+    "totalprice": -1,
+    "depositpaid": True,
+    "bookingdates": {"checkin": "2025-06-10", "checkout": "2025-06-01"},
+    "additionalneeds": None,
+    "extra": "field",
+}
+
+
+def _invalid_booking_transport() -> httpx.MockTransport:
+    return httpx.MockTransport(lambda request: httpx.Response(200, json=INVALID_BOOKING))
+
+
+@allure.feature("Validation levels")
+class TestValidationLevels:
+    @allure.title("strict отклоняет ответ, нарушающий ограничения модели")
+    def test_strict_rejects_constraints(self, offline_client):
+        """
+        Проверяет, что по умолчанию ответ валидируется полностью.
+        """
+        with pytest.raises(ValueError):
+            offline_client(transport=_invalid_booking_transport()).get_booking(Routes.booking_by_id(1))
+
+    @allure.title("lenient проверяет только типы, trusted возвращает ответ как есть")
+    def test_lenient_and_trusted(self, offline_client):
+        """
+        Проверяет, что lenient приводит даты к date и отбрасывает лишние поля, а trusted
+        (уровень клиента) возвращает разобранный JSON без изменений.
+        """
+        client = offline_client(transport=_invalid_booking_transport(), validation=ValidationLevel.TRUSTED)
+        lenient = client.get_booking(Routes.booking_by_id(1), validation=ValidationLevel.LENIENT)
+        assert lenient["bookingdates"]["checkin"] == date(2025, 6, 10)
+        assert "extra" not in lenient
+        assert client.get_booking(Routes.booking_by_id(1)) == INVALID_BOOKING